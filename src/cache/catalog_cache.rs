@@ -0,0 +1,69 @@
+use std::num::NonZeroUsize;
+use std::sync::Arc;
+use lru::LruCache;
+use once_cell::sync::Lazy;
+use parking_lot::Mutex;
+use super::parse_cache::schema_generation;
+
+/// A synthesized pg_catalog response
+pub struct CachedCatalogResponse {
+    pub columns: Vec<String>,
+    pub rows: Vec<Vec<Option<Vec<u8>>>>,
+}
+
+/// Memoizes pg_catalog emulation results (pg_class, pg_attribute, the
+/// table-existence JOIN SQLAlchemy issues, ...). These are rebuilt from
+/// sqlite_master on every call, but only change when the schema does, so
+/// entries are tagged with the schema generation and dropped once it moves.
+pub struct CatalogResponseCache {
+    cache: Mutex<LruCache<String, (u64, Arc<CachedCatalogResponse>)>>,
+}
+
+impl CatalogResponseCache {
+    pub fn new(capacity: usize) -> Self {
+        let capacity = NonZeroUsize::new(capacity).unwrap_or(NonZeroUsize::new(256).unwrap());
+        Self {
+            cache: Mutex::new(LruCache::new(capacity)),
+        }
+    }
+
+    /// Get the cached response for a catalog query, if the schema hasn't changed since
+    pub fn get(&self, query: &str) -> Option<Arc<CachedCatalogResponse>> {
+        let mut cache = self.cache.lock();
+        let (generation, response) = cache.get(query)?;
+        let fresh = (*generation == schema_generation()).then(|| response.clone());
+        if fresh.is_none() {
+            cache.pop(query);
+        }
+        fresh
+    }
+
+    /// Store a catalog response built at `generation`
+    pub fn put(&self, query: String, generation: u64, response: CachedCatalogResponse) {
+        // The schema moved while the response was being built
+        if generation != schema_generation() {
+            return;
+        }
+        self.cache.lock().put(query, (generation, Arc::new(response)));
+    }
+
+    /// Clear the cache
+    pub fn clear(&self) {
+        self.cache.lock().clear();
+    }
+
+    /// Get cache statistics
+    pub fn stats(&self) -> (usize, usize) {
+        let cache = self.cache.lock();
+        (cache.len(), cache.cap().get())
+    }
+}
+
+/// Global catalog response cache instance
+pub static CATALOG_RESPONSE_CACHE: Lazy<CatalogResponseCache> = Lazy::new(|| {
+    let cache_size = std::env::var("PGSQLITE_CATALOG_CACHE_SIZE")
+        .ok()
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(256);
+    CatalogResponseCache::new(cache_size)
+});
@@ -16,6 +16,8 @@ pub mod translation_cache;
 pub mod query_fingerprint;
 pub mod lazy_schema_loader;
 pub mod wire_protocol_cache;
+pub mod parse_cache;
+pub mod catalog_cache;
 
 pub use schema::SchemaCache;
 pub use query::{QueryCache, CachedQuery, CacheMetrics};
@@ -31,6 +33,8 @@ pub use translation_cache::{TranslationCache, global_translation_cache};
 pub use query_fingerprint::QueryFingerprint;
 pub use lazy_schema_loader::LazySchemaLoader;
 pub use wire_protocol_cache::{WireProtocolCache, CachedWireResponse, WIRE_PROTOCOL_CACHE, is_cacheable_for_wire_protocol, encode_data_row};
+pub use parse_cache::{ParseCache, CachedParse, GLOBAL_PARSE_CACHE, invalidate_parse_caches};
+pub use catalog_cache::{CatalogResponseCache, CachedCatalogResponse, CATALOG_RESPONSE_CACHE};
 
 /// Simple LRU cache with TTL support
 pub struct LruCache<K, V> {
@@ -0,0 +1,222 @@
+use std::collections::hash_map::DefaultHasher;
+use std::hash::{Hash, Hasher};
+use std::num::NonZeroUsize;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::Arc;
+use bytes::Bytes;
+use lru::LruCache;
+use once_cell::sync::{Lazy, OnceCell};
+use parking_lot::Mutex;
+use crate::protocol::FieldDescription;
+use crate::session::PreparedStatement;
+use crate::translator::TranslationMetadata;
+
+/// Bumped on every DDL statement so cached Parse results built against an
+/// older schema are treated as misses
+static SCHEMA_GENERATION: AtomicU64 = AtomicU64::new(0);
+
+/// Process-wide Parse results shared by all sessions; per-session caches
+/// hold Arc handles into the same entries
+pub static GLOBAL_PARSE_CACHE: Lazy<ParseCache> = Lazy::new(|| {
+    let cache_size = std::env::var("PGSQLITE_GLOBAL_PARSE_CACHE_SIZE")
+        .ok()
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(1000);
+    ParseCache::new(cache_size)
+});
+
+/// Invalidate all cached Parse results after a schema change
+pub fn invalidate_parse_caches() {
+    SCHEMA_GENERATION.fetch_add(1, Ordering::Release);
+}
+
+/// Current schema generation, for other caches derived from the schema
+pub fn schema_generation() -> u64 {
+    SCHEMA_GENERATION.load(Ordering::Acquire)
+}
+
+/// Result of a full Parse: the translated query plus everything needed to
+/// rebuild the PreparedStatement without touching the translator again
+#[derive(Clone)]
+pub struct CachedParse {
+    pub query: String,
+    pub translated_query: Option<String>,
+    pub param_types: Vec<i32>,
+    pub field_descriptions: Vec<FieldDescription>,
+    pub translation_metadata: Option<TranslationMetadata>,
+    // RowDescription bytes, shared with every statement built from this entry
+    pub encoded_row_description: Arc<OnceCell<Bytes>>,
+}
+
+impl CachedParse {
+    pub fn from_statement(stmt: &PreparedStatement) -> Self {
+        Self {
+            query: stmt.query.clone(),
+            translated_query: stmt.translated_query.clone(),
+            param_types: stmt.param_types.clone(),
+            field_descriptions: stmt.field_descriptions.clone(),
+            translation_metadata: stmt.translation_metadata.clone(),
+            encoded_row_description: stmt.encoded_row_description.clone(),
+        }
+    }
+
+    pub fn to_prepared_statement(&self) -> PreparedStatement {
+        PreparedStatement {
+            query: self.query.clone(),
+            translated_query: self.translated_query.clone(),
+            param_types: self.param_types.clone(),
+            param_formats: vec![0; self.param_types.len()],
+            field_descriptions: self.field_descriptions.clone(),
+            translation_metadata: self.translation_metadata.clone(),
+            encoded_row_description: self.encoded_row_description.clone(),
+        }
+    }
+}
+
+struct ParseCacheEntry {
+    // Original Parse payload, kept to rule out hash collisions
+    query: String,
+    param_types: Vec<i32>,
+    generation: u64,
+    parsed: Arc<CachedParse>,
+}
+
+/// LRU of Parse results keyed by a hash of the Parse payload
+/// (SQL text + parameter type OIDs, statement name excluded)
+pub struct ParseCache {
+    cache: Mutex<LruCache<u64, ParseCacheEntry>>,
+}
+
+impl ParseCache {
+    pub fn new(capacity: usize) -> Self {
+        let capacity = NonZeroUsize::new(capacity).unwrap_or(NonZeroUsize::new(256).unwrap());
+        Self {
+            cache: Mutex::new(LruCache::new(capacity)),
+        }
+    }
+
+    fn key(query: &str, param_types: &[i32]) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        query.hash(&mut hasher);
+        param_types.hash(&mut hasher);
+        hasher.finish()
+    }
+
+    /// Look up a previous Parse of the same query and parameter types
+    pub fn get(&self, query: &str, param_types: &[i32]) -> Option<Arc<CachedParse>> {
+        let key = Self::key(query, param_types);
+        let mut cache = self.cache.lock();
+        let entry = cache.get(&key)?;
+        let stale = entry.generation != schema_generation();
+        let hit = !stale && entry.query == query && entry.param_types == param_types;
+        let parsed = hit.then(|| entry.parsed.clone());
+        if stale {
+            cache.pop(&key);
+        }
+        parsed
+    }
+
+    /// Store the result of a Parse
+    pub fn put(&self, query: &str, param_types: &[i32], parsed: CachedParse) {
+        self.put_shared(query, param_types, Arc::new(parsed));
+    }
+
+    /// Store a Parse result that is already shared with another cache
+    pub fn put_shared(&self, query: &str, param_types: &[i32], parsed: Arc<CachedParse>) {
+        let key = Self::key(query, param_types);
+        self.cache.lock().put(key, ParseCacheEntry {
+            query: query.to_string(),
+            param_types: param_types.to_vec(),
+            generation: schema_generation(),
+            parsed,
+        });
+    }
+
+    /// Drop a single entry, e.g. after executing it failed
+    pub fn invalidate(&self, query: &str, param_types: &[i32]) {
+        self.cache.lock().pop(&Self::key(query, param_types));
+    }
+
+    /// Clear the cache
+    pub fn clear(&self) {
+        self.cache.lock().clear();
+    }
+
+    /// Get cache statistics
+    pub fn stats(&self) -> (usize, usize) {
+        let cache = self.cache.lock();
+        (cache.len(), cache.cap().get())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn parsed(query: &str) -> CachedParse {
+        CachedParse {
+            query: query.to_string(),
+            translated_query: None,
+            param_types: vec![23],
+            field_descriptions: Vec::new(),
+            translation_metadata: None,
+            encoded_row_description: Default::default(),
+        }
+    }
+
+    #[test]
+    fn test_hit_requires_same_param_types() {
+        let cache = ParseCache::new(4);
+        cache.put("SELECT $1", &[23], parsed("SELECT $1"));
+
+        assert!(cache.get("SELECT $1", &[23]).is_some());
+        assert!(cache.get("SELECT $1", &[25]).is_none());
+        assert!(cache.get("SELECT $2", &[23]).is_none());
+    }
+
+    #[test]
+    fn test_invalidate_entry() {
+        let cache = ParseCache::new(4);
+        cache.put("SELECT $1", &[23], parsed("SELECT $1"));
+        cache.invalidate("SELECT $1", &[23]);
+
+        assert!(cache.get("SELECT $1", &[23]).is_none());
+    }
+
+    #[test]
+    fn test_shared_entry_is_not_copied() {
+        let global = ParseCache::new(4);
+        let local = ParseCache::new(4);
+        let shared = Arc::new(parsed("SELECT $1"));
+        global.put_shared("SELECT $1", &[23], shared.clone());
+        local.put_shared("SELECT $1", &[23], shared.clone());
+
+        let a = global.get("SELECT $1", &[23]).expect("global cache hit");
+        let b = local.get("SELECT $1", &[23]).expect("local cache hit");
+        assert!(Arc::ptr_eq(&a, &b));
+    }
+
+    #[test]
+    fn test_row_description_encoded_once_per_entry() {
+        let cached = parsed("SELECT $1");
+        let first = cached.to_prepared_statement();
+        first.encoded_row_description.get_or_init(|| Bytes::from_static(b"T"));
+
+        let second = cached.to_prepared_statement();
+        assert!(Arc::ptr_eq(&first.encoded_row_description, &second.encoded_row_description));
+        assert!(second.encoded_row_description.get().is_some());
+    }
+
+    #[test]
+    fn test_stale_generation_is_a_miss() {
+        let cache = ParseCache::new(4);
+        cache.put("SELECT * FROM t", &[], parsed("SELECT * FROM t"));
+        let key = ParseCache::key("SELECT * FROM t", &[]);
+        if let Some(entry) = cache.cache.lock().peek_mut(&key) {
+            entry.generation = entry.generation.wrapping_sub(1);
+        }
+
+        assert!(cache.get("SELECT * FROM t", &[]).is_none());
+        assert_eq!(cache.stats().0, 0);
+    }
+}
@@ -10,7 +10,7 @@ pub struct CachedWireResponse {
     /// Row description message (field metadata)
     pub row_description: Vec<FieldDescription>,
     /// Pre-encoded data rows in wire format
-    pub encoded_rows: Vec<Vec<u8>>,
+    pub encoded_rows: Vec<bytes::Bytes>,
     /// Number of rows
     pub row_count: usize,
 }
@@ -69,7 +69,7 @@ pub fn is_cacheable_for_wire_protocol(_query: &str) -> bool {
 }
 
 /// Encode a data row for wire protocol
-pub fn encode_data_row(row: &[Option<Vec<u8>>]) -> Vec<u8> {
+pub fn encode_data_row(row: &[Option<Vec<u8>>]) -> bytes::Bytes {
     use bytes::{BytesMut, BufMut};
     
     let mut buf = BytesMut::new();
@@ -101,7 +101,7 @@ pub fn encode_data_row(row: &[Option<Vec<u8>>]) -> Vec<u8> {
     let msg_len = (buf.len() - len_pos - 4) as i32 + 4;
     buf[len_pos..len_pos + 4].copy_from_slice(&msg_len.to_be_bytes());
     
-    buf.to_vec()
+    buf.freeze()
 }
 
 #[cfg(test)]
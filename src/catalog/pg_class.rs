@@ -64,7 +64,10 @@ impl PgClassHandler {
             .map(|(i, name)| (name.clone(), i))
             .collect();
         
-        let mut rows = Vec::new();
+        // SELECT * keeps the full row as-is, so it can be moved rather than copied
+        let is_full_projection = column_indices.iter().copied().eq(0..all_columns.len());
+        
+        let mut rows = Vec::with_capacity(tables_response.rows.len());
         
         // Process each table
         for table_row in &tables_response.rows {
@@ -134,23 +137,23 @@ impl PgClassHandler {
                     let full_row = vec![
                         Some(oid.to_string().into_bytes()),                    // oid
                         Some(table_name.to_string().into_bytes()),            // relname
-                        Some("2200".to_string().into_bytes()),                 // relnamespace (public schema)
+                        Some(b"2200".to_vec()),                             // relnamespace (public schema)
                         Some((oid + 1).to_string().into_bytes()),             // reltype
-                        Some("0".to_string().into_bytes()),                    // reloftype
-                        Some("10".to_string().into_bytes()),                   // relowner (postgres user)
-                        Some("0".to_string().into_bytes()),                    // relam (0 for tables)
+                        Some(b"0".to_vec()),                                // reloftype
+                        Some(b"10".to_vec()),                               // relowner (postgres user)
+                        Some(b"0".to_vec()),                                // relam (0 for tables)
                         Some(oid.to_string().into_bytes()),                    // relfilenode
-                        Some("0".to_string().into_bytes()),                    // reltablespace
-                        Some("0".to_string().into_bytes()),                    // relpages
-                        Some("-1".to_string().into_bytes()),                   // reltuples
-                        Some("0".to_string().into_bytes()),                    // relallvisible
-                        Some("0".to_string().into_bytes()),                    // reltoastrelid
+                        Some(b"0".to_vec()),                                // reltablespace
+                        Some(b"0".to_vec()),                                // relpages
+                        Some(b"-1".to_vec()),                               // reltuples
+                        Some(b"0".to_vec()),                                // relallvisible
+                        Some(b"0".to_vec()),                                // reltoastrelid
                         Some(if relhasindex { b"t".to_vec() } else { b"f".to_vec() }), // relhasindex
                         Some(b"f".to_vec()),                                // relisshared
                         Some(b"p".to_vec()),                                // relpersistence (permanent)
                         Some(b"r".to_vec()),                                // relkind (regular table)
                         Some(relnatts.to_string().into_bytes()),              // relnatts
-                        Some("0".to_string().into_bytes()),                    // relchecks
+                        Some(b"0".to_vec()),                                // relchecks
                         Some(b"f".to_vec()),                                // relhasrules
                         Some(b"f".to_vec()),                                // relhastriggers
                         Some(b"f".to_vec()),                                // relhassubclass
@@ -159,20 +162,15 @@ impl PgClassHandler {
                         Some(b"t".to_vec()),                                // relispopulated
                         Some(b"d".to_vec()),                                // relreplident (default)
                         Some(b"f".to_vec()),                                // relispartition
-                        Some("0".to_string().into_bytes()),                    // relrewrite
-                        Some("0".to_string().into_bytes()),                    // relfrozenxid
-                        Some("0".to_string().into_bytes()),                    // relminmxid
+                        Some(b"0".to_vec()),                                // relrewrite
+                        Some(b"0".to_vec()),                                // relfrozenxid
+                        Some(b"0".to_vec()),                                // relminmxid
                         None,                                                   // relacl (NULL)
                         None,                                                   // reloptions (NULL)
                         None,                                                   // relpartbound (NULL)
                     ];
                     
-                    // Project only the requested columns
-                    let projected_row: Vec<Option<Vec<u8>>> = column_indices.iter()
-                        .map(|&idx| full_row[idx].clone())
-                        .collect();
-                    
-                    rows.push(projected_row);
+                    rows.push(Self::project_row(full_row, &column_indices, is_full_projection));
                 }
             }
         }
@@ -239,23 +237,23 @@ impl PgClassHandler {
                     let full_row = vec![
                         Some(index_oid.to_string().into_bytes()),              // oid
                         Some(index_name.to_string().into_bytes()),            // relname
-                        Some("2200".to_string().into_bytes()),                 // relnamespace (public schema)
-                        Some("0".to_string().into_bytes()),                    // reltype (0 for indexes)
-                        Some("0".to_string().into_bytes()),                    // reloftype
-                        Some("10".to_string().into_bytes()),                   // relowner (postgres user)
-                        Some("403".to_string().into_bytes()),                  // relam (btree)
+                        Some(b"2200".to_vec()),                             // relnamespace (public schema)
+                        Some(b"0".to_vec()),                                // reltype (0 for indexes)
+                        Some(b"0".to_vec()),                                // reloftype
+                        Some(b"10".to_vec()),                               // relowner (postgres user)
+                        Some(b"403".to_vec()),                              // relam (btree)
                         Some(index_oid.to_string().into_bytes()),              // relfilenode
-                        Some("0".to_string().into_bytes()),                    // reltablespace
-                        Some("0".to_string().into_bytes()),                    // relpages
-                        Some("0".to_string().into_bytes()),                    // reltuples
-                        Some("0".to_string().into_bytes()),                    // relallvisible
-                        Some("0".to_string().into_bytes()),                    // reltoastrelid
+                        Some(b"0".to_vec()),                                // reltablespace
+                        Some(b"0".to_vec()),                                // relpages
+                        Some(b"0".to_vec()),                                // reltuples
+                        Some(b"0".to_vec()),                                // relallvisible
+                        Some(b"0".to_vec()),                                // reltoastrelid
                         Some(b"f".to_vec()),                                // relhasindex
                         Some(b"f".to_vec()),                                // relisshared
                         Some(b"p".to_vec()),                                // relpersistence (permanent)
                         Some(b"i".to_vec()),                                // relkind (index)
-                        Some("0".to_string().into_bytes()),                    // relnatts
-                        Some("0".to_string().into_bytes()),                    // relchecks
+                        Some(b"0".to_vec()),                                // relnatts
+                        Some(b"0".to_vec()),                                // relchecks
                         Some(b"f".to_vec()),                                // relhasrules
                         Some(b"f".to_vec()),                                // relhastriggers
                         Some(b"f".to_vec()),                                // relhassubclass
@@ -264,20 +262,15 @@ impl PgClassHandler {
                         Some(b"t".to_vec()),                                // relispopulated
                         Some(b"n".to_vec()),                                // relreplident (nothing)
                         Some(b"f".to_vec()),                                // relispartition
-                        Some("0".to_string().into_bytes()),                    // relrewrite
-                        Some("0".to_string().into_bytes()),                    // relfrozenxid
-                        Some("0".to_string().into_bytes()),                    // relminmxid
+                        Some(b"0".to_vec()),                                // relrewrite
+                        Some(b"0".to_vec()),                                // relfrozenxid
+                        Some(b"0".to_vec()),                                // relminmxid
                         None,                                                   // relacl (NULL)
                         None,                                                   // reloptions (NULL)
                         None,                                                   // relpartbound (NULL)
                     ];
                     
-                    // Project only the requested columns
-                    let projected_row: Vec<Option<Vec<u8>>> = column_indices.iter()
-                        .map(|&idx| full_row[idx].clone())
-                        .collect();
-                    
-                    rows.push(projected_row);
+                    rows.push(Self::project_row(full_row, &column_indices, is_full_projection));
                 }
             }
         }
@@ -291,6 +284,20 @@ impl PgClassHandler {
         })
     }
     
+    /// Project a full 33-column row down to the requested columns
+    fn project_row(
+        full_row: Vec<Option<Vec<u8>>>,
+        column_indices: &[usize],
+        is_full_projection: bool,
+    ) -> Vec<Option<Vec<u8>>> {
+        if is_full_projection {
+            return full_row;
+        }
+        let mut projected_row = Vec::with_capacity(column_indices.len());
+        projected_row.extend(column_indices.iter().map(|&idx| full_row[idx].clone()));
+        projected_row
+    }
+    
     /// Determine which columns to return based on the SELECT projection
     fn get_projected_columns(select: &Select, all_columns: &[String]) -> (Vec<String>, Vec<usize>) {
         let mut columns = Vec::new();
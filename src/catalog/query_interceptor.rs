@@ -6,11 +6,23 @@ use sqlparser::ast::{Statement, TableFactor, Select, SetExpr, SelectItem, Expr,
 use sqlparser::dialect::PostgreSqlDialect;
 use sqlparser::parser::Parser;
 use sqlparser::tokenizer::{Location, Span};
-use tracing::{debug, info};
+use tracing::debug;
 use super::{pg_class::PgClassHandler, pg_attribute::PgAttributeHandler, pg_enum::PgEnumHandler, system_functions::SystemFunctions};
 use std::sync::Arc;
+use std::sync::atomic::Ordering;
+use crate::cache::{CATALOG_RESPONSE_CACHE, CachedCatalogResponse};
+use crate::cache::parse_cache::schema_generation;
 use std::pin::Pin;
 use std::future::Future;
+use once_cell::sync::Lazy;
+use regex::Regex;
+
+/// Every catalog table, system function and status query the interceptor handles
+/// contains one of these markers. A single case-insensitive literal scan lets
+/// ordinary user queries skip the lowercase copy and the per-table checks below.
+static CATALOG_MARKERS: Lazy<Regex> = Lazy::new(|| {
+    Regex::new(r"(?i)pg_|information_schema|to_regtype|format_type|pgsqlite_cache_status").unwrap()
+});
 
 /// Intercepts and handles queries to pg_catalog tables
 pub struct CatalogInterceptor;
@@ -18,6 +30,11 @@ pub struct CatalogInterceptor;
 impl CatalogInterceptor {
     /// Check if a query is targeting pg_catalog and handle it
     pub async fn intercept_query(query: &str, db: Arc<DbHandler>, session: Option<Arc<SessionState>>) -> Option<Result<DbResponse, PgSqliteError>> {
+        // Fast reject for queries that can't touch the catalog
+        if !CATALOG_MARKERS.is_match(query) {
+            return None;
+        }
+        
         // Quick check to avoid parsing if not a catalog query
         let lower_query = query.to_lowercase();
         
@@ -62,6 +79,19 @@ impl CatalogInterceptor {
             return None;
         }
         
+        // Catalog responses only depend on the schema. Skip the cache for private in-memory
+        // databases and for sessions that have uncommitted DDL of their own.
+        let cacheable = !db.is_memory_database() && session.as_ref()
+            .is_some_and(|s| !s.schema_changed_in_transaction.load(Ordering::Acquire));
+        let generation = schema_generation();
+        if cacheable && let Some(cached) = CATALOG_RESPONSE_CACHE.get(query) {
+            return Some(Ok(DbResponse {
+                columns: cached.columns.clone(),
+                rows: cached.rows.clone(),
+                rows_affected: cached.rows.len(),
+            }));
+        }
+        
         // First, remove schema prefixes from catalog tables
         let schema_translated = SchemaPrefixTranslator::translate_query(query);
         
@@ -150,6 +180,12 @@ impl CatalogInterceptor {
                         
                         // Normal catalog table handling
                         if let Some(response) = Self::handle_catalog_query(query_stmt, db.clone(), session.clone()).await {
+                            if cacheable {
+                                CATALOG_RESPONSE_CACHE.put(query.to_string(), generation, CachedCatalogResponse {
+                                    columns: response.columns.clone(),
+                                    rows: response.rows.clone(),
+                                });
+                            }
                             return Some(Ok(response));
                         }
                     }
@@ -299,7 +335,7 @@ impl CatalogInterceptor {
             
             // Handle pg_attribute queries
             if table_name.contains("pg_attribute") || table_name.contains("pg_catalog.pg_attribute") {
-                info!("Routing to PgAttributeHandler for table: {}", table_name);
+                debug!("Routing to PgAttributeHandler for table: {}", table_name);
                 return match PgAttributeHandler::handle_query(select, &db).await {
                     Ok(response) => {
                         debug!("PgAttributeHandler returned {} rows", response.rows.len());
@@ -442,7 +478,7 @@ impl CatalogInterceptor {
         if filter_oid == Some(-1) {
             debug!("NULL OID filter detected - returning empty result set");
             let rows_affected = 0;
-            info!("pg_type query with NULL filter: returning 0 rows");
+            debug!("pg_type query with NULL filter: returning 0 rows");
             return DbResponse {
                 columns,
                 rows,
@@ -607,8 +643,8 @@ impl CatalogInterceptor {
         }
 
         let rows_affected = rows.len();
-        info!("pg_type query: filter_oid={:?}, filter_typtype={:?}, has_placeholder={}", filter_oid, filter_typtype, has_placeholder);
-        info!("Returning {} rows for pg_type query with {} columns: {:?}", rows_affected, columns.len(), columns);
+        debug!("pg_type query: filter_oid={:?}, filter_typtype={:?}, has_placeholder={}", filter_oid, filter_typtype, has_placeholder);
+        debug!("Returning {} rows for pg_type query with {} columns: {:?}", rows_affected, columns.len(), columns);
         DbResponse {
             columns,
             rows,
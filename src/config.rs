@@ -57,6 +57,9 @@ pub struct Config {
     #[arg(long, default_value = "30", env = "PGSQLITE_PARAM_CACHE_TTL_MINUTES", help = "TTL for parameter cache entries in minutes")]
     pub param_cache_ttl: u64,
 
+    #[arg(long, default_value = "256", env = "PGSQLITE_PARSE_CACHE_SIZE", help = "Maximum number of translated Parse results to cache per session")]
+    pub parse_cache_size: usize,
+
     #[arg(long, default_value = "1000", env = "PGSQLITE_QUERY_CACHE_SIZE", help = "Maximum number of query plan entries to cache")]
     pub query_cache_size: usize,
 
@@ -206,6 +209,21 @@ impl Config {
         std::time::Duration::from_secs(self.schema_cache_ttl)
     }
 
+    /// PRAGMA batch applied to every SQLite connection when it is opened
+    pub fn connection_pragmas(&self) -> String {
+        format!(
+            "PRAGMA journal_mode = {};
+             PRAGMA synchronous = {};
+             PRAGMA cache_size = {};
+             PRAGMA temp_store = MEMORY;
+             PRAGMA mmap_size = {};",
+            self.pragma_journal_mode,
+            self.pragma_synchronous,
+            self.pragma_cache_size,
+            self.pragma_mmap_size
+        )
+    }
+
     /// Get the temp directory, defaulting to system temp if not specified
     pub fn get_temp_dir(&self) -> String {
         self.temp_dir.clone().unwrap_or_else(|| {
@@ -24,6 +24,11 @@ use pgsqlite::session::{DbHandler, SessionState};
 use pgsqlite::ssl::CertificateManager;
 use pgsqlite::migration::MigrationRunner;
 
+// Per-thread heaps make the many short-lived row/statement allocations cheaper
+#[cfg(feature = "mimalloc")]
+#[global_allocator]
+static GLOBAL: mimalloc::MiMalloc = mimalloc::MiMalloc;
+
 #[tokio::main]
 async fn main() -> Result<()> {
     let config = Config::load();
@@ -313,6 +318,9 @@ where
 {
     let codec = PostgresCodec::new();
     let mut framed = Framed::new(stream, codec);
+    // Queued messages are only written once this much is buffered (default 8 KiB),
+    // so a result set goes out in a few large writes instead of many small ones
+    framed.set_backpressure_boundary(64 * 1024);
 
     // Wait for startup message
     let startup = match framed.next().await {
@@ -431,7 +439,7 @@ where
                 query,
                 param_types,
             } => {
-                info!("Received Parse from {}: query={}, name={}", connection_info, query, name);
+                debug!("Received Parse from {}: query={}, name={}", connection_info, query, name);
                 match ExtendedQueryHandler::handle_parse(
                     &mut framed,
                     &db_handler,
@@ -495,7 +503,7 @@ where
                 }
             }
             FrontendMessage::Execute { portal, max_rows } => {
-                info!("Received Execute from {}: portal={}, max_rows={}", connection_info, portal, max_rows);
+                debug!("Received Execute from {}: portal={}, max_rows={}", connection_info, portal, max_rows);
                 match ExtendedQueryHandler::handle_execute(
                     &mut framed,
                     &db_handler,
@@ -583,6 +591,7 @@ where
                         error!("Failed to rollback transaction on disconnect: {}", e);
                     }
                     session.set_transaction_status(TransactionStatus::Idle).await;
+                    session.end_schema_transaction();
                 }
                 
                 break;
@@ -57,8 +57,10 @@ impl Encoder<BackendMessage> for PostgresCodec {
             BackendMessage::ParameterStatus { name, value } => encode_parameter_status(&name, &value, dst),
             BackendMessage::BackendKeyData { process_id, secret_key } => encode_backend_key_data(process_id, secret_key, dst),
             BackendMessage::ReadyForQuery { status } => encode_ready_for_query(status, dst),
-            BackendMessage::RowDescription(fields) => encode_row_description(fields, dst),
+            BackendMessage::RowDescription(fields) => encode_row_description(&fields, dst),
+            BackendMessage::EncodedRowDescription(encoded) => dst.extend_from_slice(&encoded),
             BackendMessage::DataRow(values) => encode_data_row(&values, dst),
+            BackendMessage::EncodedDataRow(encoded) => dst.extend_from_slice(&encoded),
             BackendMessage::CommandComplete { tag } => encode_command_complete(&tag, dst),
             BackendMessage::EmptyQueryResponse => encode_empty_query_response(dst),
             BackendMessage::ErrorResponse(err) => encode_error_response(*err, dst),
@@ -134,7 +136,7 @@ fn decode_normal_message(src: &mut BytesMut) -> io::Result<Option<FrontendMessag
             let name = read_cstring(&mut msg_buf)?;
             let query = read_cstring(&mut msg_buf)?;
             let param_count = msg_buf.get_i16();
-            let mut param_types = Vec::new();
+            let mut param_types = Vec::with_capacity(param_count.max(0) as usize);
             for _ in 0..param_count {
                 param_types.push(msg_buf.get_i32());
             }
@@ -145,26 +147,27 @@ fn decode_normal_message(src: &mut BytesMut) -> io::Result<Option<FrontendMessag
             let statement = read_cstring(&mut msg_buf)?;
             
             let format_count = msg_buf.get_i16();
-            let mut formats = Vec::new();
+            let mut formats = Vec::with_capacity(format_count.max(0) as usize);
             for _ in 0..format_count {
                 formats.push(msg_buf.get_i16());
             }
             
             let value_count = msg_buf.get_i16();
-            let mut values = Vec::new();
+            let mut values = Vec::with_capacity(value_count.max(0) as usize);
             for _ in 0..value_count {
                 let len = msg_buf.get_i32();
                 if len == -1 {
                     values.push(None);
                 } else {
-                    let mut value = vec![0u8; len as usize];
-                    msg_buf.copy_to_slice(&mut value);
+                    // Copy the parameter straight out of the frame, without zero-filling first
+                    let value = msg_buf[..len as usize].to_vec();
+                    msg_buf.advance(len as usize);
                     values.push(Some(value));
                 }
             }
             
             let result_format_count = msg_buf.get_i16();
-            let mut result_formats = Vec::new();
+            let mut result_formats = Vec::with_capacity(result_format_count.max(0) as usize);
             for _ in 0..result_format_count {
                 result_formats.push(msg_buf.get_i16());
             }
@@ -243,7 +246,14 @@ fn encode_ready_for_query(status: TransactionStatus, dst: &mut BytesMut) {
     dst.put_u8(status.as_byte());
 }
 
-fn encode_row_description(fields: Vec<FieldDescription>, dst: &mut BytesMut) {
+/// Serialize a RowDescription once so it can be replayed for every Describe of a statement
+pub fn encode_row_description_message(fields: &[FieldDescription]) -> bytes::Bytes {
+    let mut buf = BytesMut::new();
+    encode_row_description(fields, &mut buf);
+    buf.freeze()
+}
+
+fn encode_row_description(fields: &[FieldDescription], dst: &mut BytesMut) {
     dst.put_u8(b'T');
     let len_pos = dst.len();
     dst.put_i32(0); // Placeholder
@@ -264,6 +274,12 @@ fn encode_row_description(fields: Vec<FieldDescription>, dst: &mut BytesMut) {
 }
 
 fn encode_data_row(values: &[Option<Vec<u8>>], dst: &mut BytesMut) {
+    // Reserve the whole message up front so wide rows don't regrow the buffer per column
+    let body_len: usize = values.iter()
+        .map(|v| 4 + v.as_ref().map_or(0, |data| data.len()))
+        .sum();
+    dst.reserve(1 + 4 + 2 + body_len);
+    
     dst.put_u8(b'D');
     let len_pos = dst.len();
     dst.put_i32(0); // Placeholder
@@ -404,11 +420,13 @@ fn encode_parameter_description(oids: Vec<i32>, dst: &mut BytesMut) {
 
 // Helper functions
 fn read_cstring(buf: &mut &[u8]) -> io::Result<String> {
-    let null_pos = buf.iter().position(|&b| b == 0)
+    let null_pos = memchr::memchr(0, buf)
         .ok_or_else(|| io::Error::new(io::ErrorKind::UnexpectedEof, "Missing null terminator"))?;
     
-    let string = String::from_utf8(buf[..null_pos].to_vec())
-        .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
+    // Validate in place so the only copy is the final owned String
+    let string = std::str::from_utf8(&buf[..null_pos])
+        .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?
+        .to_owned();
     
     *buf = &buf[null_pos + 1..];
     Ok(string)
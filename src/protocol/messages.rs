@@ -47,7 +47,11 @@ pub enum BackendMessage {
     BackendKeyData { process_id: i32, secret_key: i32 },
     ReadyForQuery { status: TransactionStatus },
     RowDescription(Vec<FieldDescription>),
+    /// A RowDescription already serialized by `codec::encode_row_description_message`
+    EncodedRowDescription(bytes::Bytes),
     DataRow(Vec<Option<Vec<u8>>>),
+    /// A DataRow already serialized by `cache::encode_data_row`
+    EncodedDataRow(bytes::Bytes),
     CommandComplete { tag: String },
     EmptyQueryResponse,
     ErrorResponse(Box<ErrorResponse>),
@@ -7,6 +7,12 @@
 /// Removes both single-line (--) and multi-line (/* */) comments
 /// while preserving string literals and their contents.
 pub fn strip_sql_comments(query: &str) -> String {
+    // Most queries carry no comments; skip the char-by-char rebuild for them
+    let bytes = query.as_bytes();
+    if memchr::memmem::find(bytes, b"--").is_none() && memchr::memmem::find(bytes, b"/*").is_none() {
+        return query.to_string();
+    }
+    
     let mut result = String::with_capacity(query.len());
     let mut chars = query.chars().peekable();
     let mut in_string = false;
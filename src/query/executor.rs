@@ -8,8 +8,7 @@ use crate::PgSqliteError;
 use crate::query::join_type_inference::build_column_to_table_mapping;
 use tokio_util::codec::Framed;
 use futures::SinkExt;
-use tokio::io::AsyncWriteExt;
-use tracing::{info, debug};
+use tracing::debug;
 use std::sync::Arc;
 use rusqlite::params;
 use serde_json;
@@ -31,6 +30,21 @@ struct TableSchemaInfo {
 static TABLE_SCHEMA_CACHE: Lazy<RwLock<HashMap<String, TableSchemaInfo>>> = 
     Lazy::new(|| RwLock::new(HashMap::new()));
 
+/// Constant answers to the probe queries drivers send right after connecting
+/// (e.g. SQLAlchemy's dialect initialization) or on every pool checkout
+/// (pool_pre_ping's `SELECT 1`), keyed by the upper-cased query
+static CANNED_RESPONSES: Lazy<HashMap<&'static str, (&'static str, PgType, String)>> = Lazy::new(|| {
+    let version = format!("PostgreSQL 15.0 (pgsqlite {}) on x86_64-pc-linux-gnu, compiled by rustc, 64-bit",
+        env!("CARGO_PKG_VERSION"));
+    HashMap::from([
+        ("SELECT 1", ("?column?", PgType::Int4, "1".to_string())),
+        ("SELECT PG_CATALOG.VERSION()", ("version", PgType::Text, version.clone())),
+        ("SELECT VERSION()", ("version", PgType::Text, version)),
+        ("SELECT CURRENT_SCHEMA()", ("current_schema", PgType::Text, "public".to_string())),
+        ("SELECT CURRENT_DATABASE()", ("current_database", PgType::Text, "main".to_string())),
+    ])
+});
+
 /// Get all schema information for a table in one query
 async fn get_table_schema_info(table_name: &str, db: &Arc<DbHandler>, session_id: &Uuid) -> TableSchemaInfo {
     // Check cache first
@@ -180,6 +194,28 @@ impl QueryExecutor {
             return Ok(());
         }
         
+        // Answer constant probe queries without touching SQLite. An aborted transaction
+        // must still reject them, so leave those to the normal path below.
+        if session.get_transaction_status().await != crate::protocol::TransactionStatus::InFailedTransaction
+            && let Some((column, pg_type, value)) = CANNED_RESPONSES.get(query_upper.trim_end_matches(';').trim_end()) {
+            let field = FieldDescription {
+                name: column.to_string(),
+                table_oid: 0,
+                column_id: 1,
+                type_oid: pg_type.to_oid(),
+                type_size: -1,
+                type_modifier: -1,
+                format: 0,
+            };
+            framed.feed(BackendMessage::RowDescription(vec![field])).await
+                .map_err(PgSqliteError::Io)?;
+            framed.feed(BackendMessage::DataRow(vec![Some(value.as_bytes().to_vec())])).await
+                .map_err(PgSqliteError::Io)?;
+            framed.feed(BackendMessage::CommandComplete { tag: "SELECT 1".to_string() }).await
+                .map_err(PgSqliteError::Io)?;
+            return Ok(());
+        }
+        
         // debug!("Executing query: {}", query_to_execute);
         
         // Check for Python-style parameters and provide helpful error
@@ -352,7 +388,7 @@ impl QueryExecutor {
                         })
                         .collect();
                     
-                    framed.send(BackendMessage::RowDescription(fields)).await
+                    framed.feed(BackendMessage::RowDescription(fields)).await
                         .map_err(PgSqliteError::Io)?;
                     
                     // Pre-fetch enum mappings if needed
@@ -395,7 +431,7 @@ impl QueryExecutor {
                         // Fast path - if no special columns, send row as-is
                         // DISABLED: We need to check all columns for potential timestamp values
                         // if boolean_columns.is_empty() && datetime_columns.is_empty() && enum_columns.is_empty() {
-                        //     framed.send(BackendMessage::DataRow(row)).await
+                        //     framed.feed(BackendMessage::DataRow(row)).await
                         //         .map_err(PgSqliteError::Io)?;
                         //     continue;
                         // }
@@ -514,7 +550,7 @@ impl QueryExecutor {
                                             if let Ok(s) = std::str::from_utf8(&data) {
                                                 // Debug logging for scalar subquery columns
                                                 if col_name.contains("max_created") || col_name.contains("MAX(") {
-                                                    info!("Checking column '{}' with value '{}'", col_name, s);
+                                                    debug!("Checking column '{}' with value '{}'", col_name, s);
                                                 }
                                                 if let Ok(micros) = s.parse::<i64>() {
                                                     // Check if this looks like microseconds since epoch
@@ -526,7 +562,7 @@ impl QueryExecutor {
                                                         let mut buf = vec![0u8; 32];
                                                         let len = format_microseconds_to_timestamp_buf(micros, &mut buf);
                                                         buf.truncate(len);
-                                                        info!("Converting TEXT column '{}' timestamp value {} to formatted", col_name, micros);
+                                                        debug!("Converting TEXT column '{}' timestamp value {} to formatted", col_name, micros);
                                                         Some(buf)
                                                     } else {
                                                         Some(data) // Not a timestamp range
@@ -547,13 +583,13 @@ impl QueryExecutor {
                             })
                             .collect();
                         
-                        framed.send(BackendMessage::DataRow(converted_row)).await
+                        framed.feed(BackendMessage::DataRow(converted_row)).await
                             .map_err(PgSqliteError::Io)?;
                     }
                     
                     // Send command complete
                     let tag = create_command_tag("SELECT", response.rows_affected);
-                    framed.send(BackendMessage::CommandComplete { tag }).await
+                    framed.feed(BackendMessage::CommandComplete { tag }).await
                         .map_err(PgSqliteError::Io)?;
                     
                     return Ok(());
@@ -888,19 +924,19 @@ impl QueryExecutor {
                 debug!("Wire protocol cache hit for query: {}", query);
                 
                 // Send cached row description
-                framed.send(BackendMessage::RowDescription(cached_response.row_description.clone())).await
+                framed.feed(BackendMessage::RowDescription(cached_response.row_description.clone())).await
                     .map_err(PgSqliteError::Io)?;
                 
-                // Send cached data rows (already encoded)
+                // Send cached data rows (already encoded). They go through the codec so
+                // they stay behind the RowDescription still sitting in its write buffer.
                 for encoded_row in &cached_response.encoded_rows {
-                    // Send pre-encoded data directly
-                    framed.get_mut().write_all(encoded_row).await
+                    framed.feed(BackendMessage::EncodedDataRow(encoded_row.clone())).await
                         .map_err(PgSqliteError::Io)?;
                 }
                 
                 // Send command complete
                 let tag = format!("SELECT {}", cached_response.row_count);
-                framed.send(BackendMessage::CommandComplete { tag }).await
+                framed.feed(BackendMessage::CommandComplete { tag }).await
                     .map_err(PgSqliteError::Io)?;
                 
                 return Ok(());
@@ -908,7 +944,7 @@ impl QueryExecutor {
         
         // Check if this is a catalog query first
         let response = if let Some(catalog_result) = crate::catalog::CatalogInterceptor::intercept_query(query, db.clone(), Some(session.clone())).await {
-            info!("Query intercepted by catalog handler");
+            debug!("Query intercepted by catalog handler");
             catalog_result?
         } else {
             // Route query through query router if available
@@ -1174,7 +1210,7 @@ impl QueryExecutor {
         };
         
         // Send RowDescription
-        framed.send(BackendMessage::RowDescription(fields.clone())).await
+        framed.feed(BackendMessage::RowDescription(fields.clone())).await
             .map_err(PgSqliteError::Io)?;
         
         
@@ -1183,12 +1219,12 @@ impl QueryExecutor {
         let mut column_types_map = std::collections::HashMap::new();
         
         // Check for scalar subqueries that return timestamps (same logic as ultra-simple path)
-        info!("Non-ultra path: Checking for scalar subqueries in columns: {:?}", response.columns);
+        debug!("Non-ultra path: Checking for scalar subqueries in columns: {:?}", response.columns);
         for col_name in &response.columns {
             // Check if this might be a scalar subquery result
             if col_name.contains("max") || col_name.contains("min") || 
                col_name.contains("MAX") || col_name.contains("MIN") {
-                info!("Non-ultra path: Column '{}' might be a scalar subquery result", col_name);
+                debug!("Non-ultra path: Column '{}' might be a scalar subquery result", col_name);
                 
                 // Look for the subquery pattern in the original query
                 // Pattern: (SELECT MAX(col) FROM table)
@@ -1198,15 +1234,15 @@ impl QueryExecutor {
                         && let (Some(inner_col), Some(inner_table)) = (captures.get(1), captures.get(2)) {
                             let inner_col_name = inner_col.as_str();
                             let inner_table_name = inner_table.as_str();
-                            info!("Non-ultra path: Found scalar subquery: MAX/MIN({}) FROM {}", inner_col_name, inner_table_name);
+                            debug!("Non-ultra path: Found scalar subquery: MAX/MIN({}) FROM {}", inner_col_name, inner_table_name);
                             
                             // Check if the inner column is a timestamp
                             if let Ok(Some(pg_type)) = db.get_schema_type_with_session(&session.id, inner_table_name, inner_col_name).await {
-                                info!("Non-ultra path: Inner column type: {}", pg_type);
+                                debug!("Non-ultra path: Inner column type: {}", pg_type);
                                 if pg_type.to_uppercase().contains("TIMESTAMP") || 
                                    pg_type.to_uppercase().contains("DATE") || 
                                    pg_type.to_uppercase().contains("TIME") {
-                                    info!("Non-ultra path: Adding '{}' as datetime column (type: {})", col_name, pg_type);
+                                    debug!("Non-ultra path: Adding '{}' as datetime column (type: {})", col_name, pg_type);
                                     datetime_columns.insert(col_name.clone(), pg_type);
                                 }
                             }
@@ -1219,16 +1255,16 @@ impl QueryExecutor {
                     && let Some(captures) = re.captures(col_name)
                         && let Some(inner_col) = captures.get(1) {
                             let inner_col_name = inner_col.as_str();
-                            info!("Non-ultra path: Found direct aggregate: {}", col_name);
+                            debug!("Non-ultra path: Found direct aggregate: {}", col_name);
                             
                             // Try all tables in the query to find the column
                             if let Some(ref table) = table_name
                                 && let Ok(Some(pg_type)) = db.get_schema_type_with_session(&session.id, table, inner_col_name).await {
-                                    info!("Non-ultra path: Direct aggregate column type: {}", pg_type);
+                                    debug!("Non-ultra path: Direct aggregate column type: {}", pg_type);
                                     if pg_type.to_uppercase().contains("TIMESTAMP") || 
                                        pg_type.to_uppercase().contains("DATE") || 
                                        pg_type.to_uppercase().contains("TIME") {
-                                        info!("Non-ultra path: Adding '{}' as datetime column from direct aggregate (type: {})", col_name, pg_type);
+                                        debug!("Non-ultra path: Adding '{}' as datetime column from direct aggregate (type: {})", col_name, pg_type);
                                         datetime_columns.insert(col_name.clone(), pg_type);
                                     }
                                 }
@@ -1373,7 +1409,7 @@ impl QueryExecutor {
                 for row in &converted_rows {
                     let encoded = crate::cache::encode_data_row(row);
                     encoded_rows.push(encoded.clone());
-                    framed.get_mut().write_all(&encoded).await
+                    framed.feed(BackendMessage::EncodedDataRow(encoded)).await
                         .map_err(PgSqliteError::Io)?;
                 }
             } else {
@@ -1385,10 +1421,10 @@ impl QueryExecutor {
                 if should_cache {
                     let encoded = crate::cache::encode_data_row(row);
                     encoded_rows.push(encoded.clone());
-                    framed.get_mut().write_all(&encoded).await
+                    framed.feed(BackendMessage::EncodedDataRow(encoded)).await
                         .map_err(PgSqliteError::Io)?;
                 } else {
-                    framed.send(BackendMessage::DataRow(row.clone())).await
+                    framed.feed(BackendMessage::DataRow(row.clone())).await
                         .map_err(PgSqliteError::Io)?;
                 }
             }
@@ -1407,7 +1443,7 @@ impl QueryExecutor {
         
         // Send CommandComplete with optimized tag creation
         let tag = create_command_tag("SELECT", row_count);
-        framed.send(BackendMessage::CommandComplete { tag }).await
+        framed.feed(BackendMessage::CommandComplete { tag }).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -1562,7 +1598,7 @@ impl QueryExecutor {
             _ => create_command_tag("OK", response.rows_affected),
         };
         
-        framed.send(BackendMessage::CommandComplete { tag }).await
+        framed.feed(BackendMessage::CommandComplete { tag }).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -1622,26 +1658,28 @@ impl QueryExecutor {
                 format: 0,
             });
             
-            column_types.push(pg_type);
+            // Uppercased once here rather than per value below
+            column_types.push(pg_type.map(|t| t.to_uppercase()));
         }
         
-        framed.send(BackendMessage::RowDescription(fields)).await
+        framed.feed(BackendMessage::RowDescription(fields)).await
             .map_err(PgSqliteError::Io)?;
         
-        // Send data rows with proper type conversion
+        // Send data rows with proper type conversion. Rows are owned, so values that
+        // need no formatting (e.g. the id of INSERT ... RETURNING id) are moved as-is.
         let mut row_count = 0;
         for row in returning_response.rows {
             // Convert row values based on column types
-            let mut converted_row = Vec::new();
+            let mut converted_row = Vec::with_capacity(row.len());
             
-            for (col_idx, value_opt) in row.iter().enumerate() {
+            for (col_idx, value_opt) in row.into_iter().enumerate() {
                 if let Some(value_bytes) = value_opt {
                     if let Some(Some(pg_type)) = column_types.get(col_idx) {
                         // Apply type-specific formatting for datetime types
-                        let formatted = match pg_type.to_uppercase().as_str() {
+                        let formatted = match pg_type.as_str() {
                             "DATE" => {
                                 // Convert INTEGER days to YYYY-MM-DD format
-                                if let Ok(value_str) = std::str::from_utf8(value_bytes) {
+                                if let Ok(value_str) = std::str::from_utf8(&value_bytes) {
                                     if let Ok(days) = value_str.parse::<i32>() {
                                         use crate::types::datetime_utils::format_days_to_date_buf;
                                         let mut buf = vec![0u8; 32];
@@ -1649,15 +1687,15 @@ impl QueryExecutor {
                                         buf.truncate(len);
                                         Some(buf)
                                     } else {
-                                        Some(value_bytes.clone())
+                                        Some(value_bytes)
                                     }
                                 } else {
-                                    Some(value_bytes.clone())
+                                    Some(value_bytes)
                                 }
                             }
                             "TIME" | "TIME WITHOUT TIME ZONE" | "TIME WITH TIME ZONE" | "TIMETZ" => {
                                 // Convert INTEGER microseconds to HH:MM:SS.ffffff format
-                                if let Ok(value_str) = std::str::from_utf8(value_bytes) {
+                                if let Ok(value_str) = std::str::from_utf8(&value_bytes) {
                                     if let Ok(micros) = value_str.parse::<i64>() {
                                         use crate::types::datetime_utils::format_microseconds_to_time_buf;
                                         let mut buf = vec![0u8; 32];
@@ -1665,15 +1703,15 @@ impl QueryExecutor {
                                         buf.truncate(len);
                                         Some(buf)
                                     } else {
-                                        Some(value_bytes.clone())
+                                        Some(value_bytes)
                                     }
                                 } else {
-                                    Some(value_bytes.clone())
+                                    Some(value_bytes)
                                 }
                             }
                             "TIMESTAMP" | "TIMESTAMP WITHOUT TIME ZONE" | "TIMESTAMP WITH TIME ZONE" | "TIMESTAMPTZ" => {
                                 // Convert INTEGER microseconds to YYYY-MM-DD HH:MM:SS.ffffff format
-                                if let Ok(value_str) = std::str::from_utf8(value_bytes) {
+                                if let Ok(value_str) = std::str::from_utf8(&value_bytes) {
                                     if let Ok(micros) = value_str.parse::<i64>() {
                                         use crate::types::datetime_utils::format_microseconds_to_timestamp_buf;
                                         let mut buf = vec![0u8; 32];
@@ -1681,24 +1719,24 @@ impl QueryExecutor {
                                         buf.truncate(len);
                                         Some(buf)
                                     } else {
-                                        Some(value_bytes.clone())
+                                        Some(value_bytes)
                                     }
                                 } else {
-                                    Some(value_bytes.clone())
+                                    Some(value_bytes)
                                 }
                             }
-                            _ => Some(value_bytes.clone()),
+                            _ => Some(value_bytes),
                         };
                         converted_row.push(formatted);
                     } else {
-                        converted_row.push(Some(value_bytes.clone()));
+                        converted_row.push(Some(value_bytes));
                     }
                 } else {
                     converted_row.push(None);
                 }
             }
             
-            framed.send(BackendMessage::DataRow(converted_row)).await
+            framed.feed(BackendMessage::DataRow(converted_row)).await
                 .map_err(PgSqliteError::Io)?;
             row_count += 1;
         }
@@ -1712,7 +1750,7 @@ impl QueryExecutor {
             _ => format!("OK {row_count}"),
         };
         
-        framed.send(BackendMessage::CommandComplete { tag }).await
+        framed.feed(BackendMessage::CommandComplete { tag }).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -1742,6 +1780,7 @@ impl QueryExecutor {
                         Some(format!("ENUM DDL failed: {e}"))
                     ))
             }).await?;
+            session.mark_schema_changed().await;
             
             let command_tag = if query.trim().to_uppercase().starts_with("CREATE TYPE") {
                 "CREATE TYPE"
@@ -1754,7 +1793,7 @@ impl QueryExecutor {
             };
             
             // Send command complete
-            framed.send(BackendMessage::CommandComplete { 
+            framed.feed(BackendMessage::CommandComplete { 
                 tag: command_tag.to_string() 
             }).await
                 .map_err(PgSqliteError::Io)?;
@@ -1800,6 +1839,7 @@ impl QueryExecutor {
         // Execute the translated query
         let cached_conn = Self::get_or_cache_connection(session, db).await;
         db.execute_with_session_cached(&translated_query, &session.id, cached_conn.as_ref()).await?;
+        session.mark_schema_changed().await;
         
         // If this was a DROP TABLE, clean up enum usage records
         if let Some(table_name) = table_name_to_clean {
@@ -2008,7 +2048,7 @@ impl QueryExecutor {
             _ => "OK".to_string(),
         };
         
-        framed.send(BackendMessage::CommandComplete { tag }).await
+        framed.feed(BackendMessage::CommandComplete { tag }).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -2056,7 +2096,7 @@ impl QueryExecutor {
                         where_: None,
                     })).await.map_err(PgSqliteError::Io)?;
                     // Still send CommandComplete, but don't actually execute BEGIN
-                    framed.send(BackendMessage::CommandComplete { tag: "BEGIN".to_string() }).await
+                    framed.feed(BackendMessage::CommandComplete { tag: "BEGIN".to_string() }).await
                         .map_err(PgSqliteError::Io)?;
                 } else {
                     tracing::debug!("Executing BEGIN command");
@@ -2065,7 +2105,7 @@ impl QueryExecutor {
                     // Update transaction status to InTransaction
                     *session.transaction_status.write().await = TransactionStatus::InTransaction;
                     tracing::debug!("Transaction status updated to InTransaction");
-                    framed.send(BackendMessage::CommandComplete { tag: "BEGIN".to_string() }).await
+                    framed.feed(BackendMessage::CommandComplete { tag: "BEGIN".to_string() }).await
                         .map_err(PgSqliteError::Io)?;
                 }
             }
@@ -2077,22 +2117,25 @@ impl QueryExecutor {
                     ));
                 }
                 tracing::debug!("Executing COMMIT command");
-                db.commit_with_session(&session.id).await?;
+                let schema_changed = session.schema_changed_in_transaction.load(std::sync::atomic::Ordering::Acquire);
+                db.commit_with_session(&session.id, schema_changed).await?;
+                session.end_schema_transaction();
                 tracing::debug!("COMMIT executed successfully");
                 
                 // Update transaction status to Idle
                 *session.transaction_status.write().await = TransactionStatus::Idle;
                 tracing::debug!("Transaction status updated to Idle");
-                framed.send(BackendMessage::CommandComplete { tag: "COMMIT".to_string() }).await
+                framed.feed(BackendMessage::CommandComplete { tag: "COMMIT".to_string() }).await
                     .map_err(PgSqliteError::Io)?;
             }
             QueryType::Rollback => {
                 // Use the rollback method which handles the "no transaction active" case gracefully
                 db.rollback_with_session(&session.id).await.map_err(|e| PgSqliteError::Protocol(e.to_string()))?;
+                session.end_schema_transaction();
                 
                 // Update transaction status to Idle (regardless of previous state)
                 *session.transaction_status.write().await = TransactionStatus::Idle;
-                framed.send(BackendMessage::CommandComplete { tag: "ROLLBACK".to_string() }).await
+                framed.feed(BackendMessage::CommandComplete { tag: "ROLLBACK".to_string() }).await
                     .map_err(PgSqliteError::Io)?;
             }
             _ => {}
@@ -2119,7 +2162,7 @@ impl QueryExecutor {
             db.execute_with_session_cached(query, &session.id, cached_conn.as_ref()).await?;
         }
         
-        framed.send(BackendMessage::CommandComplete { tag: "OK".to_string() }).await
+        framed.feed(BackendMessage::CommandComplete { tag: "OK".to_string() }).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -2150,7 +2193,7 @@ impl QueryExecutor {
         if batch_size == 1 {
             // Send individually for small result sets
             for row in rows {
-                framed.send(BackendMessage::DataRow(row)).await
+                framed.feed(BackendMessage::DataRow(row)).await
                     .map_err(PgSqliteError::Io)?;
             }
         } else {
@@ -2160,7 +2203,7 @@ impl QueryExecutor {
                 let mut batch_sent = false;
                 for _ in 0..batch_size {
                     if let Some(row) = row_iter.next() {
-                        framed.send(BackendMessage::DataRow(row)).await
+                        framed.feed(BackendMessage::DataRow(row)).await
                             .map_err(PgSqliteError::Io)?;
                         batch_sent = true;
                     } else {
@@ -4,14 +4,15 @@ use crate::catalog::CatalogInterceptor;
 use crate::translator::{JsonTranslator, ReturningTranslator, CastTranslator};
 use crate::types::{DecimalHandler, PgType};
 use std::str::FromStr;
-use crate::cache::{RowDescriptionKey, GLOBAL_ROW_DESCRIPTION_CACHE, GLOBAL_PARAMETER_CACHE, CachedParameterInfo};
+use crate::cache::{RowDescriptionKey, GLOBAL_ROW_DESCRIPTION_CACHE, GLOBAL_PARAMETER_CACHE, CachedParameterInfo, CachedParse, GLOBAL_PARSE_CACHE};
 use crate::validator::NumericValidator;
 use crate::query::ParameterParser;
 use crate::PgSqliteError;
 use tokio_util::codec::Framed;
 use futures::SinkExt;
-use tracing::{info, warn, debug};
+use tracing::{warn, debug};
 use std::sync::Arc;
+use std::sync::atomic::Ordering;
 use byteorder::{BigEndian, ByteOrder};
 use chrono::{NaiveDate, NaiveTime, NaiveDateTime, Timelike};
 
@@ -99,12 +100,34 @@ impl ExtendedQueryHandler {
                 if existing.query == query && existing.param_types == param_types {
                     // Already parsed, just send ParseComplete
                     drop(statements);
-                    framed.send(BackendMessage::ParseComplete).await
+                    framed.feed(BackendMessage::ParseComplete).await
                         .map_err(PgSqliteError::Io)?;
                     return Ok(());
                 }
             }
-        } else {
+        }
+        
+        // Reuse a previous Parse of the same payload, skipping translation and type analysis.
+        // Other sessions' results are picked up from the global cache on a local miss, unless
+        // each connection sees its own in-memory database or this session has uncommitted DDL.
+        let share_globally = !db.is_memory_database()
+            && !session.schema_changed_in_transaction.load(Ordering::Acquire);
+        let cached = session.parse_cache.get(&query, &param_types).or_else(|| {
+            if !share_globally {
+                return None;
+            }
+            let shared = GLOBAL_PARSE_CACHE.get(&query, &param_types)?;
+            session.parse_cache.put_shared(&query, &param_types, shared.clone());
+            Some(shared)
+        });
+        if let Some(cached) = cached {
+            session.prepared_statements.write().await.insert(name.clone(), cached.to_prepared_statement());
+            framed.feed(BackendMessage::ParseComplete).await
+                .map_err(PgSqliteError::Io)?;
+            return Ok(());
+        }
+        
+        if name.is_empty() {
             // For unnamed statements, check if we have cached info about this query
             // This is important for benchmarks that use parameterized queries
             if let Some(cached_info) = GLOBAL_PARAMETER_CACHE.get(&query) {
@@ -125,12 +148,13 @@ impl ExtendedQueryHandler {
                     param_formats: vec![0; cached_info.param_types.len()],
                     field_descriptions: Vec::new(), // Will be populated during bind/execute
                     translation_metadata: None,
+                    encoded_row_description: Default::default(),
                 };
                 
                 // Store as unnamed statement
                 session.prepared_statements.write().await.insert(String::new(), stmt);
                 
-                framed.send(BackendMessage::ParseComplete).await
+                framed.feed(BackendMessage::ParseComplete).await
                     .map_err(PgSqliteError::Io)?;
                 return Ok(());
             }
@@ -152,6 +176,8 @@ impl ExtendedQueryHandler {
         // Check for Python-style parameters and convert to PostgreSQL-style
         use crate::query::parameter_parser::ParameterParser;
         let python_params = ParameterParser::find_python_parameters(&cleaned_query);
+        // The Python parameter mapping is stored per statement name, so these can't be shared
+        let cacheable = python_params.is_empty();
         if !python_params.is_empty() {
             // Python-style parameters found
             
@@ -274,12 +300,13 @@ impl ExtendedQueryHandler {
                     vec![]
                 },
                 translation_metadata: None, // SET commands don't need translation metadata
+                encoded_row_description: Default::default(),
             };
             
             session.prepared_statements.write().await.insert(name.clone(), stmt);
             
             // Send ParseComplete
-            framed.send(BackendMessage::ParseComplete).await
+            framed.feed(BackendMessage::ParseComplete).await
                 .map_err(PgSqliteError::Io)?;
             
             return Ok(());
@@ -506,16 +533,20 @@ impl ExtendedQueryHandler {
         
         // For now, we'll just analyze the query to get field descriptions
         // In a real implementation, we'd parse the SQL and validate it
-        info!("Analyzing query '{}' for field descriptions", translated_for_analysis);
-        info!("Original query: {}", cleaned_query);
-        info!("Is simple param select: {}", is_simple_param_select);
+        debug!("Analyzing query '{}' for field descriptions", translated_for_analysis);
+        debug!("Original query: {}", cleaned_query);
+        debug!("Is simple param select: {}", is_simple_param_select);
+        // Cleared when a column type came from sample data or a fallback default; such
+        // descriptions can change with the table contents, so they must not be cached
+        let mut types_from_schema = true;
         let field_descriptions = if query_starts_with_ignore_case(&cleaned_query, "SELECT") {
             // Don't try to get field descriptions if this is a catalog query
             // These queries are handled specially and don't need real field info
             if cleaned_query.contains("pg_catalog") || cleaned_query.contains("pg_type") || 
                cleaned_query.contains("pg_class") || cleaned_query.contains("pg_attribute") ||
                cleaned_query.contains("pg_namespace") || cleaned_query.contains("pg_enum") {
-                info!("Skipping field description for catalog query");
+                debug!("Skipping field description for catalog query");
+                types_from_schema = false;
                 Vec::new()
             } else {
                 // Try to get field descriptions
@@ -533,7 +564,7 @@ impl ExtendedQueryHandler {
                 
                 // First, analyze the original query for type casts in the SELECT clause
                 let cast_info = Self::analyze_column_casts(&cleaned_query);
-                info!("Detected column casts: {:?}", cast_info);
+                debug!("Detected column casts: {:?}", cast_info);
                 
                 // Remove PostgreSQL-style type casts before executing
                 // Be careful not to match IPv6 addresses like ::1
@@ -549,7 +580,7 @@ impl ExtendedQueryHandler {
                 
                 match test_response {
                     Ok(response) => {
-                        info!("Test query returned {} columns: {:?}", response.columns.len(), response.columns);
+                        debug!("Test query returned {} columns: {:?}", response.columns.len(), response.columns);
                         // Extract table name from query to look up schema
                         let table_name = extract_table_name_from_select(&query);
                         
@@ -575,7 +606,7 @@ impl ExtendedQueryHandler {
                                                     // Only use if it's the same table we identified
                                                     if src_table_name == table
                                                         && let Ok(Some(pg_type)) = db.get_schema_type_with_session(&session.id, table, src_col_name).await {
-                                                            info!("Found type for aliased column '{}' from query pattern '{}.{}' in table '{}': {}", col_name, src_table_name, src_col_name, table, pg_type);
+                                                            debug!("Found type for aliased column '{}' from query pattern '{}.{}' in table '{}': {}", col_name, src_table_name, src_col_name, table, pg_type);
                                                             schema_types.insert(col_name.clone(), pg_type);
                                                             continue;
                                                         }
@@ -585,10 +616,10 @@ impl ExtendedQueryHandler {
                                         // For datetime expressions, check if we have a source column and prefer its type
                                         if let Some(ref source_col) = hint.source_column {
                                             if let Ok(Some(source_type)) = db.get_schema_type_with_session(&session.id, table, source_col).await {
-                                                info!("Found source column type for datetime expression '{}' -> '{}': {}", col_name, source_col, source_type);
+                                                debug!("Found source column type for datetime expression '{}' -> '{}': {}", col_name, source_col, source_type);
                                                 schema_types.insert(col_name.clone(), source_type);
                                             } else if let Some(suggested_type) = &hint.suggested_type {
-                                                info!("Using suggested type for datetime expression '{}': {:?}", col_name, suggested_type);
+                                                debug!("Using suggested type for datetime expression '{}': {:?}", col_name, suggested_type);
                                                 // Convert PgType to the string format used in schema
                                                 let type_string = match suggested_type {
                                                     crate::types::PgType::Float8 => "DOUBLE PRECISION",
@@ -606,7 +637,7 @@ impl ExtendedQueryHandler {
                                                 schema_types.insert(col_name.clone(), type_string.to_string());
                                             }
                                         } else if let Some(suggested_type) = &hint.suggested_type {
-                                            info!("Found type hint from translation for '{}': {:?}", col_name, suggested_type);
+                                            debug!("Found type hint from translation for '{}': {:?}", col_name, suggested_type);
                                             // Convert PgType to the string format used in schema
                                             let type_string = match suggested_type {
                                                 crate::types::PgType::Float8 => "DOUBLE PRECISION",
@@ -624,17 +655,17 @@ impl ExtendedQueryHandler {
                                         }
                                     } else {
                                         // Try to find source table and column if this is an alias
-                                        info!("Attempting to extract source for alias: '{}' from query: {}", col_name, cleaned_query);
+                                        debug!("Attempting to extract source for alias: '{}' from query: {}", col_name, cleaned_query);
                                         if let Some((source_table, source_col)) = Self::extract_source_table_column_for_alias(&cleaned_query, col_name) {
-                                            info!("Successfully resolved alias '{}' -> table '{}', column '{}'", col_name, source_table, source_col);
+                                            debug!("Successfully resolved alias '{}' -> table '{}', column '{}'", col_name, source_table, source_col);
                                             if let Ok(Some(pg_type)) = db.get_schema_type_with_session(&session.id, &source_table, &source_col).await {
-                                                info!("Found schema type for alias '{}' -> source column '{}.{}': {}", col_name, source_table, source_col, pg_type);
+                                                debug!("Found schema type for alias '{}' -> source column '{}.{}': {}", col_name, source_table, source_col, pg_type);
                                                 schema_types.insert(col_name.clone(), pg_type);
                                             } else {
-                                                info!("No schema type found for '{}.{}'", source_table, source_col);
+                                                debug!("No schema type found for '{}.{}'", source_table, source_col);
                                             }
                                         } else {
-                                            info!("Could not extract source table/column for alias '{}' from query", col_name);
+                                            debug!("Could not extract source table/column for alias '{}' from query", col_name);
                                         }
                                     }
                                 }
@@ -657,38 +688,38 @@ impl ExtendedQueryHandler {
                                     if is_simple_param_select {
                                         // Count which parameter this column represents
                                         // For SELECT $1, $2, column 0 = param 0, column 1 = param 1
-                                        info!("Simple parameter SELECT detected, column {} likely corresponds to parameter {}", i, i + 1);
+                                        debug!("Simple parameter SELECT detected, column {} likely corresponds to parameter {}", i, i + 1);
                                         
                                         // Check actual_param_types which includes inferred types
                                         if !actual_param_types.is_empty() && i < actual_param_types.len() {
                                             let param_type = actual_param_types[i];
                                             if param_type != 0 && param_type != PgType::Text.to_oid() {
-                                                info!("Using actual param type {} for column {}", param_type, i);
+                                                debug!("Using actual param type {} for column {}", param_type, i);
                                                 param_type
                                             } else if !param_types.is_empty() && i < param_types.len() {
                                                 let param_type = param_types[i];
                                                 if param_type != 0 {
-                                                    info!("Using provided param type {} for column {}", param_type, i);
+                                                    debug!("Using provided param type {} for column {}", param_type, i);
                                                     param_type
                                                 } else {
-                                                    info!("No specific param type for column {}, defaulting to TEXT", i);
+                                                    debug!("No specific param type for column {}, defaulting to TEXT", i);
                                                     PgType::Text.to_oid()
                                                 }
                                             } else {
-                                                info!("No specific param type for column {}, defaulting to TEXT", i);
+                                                debug!("No specific param type for column {}, defaulting to TEXT", i);
                                                 PgType::Text.to_oid()
                                             }
                                         } else if !param_types.is_empty() && i < param_types.len() {
                                             let param_type = param_types[i];
                                             if param_type != 0 {
-                                                info!("Using provided param type {} for column {}", param_type, i);
+                                                debug!("Using provided param type {} for column {}", param_type, i);
                                                 param_type
                                             } else {
-                                                info!("No specific param type for column {}, defaulting to TEXT", i);
+                                                debug!("No specific param type for column {}, defaulting to TEXT", i);
                                                 PgType::Text.to_oid()
                                             }
                                         } else {
-                                            info!("No specific param type for column {}, defaulting to TEXT", i);
+                                            debug!("No specific param type for column {}, defaulting to TEXT", i);
                                             PgType::Text.to_oid()
                                         }
                                     } else {
@@ -716,7 +747,7 @@ impl ExtendedQueryHandler {
                                             } else if let Some(ref table) = table_name {
                                                 (table.as_str(), source_col.as_str())
                                             } else {
-                                                info!("Arithmetic expression '{}' has no table context and source column '{}' has no table prefix", col_name, source_col);
+                                                debug!("Arithmetic expression '{}' has no table context and source column '{}' has no table prefix", col_name, source_col);
                                                 ("", source_col.as_str()) // Will likely fail, but try anyway
                                             };
                                             
@@ -731,24 +762,24 @@ impl ExtendedQueryHandler {
                                                     700 | 701 => PgType::Float8, // FLOAT arithmetic = FLOAT
                                                     _ => PgType::Float8, // Default to FLOAT8 for unknown types
                                                 };
-                                                info!("Resolved arithmetic expression '{}' from source '{}' (type {} -> OID {}) -> {:?}", 
+                                                debug!("Resolved arithmetic expression '{}' from source '{}' (type {} -> OID {}) -> {:?}", 
                                                       col_name, source_col, source_type_str, source_type_oid, arithmetic_result_type);
                                                 arithmetic_result_type.to_oid()
                                             } else {
-                                                info!("Could not resolve source column type for arithmetic expression '{}'", col_name);
+                                                debug!("Could not resolve source column type for arithmetic expression '{}'", col_name);
                                                 0 // Will be handled below
                                             }
                                         } else {
-                                            info!("Arithmetic expression '{}' has no source column", col_name);
+                                            debug!("Arithmetic expression '{}' has no source column", col_name);
                                             0 // Will be handled below  
                                         }
                                     } else {
-                                        info!("No type hint found in translation metadata for '{}'", col_name);
+                                        debug!("No type hint found in translation metadata for '{}'", col_name);
                                         // Continue to next priority
                                         0 // Will be handled below
                                     }
                                 } else {
-                                    info!("No type hint found in translation metadata for '{}'", col_name);
+                                    debug!("No type hint found in translation metadata for '{}'", col_name);
                                     0 // Will be handled below
                                 }
                             };
@@ -770,7 +801,7 @@ impl ExtendedQueryHandler {
                             // Third priority: Check for aggregate functions
                             let col_lower = col_name.to_lowercase();
                             if let Some(oid) = crate::types::SchemaTypeMapper::get_aggregate_return_type_with_query(&col_lower, None, None, Some(&cleaned_query)) {
-                                info!("Column '{}' identified with type OID {} from aggregate detection", col_name, oid);
+                                debug!("Column '{}' identified with type OID {} from aggregate detection", col_name, oid);
                                 inferred_types.push(oid);
                                 continue;  // Important: continue here to prevent value-based inference from overriding
                             }
@@ -785,7 +816,7 @@ impl ExtendedQueryHandler {
                                 if col_name.contains("total") || col_name.contains("sum") || 
                                    col_name.contains("price") || col_name.contains("amount") ||
                                    col_name == "?column?" {
-                                    info!("Column '{}' appears to be result of decimal arithmetic", col_name);
+                                    debug!("Column '{}' appears to be result of decimal arithmetic", col_name);
                                     inferred_types.push(PgType::Numeric.to_oid());
                                     continue;
                                 }
@@ -796,44 +827,47 @@ impl ExtendedQueryHandler {
                             
                             // Last resort: Try to infer from value if we have data
                             if !response.rows.is_empty() {
+                                types_from_schema = false;
                                 if let Some(value) = response.rows[0].get(i) {
                                     let value_str = value.as_ref().and_then(|v| std::str::from_utf8(v).ok()).unwrap_or("<non-utf8>");
                                     let inferred_type = crate::types::SchemaTypeMapper::infer_type_from_value(value.as_deref());
-                                    info!("Column '{}': inferring type from value '{}' -> type OID {}", col_name, value_str, inferred_type);
+                                    debug!("Column '{}': inferring type from value '{}' -> type OID {}", col_name, value_str, inferred_type);
                                     inferred_types.push(inferred_type);
                                 } else {
-                                    info!("Column '{}': NULL value, defaulting to text", col_name);
+                                    debug!("Column '{}': NULL value, defaulting to text", col_name);
                                     inferred_types.push(PgType::Text.to_oid()); // text for NULL
                                 }
                             } else {
                                 // **THIS IS THE KEY FIX**: Instead of defaulting to TEXT, try schema lookup
-                                info!("Column '{}': no data rows, attempting schema-based type inference", col_name);
+                                debug!("Column '{}': no data rows, attempting schema-based type inference", col_name);
                                 
                                 // Try to extract source table.column from the query
                                 if let Some((source_table, source_col)) = Self::extract_source_table_column_for_alias(&cleaned_query, col_name) {
-                                    info!("Resolved alias '{}' -> table '{}', column '{}'", col_name, source_table, source_col);
+                                    debug!("Resolved alias '{}' -> table '{}', column '{}'", col_name, source_table, source_col);
                                     
                                     // Use session-aware schema lookup to see uncommitted data
                                     match db.get_schema_type_with_session(&session.id, &source_table, &source_col).await {
                                         Ok(Some(pg_type_str)) => {
                                             let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type_str);
-                                            info!("Column '{}': resolved type from schema '{}.{}' -> {} (OID {})", 
+                                            debug!("Column '{}': resolved type from schema '{}.{}' -> {} (OID {})", 
                                                   col_name, source_table, source_col, pg_type_str, type_oid);
                                             inferred_types.push(type_oid);
                                         }
                                         Ok(None) => {
-                                            info!("Column '{}': no schema type found for '{}.{}', defaulting to text", 
+                                            debug!("Column '{}': no schema type found for '{}.{}', defaulting to text", 
                                                   col_name, source_table, source_col);
+                                            types_from_schema = false;
                                             inferred_types.push(PgType::Text.to_oid());
                                         }
                                         Err(_) => {
                                             // Schema lookup error, defaulting to text
+                                            types_from_schema = false;
                                             inferred_types.push(PgType::Text.to_oid());
                                         }
                                     }
                                 } else {
                                     // Could not extract source table.column, try to infer from query structure
-                                    info!("Column '{}': could not extract source table.column, analyzing query structure", col_name);
+                                    debug!("Column '{}': could not extract source table.column, analyzing query structure", col_name);
                                     
                                     // First, try to handle table_column pattern like "orders_total_amount"
                                     let mut type_found = false;
@@ -846,7 +880,7 @@ impl ExtendedQueryHandler {
                                             match db.get_schema_type_with_session(&session.id, potential_table, potential_column).await {
                                                 Ok(Some(pg_type_str)) => {
                                                     let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type_str);
-                                                    info!("Column '{}': resolved type from table_column pattern '{}_{}'-> {} (OID {})", 
+                                                    debug!("Column '{}': resolved type from table_column pattern '{}_{}'-> {} (OID {})", 
                                                           col_name, potential_table, potential_column, pg_type_str, type_oid);
                                                     inferred_types.push(type_oid);
                                                     type_found = true;
@@ -860,27 +894,30 @@ impl ExtendedQueryHandler {
                                     if !type_found {
                                         // For simple SELECT queries, try to extract table from FROM clause and assume column exists
                                         if let Some(table_name) = extract_table_name_from_select(&cleaned_query) {
-                                            info!("Column '{}': extracted table '{}' from FROM clause, assuming column exists", col_name, table_name);
+                                            debug!("Column '{}': extracted table '{}' from FROM clause, assuming column exists", col_name, table_name);
                                             
                                             match db.get_schema_type_with_session(&session.id, &table_name, col_name).await {
                                                 Ok(Some(pg_type_str)) => {
                                                     let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type_str);
-                                                    info!("Column '{}': resolved type from schema '{}.{}' -> {} (OID {})", 
+                                                    debug!("Column '{}': resolved type from schema '{}.{}' -> {} (OID {})", 
                                                           col_name, table_name, col_name, pg_type_str, type_oid);
                                                     inferred_types.push(type_oid);
                                                 }
                                                 Ok(None) => {
-                                                    info!("Column '{}': no schema type found for '{}.{}', defaulting to text", 
+                                                    debug!("Column '{}': no schema type found for '{}.{}', defaulting to text", 
                                                           col_name, table_name, col_name);
+                                                    types_from_schema = false;
                                                     inferred_types.push(PgType::Text.to_oid());
                                                 }
                                                 Err(_) => {
                                                     // Schema lookup error, defaulting to text
+                                                    types_from_schema = false;
                                                     inferred_types.push(PgType::Text.to_oid());
                                                 }
                                             }
                                         } else {
-                                            info!("Column '{}': could not extract table name from query, defaulting to text", col_name);
+                                            debug!("Column '{}': could not extract table name from query, defaulting to text", col_name);
+                                            types_from_schema = false;
                                             inferred_types.push(PgType::Text.to_oid());
                                         }
                                     }
@@ -903,22 +940,26 @@ impl ExtendedQueryHandler {
                         
                         // Special logging for orders queries
                         if cleaned_query.contains("orders") {
-                            info!("PARSE: Orders query detected!");
-                            info!("PARSE: Query: {}", cleaned_query);
-                            info!("PARSE: Field descriptions created:");
+                            debug!("PARSE: Orders query detected!");
+                            debug!("PARSE: Query: {}", cleaned_query);
+                            debug!("PARSE: Field descriptions created:");
                             for field in &fields {
-                                info!("PARSE:   {} -> type OID {}", field.name, field.type_oid);
+                                debug!("PARSE:   {} -> type OID {}", field.name, field.type_oid);
                                 if field.name.contains("total_amount") && field.type_oid == 25 {
-                                    info!("PARSE:   ^^^ BUG: total_amount has TEXT type!");
+                                    debug!("PARSE:   ^^^ BUG: total_amount has TEXT type!");
                                 }
                             }
                         }
                         
-                        info!("Parsed {} field descriptions from query with inferred types", fields.len());
+                        debug!("Parsed {} field descriptions from query with inferred types", fields.len());
+                        if fields.is_empty() {
+                            types_from_schema = false;
+                        }
                         fields
                     }
                     Err(_) => {
                         // Failed to get field descriptions - will determine during execute
+                        types_from_schema = false;
                         Vec::new()
                     }
                 }
@@ -939,12 +980,12 @@ impl ExtendedQueryHandler {
                 }
             }
             
-            info!("Query has {} parameters, defaulting all to text", max_param);
+            debug!("Query has {} parameters, defaulting all to text", max_param);
             // Default all to text - we'll handle type conversion during execution
             actual_param_types = vec![PgType::Text.to_oid(); max_param];
         }
         
-        info!("Final param_types for statement: {:?}", actual_param_types);
+        debug!("Final param_types for statement: {:?}", actual_param_types);
         
         // Store the prepared statement
         // We already translated the query above for analysis, so just use that
@@ -961,12 +1002,21 @@ impl ExtendedQueryHandler {
             } else {
                 Some(translation_metadata)
             },
+            encoded_row_description: Default::default(),
         };
         
+        if cacheable && types_from_schema {
+            let parsed = Arc::new(CachedParse::from_statement(&stmt));
+            if share_globally {
+                GLOBAL_PARSE_CACHE.put_shared(&query, &param_types, parsed.clone());
+            }
+            session.parse_cache.put_shared(&query, &param_types, parsed);
+        }
+        
         session.prepared_statements.write().await.insert(name.clone(), stmt);
         
-        // Send ParseComplete
-        framed.send(BackendMessage::ParseComplete).await
+        // Queue ParseComplete; it is flushed on the next Sync or Flush
+        framed.feed(BackendMessage::ParseComplete).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -978,15 +1028,15 @@ impl ExtendedQueryHandler {
     fn extract_source_table_column_for_alias(query: &str, alias: &str) -> Option<(String, String)> {
         // This is a simple heuristic for the common case
         // Look for "SELECT <expr> as <alias>" pattern
-        info!("extract_source_table_column_for_alias: Looking for alias '{}' in query", alias);
+        debug!("extract_source_table_column_for_alias: Looking for alias '{}' in query", alias);
         let query_upper = query.to_uppercase();
         let alias_upper = alias.to_uppercase();
         
         // Find "AS <alias>" in the query
         let as_pattern = format!(" AS {alias_upper}");
-        info!("Looking for pattern: '{}'", as_pattern);
+        debug!("Looking for pattern: '{}'", as_pattern);
         if let Some(as_pos) = query_upper.find(&as_pattern) {
-            info!("Found AS pattern at position {}", as_pos);
+            debug!("Found AS pattern at position {}", as_pos);
             // Work backwards to find the start of the expression
             let before_as = &query[..as_pos];
             
@@ -995,7 +1045,7 @@ impl ExtendedQueryHandler {
             
             // Get the last token/word before AS (handling commas and spaces)
             let trimmed = before_as.trim_end();
-            info!("Text before AS (trimmed): '{}'", trimmed);
+            debug!("Text before AS (trimmed): '{}'", trimmed);
             
             // Find where this expression starts (after SELECT or comma)
             let mut expr_start = 0;
@@ -1004,31 +1054,31 @@ impl ExtendedQueryHandler {
             // Look for the last comma or SELECT keyword
             if let Some(comma_pos) = trimmed.rfind(',') {
                 expr_start = comma_pos + 1;
-                info!("Found comma at position {}, expr_start = {}", comma_pos, expr_start);
+                debug!("Found comma at position {}, expr_start = {}", comma_pos, expr_start);
             } else if let Some(select_pos) = query_upper.find(select_upper) {
                 expr_start = select_pos + select_upper.len();
-                info!("Found SELECT at position {}, expr_start = {}", select_pos, expr_start);
+                debug!("Found SELECT at position {}, expr_start = {}", select_pos, expr_start);
             }
             
             // Make sure expr_start is within bounds
             if expr_start >= trimmed.len() {
-                info!("expr_start {} >= trimmed.len() {}, using 0", expr_start, trimmed.len());
+                debug!("expr_start {} >= trimmed.len() {}, using 0", expr_start, trimmed.len());
                 expr_start = 0;
             }
             
             let expr = trimmed[expr_start..].trim();
-            info!("Extracted expression: '{}'", expr);
+            debug!("Extracted expression: '{}'", expr);
             
             // Check if it contains a dot (table.column)
             if let Some(dot_pos) = expr.rfind('.') {
                 let table_part = expr[..dot_pos].trim();
                 let column_part = expr[dot_pos + 1..].trim();
-                info!("Found table.column pattern: '{}' . '{}'", table_part, column_part);
+                debug!("Found table.column pattern: '{}' . '{}'", table_part, column_part);
                 
                 // Validate both parts are simple identifiers
                 if table_part.chars().all(|c| c.is_alphanumeric() || c == '_') &&
                    column_part.chars().all(|c| c.is_alphanumeric() || c == '_') {
-                    info!("Successfully parsed alias '{}' -> table '{}', column '{}'", alias, table_part, column_part);
+                    debug!("Successfully parsed alias '{}' -> table '{}', column '{}'", alias, table_part, column_part);
                     return Some((table_part.to_string(), column_part.to_string()));
                 }
             }
@@ -1036,14 +1086,14 @@ impl ExtendedQueryHandler {
             else if expr.chars().all(|c| c.is_alphanumeric() || c == '_') {
                 // Try to extract table from FROM clause
                 if let Some(table_name) = extract_table_name_from_select(query) {
-                    info!("Successfully parsed alias '{}' -> table '{}' (from FROM clause), column '{}'", alias, table_name, expr);
+                    debug!("Successfully parsed alias '{}' -> table '{}' (from FROM clause), column '{}'", alias, table_name, expr);
                     return Some((table_name, expr.to_string()));
                 }
             }
             
-            info!("Failed to parse expression '{}' - not a valid table.column or simple column", expr);
+            debug!("Failed to parse expression '{}' - not a valid table.column or simple column", expr);
         } else {
-            info!("AS pattern not found for alias '{}'", alias);
+            debug!("AS pattern not found for alias '{}'", alias);
         }
         
         None
@@ -1078,13 +1128,13 @@ impl ExtendedQueryHandler {
             {
                 let python_mappings = session.python_param_mapping.read().await;
                 if let Some(param_names) = python_mappings.get(&statement) {
-                    info!("Statement '{}' used Python parameters: {:?}", statement, param_names);
+                    debug!("Statement '{}' used Python parameters: {:?}", statement, param_names);
                     
                     // The values come in as a map (conceptually), but we received them as a Vec
                     // We need to reorder them to match the $1, $2, $3... order we created
                     // Since we already converted %(name__0)s -> $1, %(name__1)s -> $2, etc. in parse,
                     // the values should already be in the correct order
-                    info!("Python parameter mapping found, values should already be in correct order");
+                    debug!("Python parameter mapping found, values should already be in correct order");
                 }
             }
         }
@@ -1101,7 +1151,7 @@ impl ExtendedQueryHandler {
             statements.get(&statement)
         }
         .ok_or_else(|| {
-            info!("Statement lookup failed for '{}', available statements: {:?}", 
+            debug!("Statement lookup failed for '{}', available statements: {:?}", 
                   statement, statements.keys().collect::<Vec<_>>());
             PgSqliteError::Protocol(format!("Unknown statement: {statement}"))
         })?;
@@ -1135,7 +1185,7 @@ impl ExtendedQueryHandler {
                     PgType::Text.to_oid() // NULL can be any type, default to text
                 };
                 
-                info!("  Param {}: inferred type OID {} from value (format={})", i + 1, inferred_type, format);
+                debug!("  Param {}: inferred type OID {} from value (format={})", i + 1, inferred_type, format);
                 types.push(inferred_type);
             }
             
@@ -1146,20 +1196,20 @@ impl ExtendedQueryHandler {
             let expected_type = stmt.param_types.get(i).unwrap_or(&0);
             let format = formats.get(i).copied().unwrap_or(0);
             if let Some(v) = val {
-                info!("  Param {}: {} bytes, expected type OID {}, format {} ({})", 
+                debug!("  Param {}: {} bytes, expected type OID {}, format {} ({})", 
                       i + 1, v.len(), expected_type, format, 
                       if format == 1 { "binary" } else { "text" });
                 // Log first few bytes as hex for debugging
                 let hex_preview = v.iter().take(20).map(|b| format!("{b:02x}")).collect::<Vec<_>>().join(" ");
-                info!("    First bytes (hex): {}", hex_preview);
+                debug!("    First bytes (hex): {}", hex_preview);
                 if format == 0 {
                     // Try to show as string if text format
                     if let Ok(s) = String::from_utf8(v.clone()) {
-                        info!("    As string: {:?}", s);
+                        debug!("    As string: {:?}", s);
                     }
                 }
             } else {
-                info!("  Param {}: NULL, expected type OID {}, format {} ({})", 
+                debug!("  Param {}: NULL, expected type OID {}, format {} ({})", 
                       i + 1, expected_type, format,
                       if format == 1 { "binary" } else { "text" });
             }
@@ -1194,8 +1244,8 @@ impl ExtendedQueryHandler {
         // Also maintain backward compatibility with direct portal storage
         session.portals.write().await.insert(portal.clone(), portal_obj);
         
-        // Send BindComplete
-        framed.send(BackendMessage::BindComplete).await
+        // Queue BindComplete; it is written out with the response to the following Execute/Sync
+        framed.feed(BackendMessage::BindComplete).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -1229,9 +1279,9 @@ impl ExtendedQueryHandler {
         
         // Special logging for orders queries
         if query.contains("orders") && query.contains("customer_id") {
-            info!("EXECUTE: Orders query detected!");
-            info!("EXECUTE: Query: {}", query);
-            info!("EXECUTE: Statement name: {}", statement_name);
+            debug!("EXECUTE: Orders query detected!");
+            debug!("EXECUTE: Query: {}", query);
+            debug!("EXECUTE: Statement name: {}", statement_name);
             
             // Check what field_descriptions are stored for this statement
             let statements = session.prepared_statements.read().await;
@@ -1245,15 +1295,15 @@ impl ExtendedQueryHandler {
             };
             
             if let Some(stmt) = stmt_opt {
-                info!("EXECUTE: Statement has {} field_descriptions", stmt.field_descriptions.len());
+                debug!("EXECUTE: Statement has {} field_descriptions", stmt.field_descriptions.len());
                 for fd in &stmt.field_descriptions {
-                    info!("EXECUTE:   {} -> type OID {}", fd.name, fd.type_oid);
+                    debug!("EXECUTE:   {} -> type OID {}", fd.name, fd.type_oid);
                     if fd.name.contains("total_amount") && fd.type_oid == 25 {
-                        info!("EXECUTE:   ^^^ BUG DETECTED: total_amount has TEXT type!");
+                        debug!("EXECUTE:   ^^^ BUG DETECTED: total_amount has TEXT type!");
                     }
                 }
             } else {
-                info!("EXECUTE: Statement not found! Available keys: {:?}", 
+                debug!("EXECUTE: Statement not found! Available keys: {:?}", 
                       statements.keys().collect::<Vec<_>>());
             }
         }
@@ -1306,7 +1356,7 @@ impl ExtendedQueryHandler {
            !query.contains("EXCEPT") &&
            (result_formats.is_empty() || result_formats[0] == 0) {
             
-            info!("🚀 Ultra-fast path triggered for query: {}", query);
+            debug!("🚀 Ultra-fast path triggered for query: {}", query);
             // Using fast path for simple SELECT
             
             // Get cached connection first
@@ -1334,8 +1384,8 @@ impl ExtendedQueryHandler {
                         // Parse the query to get column names and their aliases
                         let mut inferred_types = Vec::new();
                         let table_name = extract_table_name_from_select(&query);
-                        info!("Ultra-fast path: Inferring types for query: {}", query);
-                        info!("Ultra-fast path: Extracted table name: {:?}", table_name);
+                        debug!("Ultra-fast path: Inferring types for query: {}", query);
+                        debug!("Ultra-fast path: Extracted table name: {:?}", table_name);
                         
                         // Extract column names from SELECT clause
                         // Handle both " FROM " and "\nFROM " (queries might have newlines)
@@ -1347,9 +1397,9 @@ impl ExtendedQueryHandler {
                             let select_part = &query[6..select_end]; // Skip "SELECT"
                             let columns: Vec<&str> = select_part.split(',').map(|s| s.trim()).collect();
                             
-                            info!("Ultra-fast path: Parsing {} columns from SELECT clause", columns.len());
+                            debug!("Ultra-fast path: Parsing {} columns from SELECT clause", columns.len());
                             for col_expr in columns {
-                                info!("Ultra-fast path: Processing column expression: '{}'", col_expr);
+                                debug!("Ultra-fast path: Processing column expression: '{}'", col_expr);
                                 let mut found_type = false;
                                 
                                 // Extract the alias name (after AS) if present
@@ -1364,7 +1414,7 @@ impl ExtendedQueryHandler {
                                 if let Some((source_table, source_col)) = Self::extract_source_table_column_for_alias(&query, col_name) {
                                     if let Ok(Some(pg_type_str)) = db.get_schema_type_with_session(&session.id, &source_table, &source_col).await {
                                         let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type_str);
-                                        info!("Ultra-fast path: Pre-execution type inference for '{}' from '{}.{}' -> {} (OID {})", 
+                                        debug!("Ultra-fast path: Pre-execution type inference for '{}' from '{}.{}' -> {} (OID {})", 
                                               col_name, source_table, source_col, pg_type_str, type_oid);
                                         inferred_types.push(type_oid);
                                         found_type = true;
@@ -1377,7 +1427,7 @@ impl ExtendedQueryHandler {
                                         let column_part = parts[1].trim();
                                         if let Ok(Some(pg_type_str)) = db.get_schema_type_with_session(&session.id, table_part, column_part).await {
                                             let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type_str);
-                                            info!("Ultra-fast path: Pre-execution type inference for '{}' from '{}.{}' -> {} (OID {})", 
+                                            debug!("Ultra-fast path: Pre-execution type inference for '{}' from '{}.{}' -> {} (OID {})", 
                                                   col_name, table_part, column_part, pg_type_str, type_oid);
                                             inferred_types.push(type_oid);
                                             found_type = true;
@@ -1387,7 +1437,7 @@ impl ExtendedQueryHandler {
                                     // Try direct column name lookup in the main table
                                     if let Ok(Some(pg_type_str)) = db.get_schema_type_with_session(&session.id, table, col_expr).await {
                                         let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type_str);
-                                        info!("Ultra-fast path: Pre-execution type inference for '{}' from table '{}' -> {} (OID {})", 
+                                        debug!("Ultra-fast path: Pre-execution type inference for '{}' from table '{}' -> {} (OID {})", 
                                               col_name, table, pg_type_str, type_oid);
                                         inferred_types.push(type_oid);
                                         found_type = true;
@@ -1396,15 +1446,15 @@ impl ExtendedQueryHandler {
                                 
                                 if !found_type {
                                     // Default to TEXT if we can't resolve
-                                    info!("Ultra-fast path: Could not infer type for '{}', defaulting to TEXT", col_name);
+                                    debug!("Ultra-fast path: Could not infer type for '{}', defaulting to TEXT", col_name);
                                     inferred_types.push(PgType::Text.to_oid());
                                 }
                             }
                         } else {
-                            info!("Ultra-fast path: Could not find FROM clause in query, cannot parse columns");
+                            debug!("Ultra-fast path: Could not find FROM clause in query, cannot parse columns");
                         }
                         
-                        info!("Ultra-fast path: Inferred {} types", inferred_types.len());
+                        debug!("Ultra-fast path: Inferred {} types", inferred_types.len());
                         inferred_types
                     }
                 } else {
@@ -1561,7 +1611,7 @@ impl ExtendedQueryHandler {
                                     format: 0,
                                 })
                                 .collect();
-                            framed.send(BackendMessage::RowDescription(fields)).await
+                            framed.feed(BackendMessage::RowDescription(fields)).await
                                 .map_err(PgSqliteError::Io)?;
                         }
                         
@@ -1578,18 +1628,18 @@ impl ExtendedQueryHandler {
                                     && let Ok(s) = std::str::from_utf8(value) {
                                         // Check if this is a timestamp value that needs conversion
                                         if *field_type == PgType::Timestamp.to_oid() || *field_type == PgType::Timestamptz.to_oid() {
-                                            info!("  Column {}: TIMESTAMP type OID {}, raw value: '{}'", i, field_type, s);
+                                            debug!("  Column {}: TIMESTAMP type OID {}, raw value: '{}'", i, field_type, s);
                                         } else if *field_type == PgType::Text.to_oid() && s.parse::<i64>().is_ok() {
-                                            info!("  Column {}: TEXT type with numeric value: '{}'", i, s);
+                                            debug!("  Column {}: TEXT type with numeric value: '{}'", i, s);
                                         }
                                     }
                             }
                             let encoded_row = Self::encode_row(&row, &result_formats, &field_types)?;
-                            framed.send(BackendMessage::DataRow(encoded_row)).await
+                            framed.feed(BackendMessage::DataRow(encoded_row)).await
                                 .map_err(PgSqliteError::Io)?;
                         }
                         
-                        framed.send(BackendMessage::CommandComplete { 
+                        framed.feed(BackendMessage::CommandComplete { 
                             tag: format!("SELECT {row_count}") 
                         }).await.map_err(PgSqliteError::Io)?;
                         
@@ -1821,7 +1871,7 @@ impl ExtendedQueryHandler {
         
         // Debug: Check if this is a catalog query
         if final_query.contains("pg_catalog") || final_query.contains("pg_type") {
-            info!("Detected catalog query in extended protocol: {}", final_query);
+            debug!("Detected catalog query in extended protocol: {}", final_query);
         }
         
         // Execute based on query type
@@ -1873,7 +1923,7 @@ impl ExtendedQueryHandler {
     where
         T: tokio::io::AsyncRead + tokio::io::AsyncWrite + Unpin,
     {
-        info!("Describing {} '{}' (type byte: {:02x})", if typ == b'S' { "statement" } else { "portal" }, if name.is_empty() { "<unnamed>" } else { &name }, typ);
+        debug!("Describing {} '{}' (type byte: {:02x})", if typ == b'S' { "statement" } else { "portal" }, if name.is_empty() { "<unnamed>" } else { &name }, typ);
         
         if typ == b'S' {
             // Describe statement
@@ -1893,13 +1943,13 @@ impl ExtendedQueryHandler {
             
             // Then send RowDescription or NoData
             if !stmt.field_descriptions.is_empty() {
-                info!("Sending RowDescription with {} fields in Describe", stmt.field_descriptions.len());
-                framed.send(BackendMessage::RowDescription(stmt.field_descriptions.clone())).await
+                debug!("Sending RowDescription with {} fields in Describe", stmt.field_descriptions.len());
+                framed.feed(stmt.row_description_message()).await
                     .map_err(PgSqliteError::Io)?;
             } else if is_catalog_query && query_starts_with_ignore_case(query, "SELECT") {
                 // For catalog SELECT queries, we need to provide field descriptions
                 // even though we skipped them during Parse
-                info!("Catalog query detected in Describe, generating field descriptions");
+                debug!("Catalog query detected in Describe, generating field descriptions");
                 
                 // Parse the query to extract the selected columns (keep JSON path placeholders for now)
                 let field_descriptions = if let Ok(parsed) = sqlparser::parser::Parser::parse_sql(
@@ -2076,7 +2126,7 @@ impl ExtendedQueryHandler {
                 };
                 
                 if !field_descriptions.is_empty() {
-                    info!("Sending RowDescription with {} catalog fields in Describe", field_descriptions.len());
+                    debug!("Sending RowDescription with {} catalog fields in Describe", field_descriptions.len());
                     
                     // Update the prepared statement with these field descriptions
                     // so they're available during Execute
@@ -2084,20 +2134,21 @@ impl ExtendedQueryHandler {
                     let mut statements_mut = session.prepared_statements.write().await;
                     if let Some(stmt_mut) = statements_mut.get_mut(&name) {
                         stmt_mut.field_descriptions = field_descriptions.clone();
-                        info!("Updated statement '{}' with {} catalog field descriptions", name, field_descriptions.len());
+                        stmt_mut.encoded_row_description = Default::default();
+                        debug!("Updated statement '{}' with {} catalog field descriptions", name, field_descriptions.len());
                     }
                     drop(statements_mut);
                     
-                    framed.send(BackendMessage::RowDescription(field_descriptions)).await
+                    framed.feed(BackendMessage::RowDescription(field_descriptions)).await
                         .map_err(PgSqliteError::Io)?;
                 } else {
                     // Fallback to NoData if we couldn't parse the query
-                    info!("Could not determine catalog fields, sending NoData in Describe");
+                    debug!("Could not determine catalog fields, sending NoData in Describe");
                     framed.send(BackendMessage::NoData).await
                         .map_err(PgSqliteError::Io)?;
                 }
             } else {
-                info!("Sending NoData in Describe");
+                debug!("Sending NoData in Describe");
                 framed.send(BackendMessage::NoData).await
                     .map_err(PgSqliteError::Io)?;
             }
@@ -2114,10 +2165,10 @@ impl ExtendedQueryHandler {
             if !stmt.field_descriptions.is_empty() {
                 // If we have inferred parameter types, update field descriptions for parameter columns
                 let mut fields = stmt.field_descriptions.clone();
-                info!("Describe portal: original fields: {:?}", fields);
+                debug!("Describe portal: original fields: {:?}", fields);
                 if let Some(ref inferred_types) = portal.inferred_param_types {
-                    info!("Describe portal: inferred types available: {:?}", inferred_types);
-                    info!("Describe portal: field count: {}", fields.len());
+                    debug!("Describe portal: inferred types available: {:?}", inferred_types);
+                    debug!("Describe portal: field count: {}", fields.len());
                     
                     // For queries like SELECT $1, $2, $3, each parameter creates a column
                     // The columns might be named NULL, ?column?, or $1, $2, etc.
@@ -2136,11 +2187,11 @@ impl ExtendedQueryHandler {
                             };
                             
                             if let Some(&inferred_type) = inferred_types.get(param_idx) {
-                                info!("Updating column '{}' at index {} (param {}) type from {} to {}", 
+                                debug!("Updating column '{}' at index {} (param {}) type from {} to {}", 
                                       field.name, col_idx, param_idx + 1, field.type_oid, inferred_type);
                                 field.type_oid = inferred_type;
                             } else {
-                                info!("No inferred type for column '{}' at index {} (param {})", 
+                                debug!("No inferred type for column '{}' at index {} (param {})", 
                                       field.name, col_idx, param_idx + 1);
                             }
                             
@@ -2162,7 +2213,7 @@ impl ExtendedQueryHandler {
                     };
                 }
                 
-                info!("Describe portal: sending updated fields: {:?}", fields);
+                debug!("Describe portal: sending updated fields: {:?}", fields);
                 
                 // Update the statement's field_descriptions with the binary format
                 // so we know we've already sent RowDescription with binary format
@@ -2172,10 +2223,11 @@ impl ExtendedQueryHandler {
                 let mut statements = session.prepared_statements.write().await;
                 if let Some(stmt) = statements.get_mut(&statement_name) {
                     stmt.field_descriptions = fields.clone();
+                    stmt.encoded_row_description = Default::default();
                 }
                 drop(statements);
                 
-                framed.send(BackendMessage::RowDescription(fields)).await
+                framed.feed(BackendMessage::RowDescription(fields)).await
                     .map_err(PgSqliteError::Io)?;
             } else {
                 framed.send(BackendMessage::NoData).await
@@ -2195,7 +2247,7 @@ impl ExtendedQueryHandler {
     where
         T: tokio::io::AsyncRead + tokio::io::AsyncWrite + Unpin,
     {
-        info!("Closing {} '{}'", if typ == b'S' { "statement" } else { "portal" }, name);
+        debug!("Closing {} '{}'", if typ == b'S' { "statement" } else { "portal" }, name);
         
         if typ == b'S' {
             // Close statement
@@ -2206,8 +2258,8 @@ impl ExtendedQueryHandler {
             session.portals.write().await.remove(&name);
         }
         
-        // Send CloseComplete
-        framed.send(BackendMessage::CloseComplete).await
+        // Queue CloseComplete; it is flushed on the next Sync or Flush
+        framed.feed(BackendMessage::CloseComplete).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -2279,7 +2331,7 @@ impl ExtendedQueryHandler {
                     crate::query::FastPathOperation::Delete => format!("DELETE {}", response.rows_affected),
                     _ => unreachable!(),
                 };
-                framed.send(BackendMessage::CommandComplete { tag }).await?;
+                framed.feed(BackendMessage::CommandComplete { tag }).await?;
             } else {
                 // SELECT operation - check if we need to send RowDescription
                 if has_binary_row_desc {
@@ -2304,7 +2356,7 @@ impl ExtendedQueryHandler {
                     crate::query::FastPathOperation::Delete => format!("DELETE {}", response.rows_affected),
                     _ => unreachable!(),
                 };
-                framed.send(BackendMessage::CommandComplete { tag }).await?;
+                framed.feed(BackendMessage::CommandComplete { tag }).await?;
             } else {
                 // SELECT operation - check if we need to send RowDescription
                 if has_binary_row_desc {
@@ -2333,7 +2385,7 @@ impl ExtendedQueryHandler {
         let byte_params: Vec<Option<Vec<u8>>> = params.iter().map(|v| {
             match v {
                 rusqlite::types::Value::Null => None,
-                rusqlite::types::Value::Integer(i) => Some(i.to_string().into_bytes()),
+                rusqlite::types::Value::Integer(i) => Some(itoa::Buffer::new().format(*i).as_bytes().to_vec()),
                 rusqlite::types::Value::Real(f) => Some(f.to_string().into_bytes()),
                 rusqlite::types::Value::Text(s) => Some(s.clone().into_bytes()),
                 rusqlite::types::Value::Blob(b) => Some(b.clone()),
@@ -2424,17 +2476,17 @@ impl ExtendedQueryHandler {
             let types = field_types.unwrap();
             for row in response.rows {
                 let encoded_row = Self::encode_row(&row, result_formats, types)?;
-                framed.send(BackendMessage::DataRow(encoded_row)).await?;
+                framed.feed(BackendMessage::DataRow(encoded_row)).await?;
             }
         } else {
             // Send as-is (text format)
             for row in response.rows {
-                framed.send(BackendMessage::DataRow(row)).await?;
+                framed.feed(BackendMessage::DataRow(row)).await?;
             }
         }
         
         // Send CommandComplete
-        framed.send(BackendMessage::CommandComplete { 
+        framed.feed(BackendMessage::CommandComplete { 
             tag: "SELECT".to_string()  // We don't have row count here
         }).await?;
         
@@ -2482,7 +2534,7 @@ impl ExtendedQueryHandler {
                 format,
             });
         }
-        framed.send(BackendMessage::RowDescription(field_descriptions)).await?;
+        framed.feed(BackendMessage::RowDescription(field_descriptions)).await?;
         
         // Check if we need conversion for timestamps OR TEXT columns that might contain timestamps
         let needs_conversion = field_types
@@ -2492,7 +2544,7 @@ impl ExtendedQueryHandler {
                     t == PgType::Timestamptz.to_oid() ||
                     t == PgType::Text.to_oid()  // TEXT columns might contain timestamps
                 );
-                info!("send_select_response: field_types={:?}, needs_conversion={}", types, has_timestamp);
+                debug!("send_select_response: field_types={:?}, needs_conversion={}", types, has_timestamp);
                 has_timestamp
             })
             .unwrap_or(false);
@@ -2538,7 +2590,7 @@ impl ExtendedQueryHandler {
                                         // This is likely a datetime value stored as INTEGER microseconds
                                         use crate::types::datetime_utils::format_microseconds_to_timestamp;
                                         let formatted = format_microseconds_to_timestamp(micros);
-                                        info!("Converting TEXT column timestamp value {} to formatted: {}", micros, formatted);
+                                        debug!("Converting TEXT column timestamp value {} to formatted: {}", micros, formatted);
                                         converted_row.push(Some(formatted.into_bytes()));
                                     } else {
                                         // Not a timestamp, keep as-is
@@ -2558,7 +2610,7 @@ impl ExtendedQueryHandler {
                         converted_row.push(cell.clone());
                     }
                 }
-                framed.send(BackendMessage::DataRow(converted_row)).await?;
+                framed.feed(BackendMessage::DataRow(converted_row)).await?;
             }
         } else {
             // No conversion needed, but still need to apply binary encoding if requested
@@ -2572,18 +2624,18 @@ impl ExtendedQueryHandler {
                 let types = field_types.unwrap();
                 for row in response.rows {
                     let encoded_row = Self::encode_row(&row, result_formats, types)?;
-                    framed.send(BackendMessage::DataRow(encoded_row)).await?;
+                    framed.feed(BackendMessage::DataRow(encoded_row)).await?;
                 }
             } else {
                 // Send as-is (text format)
                 for row in response.rows {
-                    framed.send(BackendMessage::DataRow(row)).await?;
+                    framed.feed(BackendMessage::DataRow(row)).await?;
                 }
             }
         }
         
         // Send CommandComplete
-        framed.send(BackendMessage::CommandComplete { tag: format!("SELECT {}", response.rows_affected) }).await?;
+        framed.feed(BackendMessage::CommandComplete { tag: format!("SELECT {}", response.rows_affected) }).await?;
         
         Ok(())
     }
@@ -2596,7 +2648,7 @@ impl ExtendedQueryHandler {
             let format = formats.get(i).copied().unwrap_or(0); // Default to text format
             let param_type = param_types.get(i).copied().unwrap_or(PgType::Text.to_oid()); // Default to text
             
-            info!("Processing parameter {}: format={}, type_oid={}, bytes_len={}", 
+            debug!("Processing parameter {}: format={}, type_oid={}, bytes_len={}", 
                 i + 1, format, param_type, 
                 value.as_ref().map(|v| v.len()).unwrap_or(0));
             
@@ -2610,7 +2662,7 @@ impl ExtendedQueryHandler {
                                 // int2 (smallint)
                                 if bytes.len() == 2 {
                                     let value = i16::from_be_bytes([bytes[0], bytes[1]]);
-                                    info!("Decoded binary int16 parameter {}: {}", i + 1, value);
+                                    debug!("Decoded binary int16 parameter {}: {}", i + 1, value);
                                     value.to_string()
                                 } else {
                                     format!("X'{}'", hex::encode(bytes))
@@ -2620,12 +2672,12 @@ impl ExtendedQueryHandler {
                                 // int4 - but sometimes PostgreSQL sends int2 with int4 type OID
                                 if bytes.len() == 4 {
                                     let value = i32::from_be_bytes([bytes[0], bytes[1], bytes[2], bytes[3]]);
-                                    info!("Decoded binary int32 parameter {}: {}", i + 1, value);
+                                    debug!("Decoded binary int32 parameter {}: {}", i + 1, value);
                                     value.to_string()
                                 } else if bytes.len() == 2 {
                                     // Actually int2 but with int4 type OID
                                     let value = i16::from_be_bytes([bytes[0], bytes[1]]);
-                                    info!("Decoded binary int16 (as int4) parameter {}: {}", i + 1, value);
+                                    debug!("Decoded binary int16 (as int4) parameter {}: {}", i + 1, value);
                                     value.to_string()
                                 } else {
                                     format!("X'{}'", hex::encode(bytes))
@@ -2638,7 +2690,7 @@ impl ExtendedQueryHandler {
                                         bytes[0], bytes[1], bytes[2], bytes[3],
                                         bytes[4], bytes[5], bytes[6], bytes[7]
                                     ]);
-                                    info!("Decoded binary int64 parameter {}: {}", i + 1, value);
+                                    debug!("Decoded binary int64 parameter {}: {}", i + 1, value);
                                     value.to_string()
                                 } else {
                                     format!("X'{}'", hex::encode(bytes))
@@ -2653,7 +2705,7 @@ impl ExtendedQueryHandler {
                                     ]);
                                     let dollars = cents as f64 / 100.0;
                                     let formatted = format!("'${dollars:.2}'");
-                                    info!("Decoded binary money parameter {}: {} cents -> {}", i + 1, cents, formatted);
+                                    debug!("Decoded binary money parameter {}: {} cents -> {}", i + 1, cents, formatted);
                                     formatted
                                 } else {
                                     format!("X'{}'", hex::encode(bytes))
@@ -2664,7 +2716,7 @@ impl ExtendedQueryHandler {
                                 match DecimalHandler::decode_numeric(bytes) {
                                     Ok(decimal) => {
                                         let s = decimal.to_string();
-                                        info!("Decoded binary numeric parameter {}: {}", i + 1, s);
+                                        debug!("Decoded binary numeric parameter {}: {}", i + 1, s);
                                         format!("'{}'", s.replace('\'', "''"))
                                     }
                                     Err(e) => {
@@ -2682,7 +2734,7 @@ impl ExtendedQueryHandler {
                                     }
                                     Err(_) => {
                                         // Invalid UTF-8, treat as blob
-                                        info!("Failed to decode as UTF-8, treating as blob. Hex: {}", hex::encode(bytes));
+                                        debug!("Failed to decode as UTF-8, treating as blob. Hex: {}", hex::encode(bytes));
                                         format!("X'{}'", hex::encode(bytes))
                                     }
                                 }
@@ -2699,7 +2751,7 @@ impl ExtendedQueryHandler {
                                     const PG_EPOCH_OFFSET: i64 = 946684800 * 1_000_000; // microseconds between 1970-01-01 and 2000-01-01
                                     let unix_micros = pg_micros + PG_EPOCH_OFFSET;
                                     
-                                    info!("Decoded binary timestamp parameter {}: {} PG microseconds = {} Unix microseconds", 
+                                    debug!("Decoded binary timestamp parameter {}: {} PG microseconds = {} Unix microseconds", 
                                           i + 1, pg_micros, unix_micros);
                                     
                                     // Check if this is a VALUES clause that will be rewritten
@@ -2712,7 +2764,7 @@ impl ExtendedQueryHandler {
                                         if let Some(dt) = chrono::DateTime::from_timestamp(seconds, nanos).map(|dt| dt.naive_utc()) {
                                             // Format as ISO timestamp string for VALUES clause
                                             let formatted = dt.format("%Y-%m-%d %H:%M:%S%.6f").to_string();
-                                            info!("VALUES clause detected - formatting timestamp as: {}", formatted);
+                                            debug!("VALUES clause detected - formatting timestamp as: {}", formatted);
                                             format!("'{formatted}'")
                                         } else {
                                             // Fallback to raw microseconds if conversion fails
@@ -2730,7 +2782,7 @@ impl ExtendedQueryHandler {
                                 // date - int4 days since epoch
                                 if bytes.len() == 4 {
                                     let days = i32::from_be_bytes([bytes[0], bytes[1], bytes[2], bytes[3]]);
-                                    info!("Decoded binary date parameter {}: {} days", i + 1, days);
+                                    debug!("Decoded binary date parameter {}: {} days", i + 1, days);
                                     days.to_string()
                                 } else {
                                     format!("X'{}'", hex::encode(bytes))
@@ -2743,7 +2795,7 @@ impl ExtendedQueryHandler {
                                         bytes[0], bytes[1], bytes[2], bytes[3],
                                         bytes[4], bytes[5], bytes[6], bytes[7]
                                     ]);
-                                    info!("Decoded binary time parameter {}: {} microseconds", i + 1, micros);
+                                    debug!("Decoded binary time parameter {}: {} microseconds", i + 1, micros);
                                     micros.to_string()
                                 } else {
                                     format!("X'{}'", hex::encode(bytes))
@@ -2753,17 +2805,17 @@ impl ExtendedQueryHandler {
                                 // No type specified - try to infer from byte pattern
                                 if bytes.len() == 1 && (bytes[0] == 0 || bytes[0] == 1) {
                                     // Single byte 0 or 1 - likely boolean
-                                    info!("Inferred boolean parameter {}: {}", i + 1, bytes[0]);
+                                    debug!("Inferred boolean parameter {}: {}", i + 1, bytes[0]);
                                     bytes[0].to_string()
                                 } else if bytes.len() == 2 {
                                     // Two bytes - likely int2
                                     let value = i16::from_be_bytes([bytes[0], bytes[1]]);
-                                    info!("Inferred int16 parameter {}: {}", i + 1, value);
+                                    debug!("Inferred int16 parameter {}: {}", i + 1, value);
                                     value.to_string()
                                 } else if bytes.len() == 4 {
                                     // Four bytes - likely int4
                                     let value = i32::from_be_bytes([bytes[0], bytes[1], bytes[2], bytes[3]]);
-                                    info!("Inferred int32 parameter {}: {}", i + 1, value);
+                                    debug!("Inferred int32 parameter {}: {}", i + 1, value);
                                     value.to_string()
                                 } else if bytes.len() == 8 {
                                     // Eight bytes - could be int8 or float8
@@ -2772,17 +2824,17 @@ impl ExtendedQueryHandler {
                                         bytes[0], bytes[1], bytes[2], bytes[3],
                                         bytes[4], bytes[5], bytes[6], bytes[7]
                                     ]);
-                                    info!("Inferred float64 parameter {} (unknown type): {}", i + 1, value);
+                                    debug!("Inferred float64 parameter {} (unknown type): {}", i + 1, value);
                                     value.to_string()
                                 } else {
                                     // Unknown pattern - use hex
-                                    info!("Unknown binary parameter type OID 0 for parameter {}, bytes: {}", i + 1, hex::encode(bytes));
+                                    debug!("Unknown binary parameter type OID 0 for parameter {}, bytes: {}", i + 1, hex::encode(bytes));
                                     format!("X'{}'", hex::encode(bytes))
                                 }
                             }
                             _ => {
                                 // Other binary data - treat as blob
-                                info!("Unknown binary parameter type OID {} for parameter {}, bytes: {}", param_type, i + 1, hex::encode(bytes));
+                                debug!("Unknown binary parameter type OID {} for parameter {}, bytes: {}", param_type, i + 1, hex::encode(bytes));
                                 format!("X'{}'", hex::encode(bytes))
                             }
                         }
@@ -2895,7 +2947,7 @@ impl ExtendedQueryHandler {
         // Handle SQLAlchemy's VALUES pattern which uses p0, p1, etc. column references
         // This pattern needs to be completely rewritten for SQLite
         if result.contains("SELECT CAST(p0") && result.contains("FROM (VALUES") {
-            info!("Detected SQLAlchemy VALUES pattern, attempting to rewrite");
+            debug!("Detected SQLAlchemy VALUES pattern, attempting to rewrite");
             
             // Find the positions of key parts
             if let (Some(table_start), Some(values_start), Some(values_end)) = (
@@ -2968,7 +3020,7 @@ impl ExtendedQueryHandler {
                         let values_str = cast_regex.replace_all(&values_str, "").to_string();
                         
                         let new_query = format!("INSERT INTO {table_name} {columns} VALUES {values_str}{returning_clause}");
-                        info!("Rewrote SQLAlchemy VALUES pattern to: {}", new_query);
+                        debug!("Rewrote SQLAlchemy VALUES pattern to: {}", new_query);
                         return Ok(new_query);
                     }
                 }
@@ -3373,7 +3425,7 @@ impl ExtendedQueryHandler {
             }
         }
         
-        let mut encoded_row = Vec::new();
+        let mut encoded_row = Vec::with_capacity(row.len());
         
         for (i, value) in row.iter().enumerate() {
             // If result_formats has only one element, it applies to all columns
@@ -3393,7 +3445,7 @@ impl ExtendedQueryHandler {
                         match type_oid {
                             t if t == PgType::Bool.to_oid() => {
                                 // bool - convert text to binary
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     let val = match s.trim() {
                                         "1" | "t" | "true" | "TRUE" | "T" => 1u8,
                                         "0" | "f" | "false" | "FALSE" | "F" => 0u8,
@@ -3410,7 +3462,7 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Int2.to_oid() => {
                                 // int2 - convert text to binary
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     // Handle empty string as NULL
                                     if s.trim().is_empty() {
                                         None
@@ -3428,7 +3480,7 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Int4.to_oid() => {
                                 // int4 - convert text to binary
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     // Handle empty string as NULL
                                     if s.trim().is_empty() {
                                         None
@@ -3446,7 +3498,7 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Int8.to_oid() => {
                                 // int8 - convert text to binary
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     // Handle empty string as NULL
                                     if s.trim().is_empty() {
                                         None
@@ -3464,7 +3516,7 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Float4.to_oid() => {
                                 // float4 - convert text to binary
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     if let Ok(val) = s.parse::<f32>() {
                                         let mut buf = vec![0u8; 4];
                                         BigEndian::write_f32(&mut buf, val);
@@ -3478,7 +3530,7 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Float8.to_oid() => {
                                 // float8 - convert text to binary
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     if let Ok(val) = s.parse::<f64>() {
                                         let mut buf = vec![0u8; 8];
                                         BigEndian::write_f64(&mut buf, val);
@@ -3496,8 +3548,8 @@ impl ExtendedQueryHandler {
                             // 3. Binary array encoding is not implemented
                             t if t == PgType::Uuid.to_oid() => {
                                 // uuid - convert text to binary (16 bytes)
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
-                                    if let Ok(uuid_bytes) = crate::types::uuid::UuidHandler::uuid_to_bytes(&s) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
+                                    if let Ok(uuid_bytes) = crate::types::uuid::UuidHandler::uuid_to_bytes(s) {
                                         Some(uuid_bytes)
                                     } else {
                                         Some(bytes.clone())
@@ -3509,7 +3561,7 @@ impl ExtendedQueryHandler {
                             // Date types
                             t if t == PgType::Date.to_oid() => {
                                 // date - days since 2000-01-01 as int4
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     // Check if this is already an integer (days since 1970)
                                     if let Ok(days_since_1970) = s.parse::<i32>() {
                                         // Convert from days since 1970 to days since 2000
@@ -3517,7 +3569,7 @@ impl ExtendedQueryHandler {
                                         let mut buf = vec![0u8; 4];
                                         BigEndian::write_i32(&mut buf, days_since_2000);
                                         Some(buf)
-                                    } else if let Some(days) = Self::date_to_pg_days(&s) {
+                                    } else if let Some(days) = Self::date_to_pg_days(s) {
                                         // Handle date strings like "2025-01-01" 
                                         let mut buf = vec![0u8; 4];
                                         BigEndian::write_i32(&mut buf, days);
@@ -3532,14 +3584,14 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Time.to_oid() => {
                                 // time - microseconds since midnight as int8
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     // First check if this is already an integer (microseconds since midnight)
                                     if let Ok(micros) = s.parse::<i64>() {
                                         // Already in microseconds format
                                         let mut buf = vec![0u8; 8];
                                         BigEndian::write_i64(&mut buf, micros);
                                         Some(buf)
-                                    } else if let Some(micros) = Self::time_to_microseconds(&s) {
+                                    } else if let Some(micros) = Self::time_to_microseconds(s) {
                                         let mut buf = vec![0u8; 8];
                                         BigEndian::write_i64(&mut buf, micros);
                                         Some(buf)
@@ -3553,7 +3605,7 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Timestamp.to_oid() || t == PgType::Timestamptz.to_oid() => {
                                 // timestamp/timestamptz - microseconds since 2000-01-01 as int8
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     // First check if this is already an integer (microseconds since Unix epoch)
                                     if let Ok(unix_micros) = s.parse::<i64>() {
                                         // Convert from Unix epoch (1970-01-01) to PostgreSQL epoch (2000-01-01)
@@ -3562,7 +3614,7 @@ impl ExtendedQueryHandler {
                                         let mut buf = vec![0u8; 8];
                                         BigEndian::write_i64(&mut buf, pg_micros);
                                         Some(buf)
-                                    } else if let Some(micros) = Self::timestamp_to_pg_microseconds(&s) {
+                                    } else if let Some(micros) = Self::timestamp_to_pg_microseconds(s) {
                                         let mut buf = vec![0u8; 8];
                                         BigEndian::write_i64(&mut buf, micros);
                                         Some(buf)
@@ -3576,9 +3628,9 @@ impl ExtendedQueryHandler {
                             }
                             // Numeric type - use proper binary encoding when requested
                             t if t == PgType::Numeric.to_oid() => {
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     // Try to parse and encode as PostgreSQL numeric binary format
-                                    if let Ok(decimal) = rust_decimal::Decimal::from_str(&s) {
+                                    if let Ok(decimal) = rust_decimal::Decimal::from_str(s) {
                                         debug!("Encoding NUMERIC value '{}' as binary", s);
                                         Some(crate::protocol::binary::BinaryEncoder::encode_numeric(&decimal))
                                     } else {
@@ -3593,7 +3645,7 @@ impl ExtendedQueryHandler {
                             // Money type
                             t if t == PgType::Money.to_oid() => {
                                 // money - int8 representing cents (amount * 100)
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     // Remove currency symbols and convert to cents
                                     let cleaned = s.trim_start_matches('$').replace(',', "");
                                     if let Ok(val) = cleaned.parse::<f64>() {
@@ -3611,8 +3663,8 @@ impl ExtendedQueryHandler {
                             // Network types
                             t if t == PgType::Cidr.to_oid() || t == PgType::Inet.to_oid() => {
                                 // cidr/inet - family(1) + bits(1) + is_cidr(1) + nb(1) + address bytes
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
-                                    if let Some(inet_bytes) = Self::parse_inet(&s) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
+                                    if let Some(inet_bytes) = Self::parse_inet(s) {
                                         Some(inet_bytes)
                                     } else {
                                         // If parsing fails, keep as text
@@ -3624,8 +3676,8 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Macaddr.to_oid() => {
                                 // macaddr - 6 bytes
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
-                                    if let Some(mac_bytes) = Self::parse_macaddr(&s) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
+                                    if let Some(mac_bytes) = Self::parse_macaddr(s) {
                                         Some(mac_bytes)
                                     } else {
                                         // If parsing fails, keep as text
@@ -3637,8 +3689,8 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Macaddr8.to_oid() => {
                                 // macaddr8 - 8 bytes
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
-                                    if let Some(mac_bytes) = Self::parse_macaddr8(&s) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
+                                    if let Some(mac_bytes) = Self::parse_macaddr8(s) {
                                         Some(mac_bytes)
                                     } else {
                                         // If parsing fails, keep as text
@@ -3651,8 +3703,8 @@ impl ExtendedQueryHandler {
                             // Bit string types
                             t if t == PgType::Bit.to_oid() || t == PgType::Varbit.to_oid() => {
                                 // bit/varbit - length(int4) + bit data
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
-                                    if let Some(bit_bytes) = Self::parse_bit_string(&s) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
+                                    if let Some(bit_bytes) = Self::parse_bit_string(s) {
                                         Some(bit_bytes)
                                     } else {
                                         // If parsing fails, keep as text
@@ -3665,8 +3717,8 @@ impl ExtendedQueryHandler {
                             // Range types
                             t if t == PgType::Int4range.to_oid() => {
                                 // int4range
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
-                                    if let Some(range_bytes) = Self::encode_range(&s, PgType::Int4.to_oid()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
+                                    if let Some(range_bytes) = Self::encode_range(s, PgType::Int4.to_oid()) {
                                         Some(range_bytes)
                                     } else {
                                         // If parsing fails, keep as text
@@ -3678,8 +3730,8 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Int8range.to_oid() => {
                                 // int8range
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
-                                    if let Some(range_bytes) = Self::encode_range(&s, PgType::Int8.to_oid()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
+                                    if let Some(range_bytes) = Self::encode_range(s, PgType::Int8.to_oid()) {
                                         Some(range_bytes)
                                     } else {
                                         // If parsing fails, keep as text
@@ -3691,8 +3743,8 @@ impl ExtendedQueryHandler {
                             }
                             t if t == PgType::Numrange.to_oid() => {
                                 // numrange
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
-                                    if let Some(range_bytes) = Self::encode_range(&s, PgType::Numeric.to_oid()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
+                                    if let Some(range_bytes) = Self::encode_range(s, PgType::Numeric.to_oid()) {
                                         Some(range_bytes)
                                     } else {
                                         // If parsing fails, keep as text
@@ -3726,7 +3778,7 @@ impl ExtendedQueryHandler {
                             // Small integers
                             t if t == PgType::Int2.to_oid() => {
                                 // int2 - convert text to binary
-                                if let Ok(s) = String::from_utf8(bytes.clone()) {
+                                if let Ok(s) = std::str::from_utf8(bytes) {
                                     if let Ok(val) = s.parse::<i16>() {
                                         let mut buf = vec![0u8; 2];
                                         BigEndian::write_i16(&mut buf, val);
@@ -3821,21 +3873,21 @@ impl ExtendedQueryHandler {
                             t if t == PgType::Text.to_oid() => {
                                 // Enhanced datetime detection for TEXT columns
                                 if let Ok(s) = String::from_utf8(bytes.clone()) {
-                                    info!("TEXT column value: '{}'", s);
+                                    debug!("TEXT column value: '{}'", s);
                                     if let Ok(micros) = s.parse::<i64>() {
-                                        info!("Parsed as i64: {}", micros);
+                                        debug!("Parsed as i64: {}", micros);
                                         // Check if this looks like microseconds since epoch
                                         // Valid timestamp range: roughly 1970-2100 (0 to ~4.1 trillion microseconds)
                                         // We check for values > 100 billion to avoid converting small integers
                                         if micros > 100_000_000_000 && micros < 4_102_444_800_000_000 {
-                                            info!("Value {} is in timestamp range, converting...", micros);
+                                            debug!("Value {} is in timestamp range, converting...", micros);
                                             // This is likely a datetime value stored as INTEGER microseconds, format it
                                             use crate::types::datetime_utils::format_microseconds_to_timestamp;
                                             let formatted = format_microseconds_to_timestamp(micros);
-                                            info!("Converting presumed timestamp value {} to formatted timestamp: {}", micros, formatted);
+                                            debug!("Converting presumed timestamp value {} to formatted timestamp: {}", micros, formatted);
                                             Some(formatted.into_bytes())
                                         } else {
-                                            info!("Value {} is not in timestamp range", micros);
+                                            debug!("Value {} is not in timestamp range", micros);
                                             Some(bytes.clone())
                                         }
                                     } else {
@@ -3872,9 +3924,9 @@ impl ExtendedQueryHandler {
         T: tokio::io::AsyncRead + tokio::io::AsyncWrite + Unpin,
     {
         // Check if this is a catalog query first
-        info!("execute_select: Checking if query is catalog query: {}", query);
+        debug!("execute_select: Checking if query is catalog query: {}", query);
         let response = if let Some(catalog_result) = CatalogInterceptor::intercept_query(query, db.clone(), Some(session.clone())).await {
-            info!("execute_select: Query intercepted by catalog handler");
+            debug!("execute_select: Query intercepted by catalog handler");
             let mut catalog_response = catalog_result?;
             
             // For catalog queries with binary result formats, we need to ensure the data
@@ -3885,7 +3937,7 @@ impl ExtendedQueryHandler {
             drop(portals);
             
             if has_binary_format && query.contains("pg_attribute") {
-                info!("Converting catalog text data for binary encoding");
+                debug!("Converting catalog text data for binary encoding");
                 // pg_attribute specific handling - ensure numeric columns are properly formatted
                 for row in &mut catalog_response.rows {
                     // attnum is at index 5
@@ -3900,7 +3952,7 @@ impl ExtendedQueryHandler {
             
             catalog_response
         } else {
-            info!("Query not intercepted, executing normally");
+            debug!("Query not intercepted, executing normally");
             let cached_conn = Self::get_or_cache_connection(session, db).await;
             db.query_with_session_cached(query, &session.id, cached_conn.as_ref()).await?
         };
@@ -3981,7 +4033,7 @@ impl ExtendedQueryHandler {
                                             // Only use if it's the same table we identified
                                             if src_table_name == table
                                                 && let Ok(Some(pg_type)) = db.get_schema_type_with_session(&session.id, table, src_col_name).await {
-                                                    info!("Found type for aliased column '{}' from query pattern '{}.{}': {}", col_name, src_table_name, src_col_name, pg_type);
+                                                    debug!("Found type for aliased column '{}' from query pattern '{}.{}': {}", col_name, src_table_name, src_col_name, pg_type);
                                                     schema_types.insert(col_name.clone(), pg_type);
                                                 }
                                         }
@@ -4028,7 +4080,7 @@ impl ExtendedQueryHandler {
                                         // Now we can look up the type with the session connection
                                         if let Ok(Some(pg_type)) = db.get_schema_type_with_session(&session.id, table, col_name_inner).await {
                                             let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type);
-                                            info!("Scalar subquery MAX({}) from table {} has type {} (OID {})", 
+                                            debug!("Scalar subquery MAX({}) from table {} has type {} (OID {})", 
                                                   col_name_inner, table, pg_type, type_oid);
                                             aggregate_types.insert(idx, type_oid);
                                             continue;
@@ -4047,7 +4099,7 @@ impl ExtendedQueryHandler {
                                     if let Some(ref table) = lookup_table
                                         && let Ok(Some(pg_type)) = db.get_schema_type_with_session(&session.id, table, col_name_inner).await {
                                             let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type);
-                                            info!("Scalar subquery MIN({}) from table {} has type {} (OID {})", 
+                                            debug!("Scalar subquery MIN({}) from table {} has type {} (OID {})", 
                                                   col_name_inner, table, pg_type, type_oid);
                                             aggregate_types.insert(idx, type_oid);
                                             continue;
@@ -4079,7 +4131,7 @@ impl ExtendedQueryHandler {
                                 
                                 if let Some(idx) = param_idx
                                     && let Some(&type_oid) = inferred_types.get(idx) {
-                                        info!("Column '{}' is parameter with inferred type OID {}", col_name, type_oid);
+                                        debug!("Column '{}' is parameter with inferred type OID {}", col_name, type_oid);
                                         return type_oid;
                                     }
                             }
@@ -4089,13 +4141,13 @@ impl ExtendedQueryHandler {
                         if let Some(pg_type) = schema_types.get(col_name) {
                             // Use basic type OID mapping (enum checking would require async which isn't allowed in closure)
                             let oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(pg_type);
-                            info!("Column '{}' found in schema as type '{}' (OID {})", col_name, pg_type, oid);
+                            debug!("Column '{}' found in schema as type '{}' (OID {})", col_name, pg_type, oid);
                             return oid;
                         }
                         
                         // Second priority: Check for pre-computed aggregate functions
                         if let Some(&type_oid) = aggregate_types.get(&i) {
-                            info!("Column '{}' has pre-computed aggregate type OID {}", col_name, type_oid);
+                            debug!("Column '{}' has pre-computed aggregate type OID {}", col_name, type_oid);
                             return type_oid;
                         }
                         
@@ -4104,7 +4156,7 @@ impl ExtendedQueryHandler {
                         if let Some(oid) = crate::types::SchemaTypeMapper::get_aggregate_return_type_with_query(
                             &col_lower, None, table_name.as_deref(), Some(query)
                         ) {
-                            info!("Column '{}' is aggregate function with type OID {}", col_name, oid);
+                            debug!("Column '{}' is aggregate function with type OID {}", col_name, oid);
                             return oid;
                         }
                         
@@ -4184,8 +4236,8 @@ impl ExtendedQueryHandler {
                 fields
             };
             
-            info!("Sending RowDescription with {} fields during Execute with inferred types", fields.len());
-            framed.send(BackendMessage::RowDescription(fields)).await
+            debug!("Sending RowDescription with {} fields during Execute with inferred types", fields.len());
+            framed.feed(BackendMessage::RowDescription(fields)).await
                 .map_err(PgSqliteError::Io)?;
         }
         
@@ -4207,7 +4259,7 @@ impl ExtendedQueryHandler {
                     let col_lower = col_name.to_lowercase();
                     
                     if let Some(oid) = crate::types::SchemaTypeMapper::get_aggregate_return_type_with_query(&col_lower, None, None, Some(&portal.query)) {
-                        info!("Column '{}' is aggregate function with type OID {} (field_types)", col_name, oid);
+                        debug!("Column '{}' is aggregate function with type OID {} (field_types)", col_name, oid);
                         field_types.push(oid);
                         continue;
                     }
@@ -4220,7 +4272,7 @@ impl ExtendedQueryHandler {
                         if let Some((source_table, source_col)) = Self::extract_source_table_column_for_alias(&portal.query, col_name) {
                             if let Ok(Some(pg_type_str)) = db.get_schema_type_with_session(&session.id, &source_table, &source_col).await {
                                 let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type_str);
-                                info!("Column '{}': resolved type from schema '{}.{}' -> {} (OID {}) in execute_select", 
+                                debug!("Column '{}': resolved type from schema '{}.{}' -> {} (OID {}) in execute_select", 
                                       col_name, source_table, source_col, pg_type_str, type_oid);
                                 field_types.push(type_oid);
                                 found_type = true;
@@ -4231,22 +4283,22 @@ impl ExtendedQueryHandler {
                             if parts.len() == 2 {
                                 let table_part = parts[0];
                                 let column_part = parts[1];
-                                info!("Column '{}': Attempting to resolve type from '{}.{}'", col_name, table_part, column_part);
+                                debug!("Column '{}': Attempting to resolve type from '{}.{}'", col_name, table_part, column_part);
                                 if let Ok(Some(pg_type_str)) = db.get_schema_type_with_session(&session.id, table_part, column_part).await {
                                     let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type_str);
-                                    info!("Column '{}': resolved type from schema '{}.{}' -> {} (OID {}) in execute_select", 
+                                    debug!("Column '{}': resolved type from schema '{}.{}' -> {} (OID {}) in execute_select", 
                                           col_name, table_part, column_part, pg_type_str, type_oid);
                                     field_types.push(type_oid);
                                     found_type = true;
                                 } else {
-                                    info!("Column '{}': Could not find type for '{}.{}'", col_name, table_part, column_part);
+                                    debug!("Column '{}': Could not find type for '{}.{}'", col_name, table_part, column_part);
                                 }
                             } else {
-                                info!("Column '{}': Contains dot but not in expected format", col_name);
+                                debug!("Column '{}': Contains dot but not in expected format", col_name);
                             }
                         } else if let Ok(Some(pg_type_str)) = db.get_schema_type_with_session(&session.id, table, col_name).await {
                             let type_oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type_str);
-                            info!("Column '{}': resolved type from schema '{}.{}' -> {} (OID {}) in execute_select", 
+                            debug!("Column '{}': resolved type from schema '{}.{}' -> {} (OID {}) in execute_select", 
                                   col_name, table, col_name, pg_type_str, type_oid);
                             field_types.push(type_oid);
                             found_type = true;
@@ -4265,7 +4317,7 @@ impl ExtendedQueryHandler {
                             25 // text default when no data
                         };
                         
-                        info!("Column '{}' inferred as type OID {} (field_types)", col_name, type_oid);
+                        debug!("Column '{}' inferred as type OID {} (field_types)", col_name, type_oid);
                         field_types.push(type_oid);
                     }
                 }
@@ -4335,11 +4387,11 @@ impl ExtendedQueryHandler {
         
         // Debug logging for catalog queries
         if query.contains("pg_catalog") || query.contains("pg_attribute") {
-            info!("Catalog query data encoding:");
-            info!("  Result formats: {:?}", result_formats);
-            info!("  Field types: {:?}", field_types);
+            debug!("Catalog query data encoding:");
+            debug!("  Result formats: {:?}", result_formats);
+            debug!("  Field types: {:?}", field_types);
             if !rows_to_send.is_empty() {
-                info!("  First row has {} columns", rows_to_send[0].len());
+                debug!("  First row has {} columns", rows_to_send[0].len());
                 for (i, col) in rows_to_send[0].iter().enumerate() {
                     if let Some(data) = col {
                         let preview = if data.len() <= 10 {
@@ -4347,9 +4399,9 @@ impl ExtendedQueryHandler {
                         } else {
                             format!("{:?}... ({} bytes)", &data[..10], data.len())
                         };
-                        info!("    Col {}: {}", i, preview);
+                        debug!("    Col {}: {}", i, preview);
                     } else {
-                        info!("    Col {}: NULL", i);
+                        debug!("    Col {}: NULL", i);
                     }
                 }
             }
@@ -4358,7 +4410,7 @@ impl ExtendedQueryHandler {
         for row in rows_to_send {
             // Convert row data based on result formats
             let encoded_row = Self::encode_row(&row, &result_formats, &field_types)?;
-            framed.send(BackendMessage::DataRow(encoded_row)).await
+            framed.feed(BackendMessage::DataRow(encoded_row)).await
                 .map_err(PgSqliteError::Io)?;
         }
         
@@ -4388,7 +4440,7 @@ impl ExtendedQueryHandler {
             } else {
                 sent_count
             });
-            framed.send(BackendMessage::CommandComplete { tag }).await
+            framed.feed(BackendMessage::CommandComplete { tag }).await
                 .map_err(PgSqliteError::Io)?;
         }
         
@@ -4433,7 +4485,7 @@ impl ExtendedQueryHandler {
             format!("OK {}", response.rows_affected)
         };
         
-        framed.send(BackendMessage::CommandComplete { tag }).await
+        framed.feed(BackendMessage::CommandComplete { tag }).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -4628,7 +4680,7 @@ impl ExtendedQueryHandler {
                 &returning_clause,
             ).await;
             
-            framed.send(BackendMessage::RowDescription(fields)).await
+            framed.feed(BackendMessage::RowDescription(fields)).await
                 .map_err(PgSqliteError::Io)?;
             
             // Convert timestamps and send data rows
@@ -4641,13 +4693,13 @@ impl ExtendedQueryHandler {
             ).await?;
             
             for row in converted_rows {
-                framed.send(BackendMessage::DataRow(row)).await
+                framed.feed(BackendMessage::DataRow(row)).await
                     .map_err(PgSqliteError::Io)?;
             }
             
             // Send command complete
             let tag = format!("INSERT 0 {}", response.rows_affected);
-            framed.send(BackendMessage::CommandComplete { tag }).await
+            framed.feed(BackendMessage::CommandComplete { tag }).await
                 .map_err(PgSqliteError::Io)?;
         } else if query_starts_with_ignore_case(&base_query, "UPDATE") {
             // For UPDATE, we need a different approach
@@ -4690,7 +4742,7 @@ impl ExtendedQueryHandler {
                     &returning_clause,
                 ).await;
                 
-                framed.send(BackendMessage::RowDescription(fields)).await
+                framed.feed(BackendMessage::RowDescription(fields)).await
                     .map_err(PgSqliteError::Io)?;
                 
                 // Convert timestamps and send data rows
@@ -4703,14 +4755,14 @@ impl ExtendedQueryHandler {
                 ).await?;
                 
                 for row in converted_rows {
-                    framed.send(BackendMessage::DataRow(row)).await
+                    framed.feed(BackendMessage::DataRow(row)).await
                         .map_err(PgSqliteError::Io)?;
                 }
             }
             
             // Send command complete
             let tag = format!("UPDATE {}", response.rows_affected);
-            framed.send(BackendMessage::CommandComplete { tag }).await
+            framed.feed(BackendMessage::CommandComplete { tag }).await
                 .map_err(PgSqliteError::Io)?;
         } else if query_starts_with_ignore_case(&base_query, "DELETE") {
             // For DELETE, capture rows before deletion
@@ -4746,7 +4798,7 @@ impl ExtendedQueryHandler {
                 &returning_clause,
             ).await;
             
-            framed.send(BackendMessage::RowDescription(fields)).await
+            framed.feed(BackendMessage::RowDescription(fields)).await
                 .map_err(PgSqliteError::Io)?;
             
             // Convert timestamps in captured rows (skip rowid column)
@@ -4764,13 +4816,13 @@ impl ExtendedQueryHandler {
             
             // Send converted rows
             for row in converted_rows {
-                framed.send(BackendMessage::DataRow(row)).await
+                framed.feed(BackendMessage::DataRow(row)).await
                     .map_err(PgSqliteError::Io)?;
             }
             
             // Send command complete
             let tag = format!("DELETE {}", response.rows_affected);
-            framed.send(BackendMessage::CommandComplete { tag }).await
+            framed.feed(BackendMessage::CommandComplete { tag }).await
                 .map_err(PgSqliteError::Io)?;
         }
         
@@ -4816,6 +4868,7 @@ impl ExtendedQueryHandler {
             // Execute the translated CREATE TABLE
             let cached_conn = Self::get_or_cache_connection(session, db).await;
             db.execute_with_session_cached(&sqlite_sql, &session.id, cached_conn.as_ref()).await?;
+            session.mark_schema_changed().await;
             
             // Store the type mappings if we have any
             debug!("Type mappings count: {}", type_mappings.len());
@@ -4870,7 +4923,7 @@ impl ExtendedQueryHandler {
                                     let cached_conn = Self::get_or_cache_connection(session, db).await;
                                     match db.execute_with_session_cached(&constraint_query, &session.id, cached_conn.as_ref()).await {
                                         Ok(_) => {
-                                            info!("Stored numeric constraint: {}.{} precision={} scale={}", table_name, parts[1], precision, scale);
+                                            debug!("Stored numeric constraint: {}.{} precision={} scale={}", table_name, parts[1], precision, scale);
                                         }
                                         Err(_) => {
                                             // Failed to store numeric constraint
@@ -4901,7 +4954,7 @@ impl ExtendedQueryHandler {
                                         Some(format!("Failed to create enum triggers: {e}"))
                                     ))?;
                                 
-                                info!("Created ENUM validation triggers for {}.{} (type: {})", table_name, column_name, enum_type);
+                                debug!("Created ENUM validation triggers for {}.{} (type: {})", table_name, column_name, enum_type);
                             }
                             Ok::<(), rusqlite::Error>(())
                         }).await
@@ -4931,7 +4984,7 @@ impl ExtendedQueryHandler {
                                     rusqlite::params![table_name, column_name, element_type, dimensions]
                                 )?;
                                 
-                                info!("Stored array column metadata for {}.{} (element_type: {}, dimensions: {})", 
+                                debug!("Stored array column metadata for {}.{} (element_type: {}, dimensions: {})", 
                                       table_name, column_name, element_type, dimensions);
                             }
                             Ok::<(), rusqlite::Error>(())
@@ -4942,7 +4995,7 @@ impl ExtendedQueryHandler {
             }
             
             // Send CommandComplete and return
-            framed.send(BackendMessage::CommandComplete { tag: "CREATE TABLE".to_string() }).await
+            framed.feed(BackendMessage::CommandComplete { tag: "CREATE TABLE".to_string() }).await
                 .map_err(PgSqliteError::Io)?;
             
             return Ok(());
@@ -4957,6 +5010,7 @@ impl ExtendedQueryHandler {
         
         let cached_conn = Self::get_or_cache_connection(session, db).await;
         db.execute_with_session_cached(&translated_query, &session.id, cached_conn.as_ref()).await?;
+        session.mark_schema_changed().await;
         
         let tag = if query_starts_with_ignore_case(query, "CREATE TABLE") {
             "CREATE TABLE".to_string()
@@ -4968,7 +5022,7 @@ impl ExtendedQueryHandler {
             "OK".to_string()
         };
         
-        framed.send(BackendMessage::CommandComplete { tag }).await
+        framed.feed(BackendMessage::CommandComplete { tag }).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -4985,15 +5039,18 @@ impl ExtendedQueryHandler {
     {
         if query_starts_with_ignore_case(query, "BEGIN") {
             db.begin_with_session(&session.id).await?;
-            framed.send(BackendMessage::CommandComplete { tag: "BEGIN".to_string() }).await
+            framed.feed(BackendMessage::CommandComplete { tag: "BEGIN".to_string() }).await
                 .map_err(PgSqliteError::Io)?;
         } else if query_starts_with_ignore_case(query, "COMMIT") {
-            db.commit_with_session(&session.id).await?;
-            framed.send(BackendMessage::CommandComplete { tag: "COMMIT".to_string() }).await
+            let schema_changed = session.schema_changed_in_transaction.load(Ordering::Acquire);
+            db.commit_with_session(&session.id, schema_changed).await?;
+            session.end_schema_transaction();
+            framed.feed(BackendMessage::CommandComplete { tag: "COMMIT".to_string() }).await
                 .map_err(PgSqliteError::Io)?;
         } else if query_starts_with_ignore_case(query, "ROLLBACK") {
             db.rollback_with_session(&session.id).await?;
-            framed.send(BackendMessage::CommandComplete { tag: "ROLLBACK".to_string() }).await
+            session.end_schema_transaction();
+            framed.feed(BackendMessage::CommandComplete { tag: "ROLLBACK".to_string() }).await
                 .map_err(PgSqliteError::Io)?;
         }
         
@@ -5012,7 +5069,7 @@ impl ExtendedQueryHandler {
         let cached_conn = Self::get_or_cache_connection(session, db).await;
         db.execute_with_session_cached(query, &session.id, cached_conn.as_ref()).await?;
         
-        framed.send(BackendMessage::CommandComplete { tag: "OK".to_string() }).await
+        framed.feed(BackendMessage::CommandComplete { tag: "OK".to_string() }).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -5024,7 +5081,7 @@ impl ExtendedQueryHandler {
         let (table_name, columns) = crate::types::QueryContextAnalyzer::get_insert_column_info(query)
             .ok_or_else(|| PgSqliteError::Protocol("Failed to parse INSERT query".to_string()))?;
         
-        info!("Analyzing INSERT for table '{}' with columns: {:?}", table_name, columns);
+        debug!("Analyzing INSERT for table '{}' with columns: {:?}", table_name, columns);
         
         // Get cached table schema
         let table_schema = db.get_table_schema(&table_name).await
@@ -5064,17 +5121,17 @@ impl ExtendedQueryHandler {
                 
                 param_types.push(param_oid);
                 if param_oid != col_info.pg_oid {
-                    info!("Mapped parameter type for {}.{}: {} (OID {}) -> TEXT (OID 25) for binary protocol compatibility", 
+                    debug!("Mapped parameter type for {}.{}: {} (OID {}) -> TEXT (OID 25) for binary protocol compatibility", 
                           table_name, column, col_info.pg_type, col_info.pg_oid);
                 } else {
-                    info!("Found cached type for {}.{}: {} (OID {})", 
+                    debug!("Found cached type for {}.{}: {} (OID {})", 
                           table_name, column, col_info.pg_type, col_info.pg_oid);
                 }
             } else {
                 // Default to text if column not found
                 param_types.push(PgType::Text.to_oid());
                 original_types.push(PgType::Text.to_oid());
-                info!("Column {}.{} not found in schema, defaulting to text", table_name, column);
+                debug!("Column {}.{} not found in schema, defaulting to text", table_name, column);
             }
         }
         
@@ -5116,7 +5173,7 @@ impl ExtendedQueryHandler {
             "bit" => PgType::Bit.to_oid(),
             "varbit" | "bit varying" => PgType::Varbit.to_oid(),
             _ => {
-                info!("Unknown PostgreSQL type '{}', defaulting to text", type_name);
+                debug!("Unknown PostgreSQL type '{}', defaulting to text", type_name);
                 PgType::Text.to_oid() // Default to text
             }
         }
@@ -5144,7 +5201,7 @@ impl ExtendedQueryHandler {
                     let cast_type = type_match.as_str();
                     let oid = Self::pg_type_name_to_oid(cast_type);
                     param_types.push(oid);
-                    info!("Found explicit cast for parameter {}: {} (OID {})", i, cast_type, oid);
+                    debug!("Found explicit cast for parameter {}: {} (OID {})", i, cast_type, oid);
                     found_type = true;
                 }
             
@@ -5159,11 +5216,11 @@ impl ExtendedQueryHandler {
             } else {
                 // No table found, default to text
                 param_types.push(25);
-                info!("Could not extract table name for parameter {}, defaulting to text", i);
+                debug!("Could not extract table name for parameter {}, defaulting to text", i);
                 continue;
             };
             
-            info!("Analyzing SELECT params for table: {}", table_name);
+            debug!("Analyzing SELECT params for table: {}", table_name);
             let query_lower = query.to_lowercase();
             
             // Try to find which column this parameter is compared against
@@ -5192,7 +5249,7 @@ impl ExtendedQueryHandler {
                         if let Ok(Some(pg_type)) = db.get_schema_type_with_session(&session.id, &table_name, column).await {
                             let oid = crate::types::SchemaTypeMapper::pg_type_string_to_oid(&pg_type);
                             param_types.push(oid);
-                            info!("Found type for parameter {} from column {}: {} (OID {})", 
+                            debug!("Found type for parameter {} from column {}: {} (OID {})", 
                                   i, column, pg_type, oid);
                             found_type = true;
                             break;
@@ -5209,7 +5266,7 @@ impl ExtendedQueryHandler {
                                             && col_name.to_lowercase() == column {
                                                 let pg_type = crate::types::SchemaTypeMapper::sqlite_type_to_pg_oid(&sqlite_type);
                                                 param_types.push(pg_type);
-                                                info!("Mapped SQLite type for parameter {} from column {}: {} -> PG OID {}", 
+                                                debug!("Mapped SQLite type for parameter {} from column {}: {} -> PG OID {}", 
                                                       i, column, sqlite_type, pg_type);
                                                 found_type = true;
                                                 break;
@@ -5227,7 +5284,7 @@ impl ExtendedQueryHandler {
             if !found_type {
                 // Default to text if we can't determine the type
                 param_types.push(25);
-                info!("Could not determine type for parameter {}, defaulting to text", i);
+                debug!("Could not determine type for parameter {}, defaulting to text", i);
             }
         }
         
@@ -716,7 +716,7 @@ impl ExtendedFastPath {
                 }
             }
             
-            framed.send(BackendMessage::RowDescription(fields)).await
+            framed.feed(BackendMessage::RowDescription(fields)).await
                 .map_err(PgSqliteError::Io)?;
         }
         
@@ -726,13 +726,13 @@ impl ExtendedFastPath {
         
         // Send data rows
         for row in response.rows {
-            framed.send(BackendMessage::DataRow(row)).await
+            framed.feed(BackendMessage::DataRow(row)).await
                 .map_err(PgSqliteError::Io)?;
         }
         
         // Send CommandComplete
         let tag = format!("SELECT {}", response.rows_affected);
-        framed.send(BackendMessage::CommandComplete { tag }).await
+        framed.feed(BackendMessage::CommandComplete { tag }).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -780,12 +780,12 @@ impl ExtendedFastPath {
                 })
                 .collect();
             
-            framed.send(BackendMessage::RowDescription(fields)).await
+            framed.feed(BackendMessage::RowDescription(fields)).await
                 .map_err(PgSqliteError::Io)?;
             
             // Send data rows
             for row in response.rows {
-                framed.send(BackendMessage::DataRow(row)).await
+                framed.feed(BackendMessage::DataRow(row)).await
                     .map_err(PgSqliteError::Io)?;
             }
         }
@@ -798,7 +798,7 @@ impl ExtendedFastPath {
             _ => format!("OK {}", response.rows_affected),
         };
         
-        framed.send(BackendMessage::CommandComplete { tag }).await
+        framed.feed(BackendMessage::CommandComplete { tag }).await
             .map_err(PgSqliteError::Io)?;
         
         Ok(())
@@ -432,7 +432,7 @@ pub fn query_fast_path(
                                     buf.truncate(len);
                                     values.push(Some(buf));
                                 } else {
-                                    values.push(Some(int_val.to_string().into_bytes()));
+                                    values.push(Some(itoa::Buffer::new().format(int_val).as_bytes().to_vec()));
                                 }
                             },
                             ValueRef::Real(f) => {
@@ -679,7 +679,7 @@ fn execute_fast_select_with_params(
                         },
                         _ => {
                             // Default integer to string conversion
-                            values.push(Some(int_val.to_string().into_bytes()));
+                            values.push(Some(itoa::Buffer::new().format(int_val).as_bytes().to_vec()));
                         }
                     }
                 },
@@ -797,7 +797,7 @@ fn execute_fast_select(
                         },
                         _ => {
                             // Default integer to string conversion
-                            values.push(Some(int_val.to_string().into_bytes()));
+                            values.push(Some(itoa::Buffer::new().format(int_val).as_bytes().to_vec()));
                         }
                     }
                 },
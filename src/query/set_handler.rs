@@ -6,7 +6,7 @@ use tokio_util::codec::Framed;
 use futures::SinkExt;
 use regex::Regex;
 use once_cell::sync::Lazy;
-use tracing::{debug, info};
+use tracing::debug;
 
 static SET_TIMEZONE_PATTERN: Lazy<Regex> = Lazy::new(|| {
     Regex::new(r"(?i)^\s*SET\s+TIME\s*ZONE\s+(.+)$").unwrap()
@@ -70,10 +70,10 @@ impl SetHandler {
         // Handle SET TIME ZONE
         if let Some(caps) = SET_TIMEZONE_PATTERN.captures(trimmed) {
             let timezone = caps[1].trim().trim_matches('\'').trim_matches('"');
-            info!("Setting timezone to: {}", timezone);
+            debug!("Setting timezone to: {}", timezone);
             Self::set_timezone(session, timezone).await?;
             
-            framed.send(BackendMessage::CommandComplete { 
+            framed.feed(BackendMessage::CommandComplete { 
                 tag: "SET".to_string() 
             }).await.map_err(PgSqliteError::Io)?;
             
@@ -90,7 +90,7 @@ impl SetHandler {
             params.insert(param_name.clone(), param_value.to_string());
             drop(params);
             
-            framed.send(BackendMessage::CommandComplete { 
+            framed.feed(BackendMessage::CommandComplete { 
                 tag: "SET".to_string() 
             }).await.map_err(PgSqliteError::Io)?;
             
@@ -100,7 +100,7 @@ impl SetHandler {
         // Handle SHOW parameter
         if let Some(caps) = SHOW_PARAMETER_PATTERN.captures(trimmed) {
             let param_name = caps[1].to_uppercase();
-            info!("SHOW parameter: {}", param_name);
+            debug!("SHOW parameter: {}", param_name);
             
             // Handle special PostgreSQL SHOW commands
             let value = match param_name.as_str() {
@@ -122,7 +122,7 @@ impl SetHandler {
                         .unwrap_or_else(|| "unset".to_string())
                 }
             };
-            info!("Parameter {} = {}", param_name, value);
+            debug!("Parameter {} = {}", param_name, value);
             
             // Send row description only if not in extended protocol with pre-described statement
             if !skip_row_description {
@@ -136,16 +136,16 @@ impl SetHandler {
                     format: 0,
                 };
                 
-                framed.send(BackendMessage::RowDescription(vec![field])).await
+                framed.feed(BackendMessage::RowDescription(vec![field])).await
                     .map_err(PgSqliteError::Io)?;
             }
             
-            // Send data row
+            // Send data row; the whole response is flushed together with ReadyForQuery
             let row = vec![Some(value.as_bytes().to_vec())];
-            framed.send(BackendMessage::DataRow(row)).await
+            framed.feed(BackendMessage::DataRow(row)).await
                 .map_err(PgSqliteError::Io)?;
             
-            framed.send(BackendMessage::CommandComplete { 
+            framed.feed(BackendMessage::CommandComplete { 
                 tag: "SHOW".to_string() 
             }).await.map_err(PgSqliteError::Io)?;
             
@@ -59,18 +59,7 @@ impl ConnectionManager {
             .map_err(PgSqliteError::Sqlite)?;
         
         // Set pragmas
-        let pragma_sql = format!(
-            "PRAGMA journal_mode = {};
-             PRAGMA synchronous = {};
-             PRAGMA cache_size = {};
-             PRAGMA temp_store = MEMORY;
-             PRAGMA mmap_size = {};",
-            self.config.pragma_journal_mode,
-            self.config.pragma_synchronous,
-            self.config.pragma_cache_size,
-            self.config.pragma_mmap_size
-        );
-        conn.execute_batch(&pragma_sql)
+        conn.execute_batch(&self.config.connection_pragmas())
             .map_err(PgSqliteError::Sqlite)?;
         
         // Register functions
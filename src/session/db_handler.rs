@@ -49,6 +49,8 @@ pub struct DbHandler {
     db_path: String,
     // Default session for compatibility methods like query()/execute()
     default_session_id: Uuid,
+    // total_changes() of each session's connection at BEGIN, to spot read-only transactions
+    transaction_start_changes: parking_lot::Mutex<std::collections::HashMap<Uuid, u64>>,
 }
 
 impl DbHandler {
@@ -96,6 +98,7 @@ impl DbHandler {
             statement_cache_optimizer,
             db_path: db_path.to_string(),
             default_session_id,
+            transaction_start_changes: parking_lot::Mutex::new(std::collections::HashMap::new()),
         })
     }
     
@@ -116,18 +119,7 @@ impl DbHandler {
         };
         
         // Set pragmas
-        let pragma_sql = format!(
-            "PRAGMA journal_mode = {};
-             PRAGMA synchronous = {};
-             PRAGMA cache_size = {};
-             PRAGMA temp_store = MEMORY;
-             PRAGMA mmap_size = {};",
-            config.pragma_journal_mode,
-            config.pragma_synchronous,
-            config.pragma_cache_size,
-            config.pragma_mmap_size
-        );
-        conn.execute_batch(&pragma_sql)?;
+        conn.execute_batch(&config.connection_pragmas())?;
         
         Ok(conn)
     }
@@ -253,6 +245,7 @@ impl DbHandler {
     
     /// Remove a session's connection
     pub fn remove_session_connection(&self, session_id: &Uuid) {
+        self.transaction_start_changes.lock().remove(session_id);
         self.connection_manager.remove_connection(session_id);
     }
     
@@ -327,7 +320,7 @@ impl DbHandler {
                             let value: Option<rusqlite::types::Value> = row.get(i)?;
                             row_data.push(match value {
                                 Some(rusqlite::types::Value::Text(s)) => Some(s.into_bytes()),
-                                Some(rusqlite::types::Value::Integer(i)) => Some(i.to_string().into_bytes()),
+                                Some(rusqlite::types::Value::Integer(i)) => Some(itoa::Buffer::new().format(i).as_bytes().to_vec()),
                                 Some(rusqlite::types::Value::Real(f)) => Some(f.to_string().into_bytes()),
                                 Some(rusqlite::types::Value::Blob(b)) => Some(b),
                                 Some(rusqlite::types::Value::Null) | None => None,
@@ -431,7 +424,7 @@ impl DbHandler {
                             let value: Option<rusqlite::types::Value> = row.get(i)?;
                             row_data.push(match value {
                                 Some(rusqlite::types::Value::Text(s)) => Some(s.into_bytes()),
-                                Some(rusqlite::types::Value::Integer(i)) => Some(i.to_string().into_bytes()),
+                                Some(rusqlite::types::Value::Integer(i)) => Some(itoa::Buffer::new().format(i).as_bytes().to_vec()),
                                 Some(rusqlite::types::Value::Real(f)) => Some(f.to_string().into_bytes()),
                                 Some(rusqlite::types::Value::Blob(b)) => Some(b),
                                 Some(rusqlite::types::Value::Null) | None => None,
@@ -522,7 +515,7 @@ impl DbHandler {
                                 let value: Option<rusqlite::types::Value> = row.get(i)?;
                                 row_data.push(match value {
                                     Some(rusqlite::types::Value::Text(s)) => Some(s.into_bytes()),
-                                    Some(rusqlite::types::Value::Integer(i)) => Some(i.to_string().into_bytes()),
+                                    Some(rusqlite::types::Value::Integer(i)) => Some(itoa::Buffer::new().format(i).as_bytes().to_vec()),
                                     Some(rusqlite::types::Value::Real(f)) => Some(f.to_string().into_bytes()),
                                     Some(rusqlite::types::Value::Blob(b)) => Some(b),
                                     Some(rusqlite::types::Value::Null) | None => None,
@@ -604,7 +597,7 @@ impl DbHandler {
                         let value: Option<rusqlite::types::Value> = row.get(i)?;
                         row_data.push(match value {
                             Some(rusqlite::types::Value::Text(s)) => Some(s.into_bytes()),
-                            Some(rusqlite::types::Value::Integer(i)) => Some(i.to_string().into_bytes()),
+                            Some(rusqlite::types::Value::Integer(i)) => Some(itoa::Buffer::new().format(i).as_bytes().to_vec()),
                             Some(rusqlite::types::Value::Real(f)) => Some(f.to_string().into_bytes()),
                             Some(rusqlite::types::Value::Blob(b)) => Some(b),
                             Some(rusqlite::types::Value::Null) | None => None,
@@ -720,20 +713,37 @@ impl DbHandler {
     }
     
     /// Transaction control methods
+    ///
+    /// Clients issue these constantly, so they go through each connection's
+    /// statement cache rather than being re-parsed by SQLite every time.
     pub async fn begin_with_session(&self, session_id: &Uuid) -> Result<(), PgSqliteError> {
-        self.connection_manager.execute_with_session(session_id, |conn| {
-            conn.execute("BEGIN", [])?;
-            Ok(())
-        })
+        let start_changes = self.connection_manager.execute_with_session(session_id, |conn| {
+            conn.prepare_cached("BEGIN")?.execute([])?;
+            Ok(conn.total_changes())
+        })?;
+        self.transaction_start_changes.lock().insert(*session_id, start_changes);
+        Ok(())
     }
     
-    pub async fn commit(&self, session_id: &Uuid) -> Result<(), PgSqliteError> {
+    /// Commit the session's transaction. `schema_changed` tells whether it ran DDL,
+    /// which doesn't always show up in total_changes() (CREATE INDEX, CREATE VIEW).
+    pub async fn commit(&self, session_id: &Uuid, schema_changed: bool) -> Result<(), PgSqliteError> {
+        let start_changes = self.transaction_start_changes.lock().remove(session_id);
+        
         // Execute the commit on the current session
-        self.connection_manager.execute_with_session(session_id, |conn| {
-            conn.execute("COMMIT", [])?;
-            Ok(())
+        let end_changes = self.connection_manager.execute_with_session(session_id, |conn| {
+            conn.prepare_cached("COMMIT")?.execute([])?;
+            Ok(conn.total_changes())
         })?;
         
+        // A transaction that wrote nothing (SQLAlchemy's read-only sessions) has
+        // nothing to publish, so skip the refresh of every other connection.
+        // DDL counts as a write even when it left total_changes() untouched.
+        if !schema_changed && start_changes == Some(end_changes) {
+            debug!("COMMIT of read-only transaction - skipping connection refresh");
+            return Ok(());
+        }
+        
         // Force all other connections to refresh their WAL view (WAL mode only)
         // This ensures committed data is visible to all other sessions
         self.connection_manager.refresh_all_other_connections(session_id)?;
@@ -741,13 +751,19 @@ impl DbHandler {
         Ok(())
     }
     
-    pub async fn commit_with_session(&self, session_id: &Uuid) -> Result<(), PgSqliteError> {
-        self.commit(session_id).await
+    pub async fn commit_with_session(&self, session_id: &Uuid, schema_changed: bool) -> Result<(), PgSqliteError> {
+        self.commit(session_id, schema_changed).await
     }
     
     pub async fn rollback(&self, session_id: &Uuid) -> Result<(), PgSqliteError> {
+        self.transaction_start_changes.lock().remove(session_id);
         self.connection_manager.execute_with_session(session_id, |conn| {
-            match conn.execute("ROLLBACK", []) {
+            // No transaction is open (e.g. a driver's ROLLBACK on close) - nothing to undo
+            if conn.is_autocommit() {
+                debug!("ROLLBACK called with no active transaction - ignoring");
+                return Ok(());
+            }
+            match conn.prepare_cached("ROLLBACK")?.execute([]) {
                 Ok(_) => Ok(()),
                 Err(rusqlite::Error::SqliteFailure(_, Some(msg))) 
                     if msg.contains("cannot rollback - no transaction is active") => {
@@ -938,10 +954,10 @@ impl DbHandler {
                                                 let formatted = crate::types::datetime_utils::format_microseconds_to_time(int_value);
                                                 Some(formatted.into_bytes())
                                             }
-                                            _ => Some(int_value.to_string().into_bytes()),
+                                            _ => Some(itoa::Buffer::new().format(int_value).as_bytes().to_vec()),
                                         }
                                     } else {
-                                        Some(int_value.to_string().into_bytes())
+                                        Some(itoa::Buffer::new().format(int_value).as_bytes().to_vec())
                                     }
                                 }
                                 rusqlite::types::ValueRef::Real(f) => Some(f.to_string().into_bytes()),
@@ -1028,10 +1044,10 @@ impl DbHandler {
                                                     let formatted = crate::types::datetime_utils::format_microseconds_to_time(int_value);
                                                     Some(formatted.into_bytes())
                                                 }
-                                                _ => Some(int_value.to_string().into_bytes()),
+                                                _ => Some(itoa::Buffer::new().format(int_value).as_bytes().to_vec()),
                                             }
                                         } else {
-                                            Some(int_value.to_string().into_bytes())
+                                            Some(itoa::Buffer::new().format(int_value).as_bytes().to_vec())
                                         }
                                     }
                                     rusqlite::types::ValueRef::Real(f) => Some(f.to_string().into_bytes()),
@@ -1157,6 +1173,11 @@ impl DbHandler {
         self.connection_manager.execute_with_cached_connection_mut(cached_conn, f)
     }
     
+    /// Whether each session gets its own private in-memory database
+    pub fn is_memory_database(&self) -> bool {
+        self.db_path == ":memory:" || self.db_path.contains("mode=memory")
+    }
+    
     /// Get the connection manager for caching purposes
     pub fn connection_manager(&self) -> &Arc<ConnectionManager> {
         &self.connection_manager
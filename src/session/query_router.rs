@@ -78,12 +78,12 @@ impl QueryRouter {
 
         match route {
             QueryRoute::ReadOnly => {
-                info!("Executing query via read-only pool");
+                debug!("Executing query via read-only pool");
                 let result = self.read_handler.query(sql).await?;
                 Ok(result)
             }
             QueryRoute::Write | QueryRoute::WriteTransaction => {
-                info!("Executing query via write handler");
+                debug!("Executing query via write handler");
                 let result = self.write_handler.query(sql).await?;
                 Ok(result)
             }
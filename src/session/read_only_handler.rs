@@ -80,7 +80,7 @@ impl ReadOnlyDbHandler {
                 // Convert SQLite values to bytes for DbResponse compatibility
                 let value = match row.get::<_, rusqlite::types::Value>(i)? {
                     rusqlite::types::Value::Null => None,
-                    rusqlite::types::Value::Integer(i) => Some(i.to_string().into_bytes()),
+                    rusqlite::types::Value::Integer(i) => Some(itoa::Buffer::new().format(i).as_bytes().to_vec()),
                     rusqlite::types::Value::Real(f) => Some(f.to_string().into_bytes()),
                     rusqlite::types::Value::Text(s) => Some(s.into_bytes()),
                     rusqlite::types::Value::Blob(b) => Some(b),
@@ -127,7 +127,7 @@ impl ReadOnlyDbHandler {
             for i in 0..column_names.len() {
                 let value = match row.get::<_, rusqlite::types::Value>(i)? {
                     rusqlite::types::Value::Null => None,
-                    rusqlite::types::Value::Integer(i) => Some(i.to_string().into_bytes()),
+                    rusqlite::types::Value::Integer(i) => Some(itoa::Buffer::new().format(i).as_bytes().to_vec()),
                     rusqlite::types::Value::Real(f) => Some(f.to_string().into_bytes()),
                     rusqlite::types::Value::Text(s) => Some(s.into_bytes()),
                     rusqlite::types::Value::Blob(b) => Some(b),
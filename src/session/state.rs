@@ -1,10 +1,10 @@
 use std::collections::HashMap;
 use tokio::sync::{RwLock, Mutex};
 use crate::protocol::TransactionStatus;
-use crate::cache::QueryCache;
+use crate::cache::{QueryCache, ParseCache};
 use crate::config::CONFIG;
 use std::sync::Arc;
-use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
 use once_cell::sync::Lazy;
 use crate::session::DbHandler;
 use parking_lot::Mutex as ParkingMutex;
@@ -30,6 +30,8 @@ pub struct SessionState {
     pub python_param_mapping: RwLock<HashMap<String, Vec<String>>>, // Maps statement name to Python parameter names
     pub db_handler: Mutex<Option<Arc<DbHandler>>>, // Reference to the database handler for session lifecycle management
     pub cached_connection: ParkingMutex<Option<Arc<ParkingMutex<Connection>>>>, // Cached connection for fast access
+    pub parse_cache: ParseCache, // Translated Parse results keyed by query + param types
+    pub schema_changed_in_transaction: AtomicBool, // DDL ran since the last COMMIT/ROLLBACK
 }
 
 pub struct PreparedStatement {
@@ -39,6 +41,16 @@ pub struct PreparedStatement {
     pub param_formats: Vec<i16>,
     pub field_descriptions: Vec<crate::protocol::FieldDescription>,
     pub translation_metadata: Option<crate::translator::TranslationMetadata>, // Type hints from query translation
+    pub encoded_row_description: Arc<once_cell::sync::OnceCell<bytes::Bytes>>, // Serialized field_descriptions, shared with the parse cache; replaced whenever they change
+}
+
+impl PreparedStatement {
+    /// RowDescription for this statement, serialized on first use
+    pub fn row_description_message(&self) -> crate::protocol::BackendMessage {
+        let encoded = self.encoded_row_description
+            .get_or_init(|| crate::protocol::codec::encode_row_description_message(&self.field_descriptions));
+        crate::protocol::BackendMessage::EncodedRowDescription(encoded.clone())
+    }
 }
 
 #[derive(Clone)]
@@ -78,6 +90,8 @@ impl SessionState {
             python_param_mapping: RwLock::new(HashMap::new()),
             db_handler: Mutex::new(None), // Will be set after session is created
             cached_connection: ParkingMutex::new(None), // Initialize as None
+            parse_cache: ParseCache::new(CONFIG.parse_cache_size),
+            schema_changed_in_transaction: AtomicBool::new(false),
         }
     }
 
@@ -105,6 +119,23 @@ impl SessionState {
         *self.transaction_status.read().await
     }
     
+    /// Record that this session ran DDL, invalidating schema-derived caches.
+    /// Inside a transaction the change stays private until COMMIT/ROLLBACK.
+    pub async fn mark_schema_changed(&self) {
+        if self.in_transaction().await {
+            self.schema_changed_in_transaction.store(true, Ordering::Release);
+        }
+        crate::cache::invalidate_parse_caches();
+    }
+    
+    /// Called after COMMIT/ROLLBACK: if the transaction ran DDL, other sessions
+    /// only see the final schema now, so invalidate once more
+    pub fn end_schema_transaction(&self) {
+        if self.schema_changed_in_transaction.swap(false, Ordering::AcqRel) {
+            crate::cache::invalidate_parse_caches();
+        }
+    }
+    
     /// Get the current number of active sessions
     pub async fn get_session_count(&self) -> usize {
         ACTIVE_SESSION_COUNT.load(Ordering::Relaxed)
@@ -1,4 +1,4 @@
-use regex::Regex;
+use regex::{Regex, RegexSet};
 use once_cell::sync::Lazy;
 
 /// Translates PostgreSQL datetime functions to our custom SQLite functions
@@ -49,24 +49,27 @@ static AT_TIME_ZONE_PATTERN: Lazy<Regex> = Lazy::new(|| {
     Regex::new(r"(?i)(\S+)\s+AT\s+TIME\s+ZONE\s+'([^']+)'(\s+as\s+(\w+))?").unwrap()
 });
 
+// All detection patterns compiled into one set so needs_translation scans the query once
+static NEEDS_TRANSLATION_SET: Lazy<RegexSet> = Lazy::new(|| {
+    RegexSet::new([
+        NOW_PATTERN.as_str(),
+        CURRENT_DATE_PATTERN.as_str(),
+        CURRENT_TIME_PATTERN.as_str(),
+        DATE_FUNCTION_PATTERN.as_str(),
+        TIME_FUNCTION_PATTERN.as_str(),
+        DATETIME_FUNCTION_PATTERN.as_str(),
+        EXTRACT_PATTERN.as_str(),
+        DATE_TRUNC_PATTERN.as_str(),
+        AGE_PATTERN.as_str(),
+        AT_TIME_ZONE_PATTERN.as_str(),
+        r"(?i)INTERVAL|TO_TIMESTAMP|TO_DATE|MAKE_DATE|MAKE_TIME",
+    ]).unwrap()
+});
+
 impl DateTimeTranslator {
     /// Check if the query contains datetime functions that need translation
     pub fn needs_translation(query: &str) -> bool {
-        NOW_PATTERN.is_match(query) ||
-        CURRENT_DATE_PATTERN.is_match(query) ||
-        CURRENT_TIME_PATTERN.is_match(query) ||
-        DATE_FUNCTION_PATTERN.is_match(query) ||
-        TIME_FUNCTION_PATTERN.is_match(query) ||
-        DATETIME_FUNCTION_PATTERN.is_match(query) ||
-        EXTRACT_PATTERN.is_match(query) ||
-        DATE_TRUNC_PATTERN.is_match(query) ||
-        AGE_PATTERN.is_match(query) ||
-        AT_TIME_ZONE_PATTERN.is_match(query) ||
-        query.to_uppercase().contains("INTERVAL") ||
-        query.to_uppercase().contains("TO_TIMESTAMP") ||
-        query.to_uppercase().contains("TO_DATE") ||
-        query.to_uppercase().contains("MAKE_DATE") ||
-        query.to_uppercase().contains("MAKE_TIME")
+        NEEDS_TRANSLATION_SET.is_match(query)
     }
     
     /// Translate PostgreSQL datetime functions to SQLite-compatible versions
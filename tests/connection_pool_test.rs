@@ -43,7 +43,7 @@ async fn test_db_handler_transactions() -> Result<(), Box<dyn std::error::Error>
     db_handler.begin_with_session(&session_id).await?;
     db_handler.execute_with_session("INSERT INTO test_tx (value) VALUES (100)", &session_id).await?;
     db_handler.execute_with_session("INSERT INTO test_tx (value) VALUES (200)", &session_id).await?;
-    db_handler.commit_with_session(&session_id).await?;
+    db_handler.commit_with_session(&session_id, false).await?;
     
     let result = db_handler.query_with_session("SELECT COUNT(*) FROM test_tx", &session_id).await?;
     assert_eq!(result.rows.len(), 1);
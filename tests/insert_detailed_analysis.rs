@@ -91,7 +91,7 @@ async fn test_insert_detailed_timing() {
         let query = format!("INSERT INTO test_insert (name, value) VALUES ('batch2_{i}', {i})");
         db.execute_with_session(&query, &session_id).await.expect("Failed to execute INSERT");
     }
-    db.commit_with_session(&session_id).await.expect("Failed to commit transaction");
+    db.commit_with_session(&session_id, false).await.expect("Failed to commit transaction");
     let with_txn_time = start.elapsed();
     println!("50 INSERTs with transaction: {:?}, avg: {:?}", with_txn_time, with_txn_time / 50);
     
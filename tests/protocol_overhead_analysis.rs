@@ -90,7 +90,7 @@ async fn test_protocol_overhead_breakdown() {
         let query = format!("INSERT INTO protocol_test (name, value) VALUES ('txn{i}', {i})");
         db.execute_with_session(&query, &session_id).await.expect("Failed to execute INSERT");
     }
-    db.commit_with_session(&session_id).await.expect("Failed to commit");
+    db.commit_with_session(&session_id, false).await.expect("Failed to commit");
     let with_txn = start.elapsed();
     
     println!("  100 INSERTs without transaction: {:?}, avg: {:?}", no_txn, no_txn / 100);
@@ -0,0 +1,66 @@
+"""Shared helpers for the test scripts that start their own pgsqlite process."""
+
+import socket
+import sys
+import time
+from pathlib import Path
+
+
+def wait_for_pgsqlite(proc, port, timeout=10.0):
+    """Wait until pgsqlite accepts TCP connections on the given port.
+
+    Polls every 50ms instead of sleeping a fixed amount, so fast startups
+    don't pay the full delay; the defaults match wait_for_pgsqlite in
+    pgsqlite_server.sh. Returns False if the process exits first or the
+    port isn't open within the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            return False
+        try:
+            socket.create_connection(("localhost", port), timeout=0.05).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def abort_startup(proc, db_path=None):
+    """Stop a pgsqlite that never came up, show its output and exit non-zero.
+
+    Call this when wait_for_pgsqlite() returns False, so the script fails
+    with the server's own error instead of a later connection error.
+    """
+    proc.kill()
+    output, errors = proc.communicate(timeout=5)
+    print("pgsqlite failed to start", file=sys.stderr)
+    for captured in (output, errors):
+        if captured:
+            if isinstance(captured, bytes):
+                captured = captured.decode(errors="replace")
+            print(captured, file=sys.stderr)
+    if db_path:
+        remove_database(db_path)
+    sys.exit(1)
+
+
+def free_port():
+    """Ask the OS for a TCP port that is currently unused.
+
+    Lets scripts that start their own server run side by side instead of
+    colliding on a hard-coded port.
+    """
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def remove_database(path):
+    """Delete a test database file together with its -wal and -shm files.
+
+    Missing files are ignored, so this is safe to call from a finally block
+    whether or not the server got far enough to create them.
+    """
+    for suffix in ("", "-wal", "-shm"):
+        Path(path + suffix).unlink(missing_ok=True)
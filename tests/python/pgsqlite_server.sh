@@ -0,0 +1,39 @@
+#!/bin/bash
+
+# Shared helpers for the test runner scripts. Source this file; don't execute it.
+
+# Wait until pgsqlite accepts TCP connections on the given port.
+# Polls every 50ms instead of sleeping a fixed amount, so fast startups
+# don't pay the full delay. Returns non-zero if the process exits first
+# or the port isn't open within the timeout (default 10s).
+wait_for_pgsqlite() {
+    local pid="$1"
+    local port="$2"
+    local timeout_secs="${3:-10}"
+    local attempts=$((timeout_secs * 20))
+
+    for ((i = 0; i < attempts; i++)); do
+        if ! kill -0 "$pid" 2>/dev/null; then
+            return 1
+        fi
+        if (echo > "/dev/tcp/localhost/$port") 2>/dev/null; then
+            return 0
+        fi
+        sleep 0.05
+    done
+    return 1
+}
+
+# Build the release binary only when Cargo.toml, Cargo.lock or anything under
+# src/ is newer than it. Even a no-op `cargo build` walks the whole dependency
+# graph, which every runner would otherwise pay on each invocation.
+build_pgsqlite_if_stale() {
+    local project_root="$1"
+    local binary="$project_root/target/release/pgsqlite"
+
+    if [[ -x "$binary" ]] && [[ -z "$(find "$project_root/src" "$project_root/Cargo.toml" "$project_root/Cargo.lock" \
+            -newer "$binary" -print -quit 2>/dev/null)" ]]; then
+        return 0
+    fi
+    (cd "$project_root" && cargo build --release)
+}
@@ -11,6 +11,7 @@ echo "=================================================="
 # Get the directory of this script
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"
+source "$SCRIPT_DIR/pgsqlite_server.sh"
 
 # Colors for output
 RED='\033[0;31m'
@@ -42,17 +43,14 @@ start_server() {
     cd "$PROJECT_ROOT"
     
     # Build the project
-    cargo build --release
+    build_pgsqlite_if_stale "$PROJECT_ROOT"
     
     # Start server in background
     ./target/release/pgsqlite --database ":memory:" --port 15500 > /tmp/pgsqlite_test.log 2>&1 &
     SERVER_PID=$!
     
-    # Wait for server to start
-    sleep 2
-    
-    # Check if server is running
-    if kill -0 $SERVER_PID 2>/dev/null; then
+    # Wait until the server accepts connections
+    if wait_for_pgsqlite $SERVER_PID 15500; then
         echo -e "${GREEN}✅ pgsqlite server started (PID: $SERVER_PID)${NC}"
         return 0
     else
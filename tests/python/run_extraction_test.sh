@@ -5,6 +5,7 @@ set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"
+source "$SCRIPT_DIR/pgsqlite_server.sh"
 TEST_DB="$SCRIPT_DIR/test_extraction.db"
 PORT=15511
 PGSQLITE_PID=""
@@ -26,15 +27,13 @@ echo ""
 # Build and start pgsqlite
 echo "Building and starting pgsqlite..."
 cd "$PROJECT_ROOT"
-cargo build --release
+build_pgsqlite_if_stale "$PROJECT_ROOT"
 rm -f "$TEST_DB"
 ./target/release/pgsqlite --database "$TEST_DB" --port $PORT > "$SCRIPT_DIR/extraction_test.log" 2>&1 &
 PGSQLITE_PID=$!
 
-# Wait for startup
-sleep 3
-
-if ! kill -0 "$PGSQLITE_PID" 2>/dev/null; then
+# Wait until the server accepts connections; the cleanup trap stops it on failure
+if ! wait_for_pgsqlite "$PGSQLITE_PID" "$PORT"; then
     echo "❌ pgsqlite failed to start"
     exit 1
 fi
@@ -5,6 +5,7 @@ set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"
+source "$SCRIPT_DIR/pgsqlite_server.sh"
 TEST_DB="$SCRIPT_DIR/test_minimal.db"
 PORT=15502
 PGSQLITE_PID=""
@@ -27,18 +28,15 @@ echo ""
 # Build and start pgsqlite
 echo "Building pgsqlite..."
 cd "$PROJECT_ROOT"
-cargo build --release
+build_pgsqlite_if_stale "$PROJECT_ROOT"
 
 echo "Starting pgsqlite on port $PORT..."
 rm -f "$TEST_DB"
 ./target/release/pgsqlite --database "$TEST_DB" --port $PORT > "$SCRIPT_DIR/minimal.log" 2>&1 &
 PGSQLITE_PID=$!
 
-# Wait for startup
-sleep 3
-
-# Check if running
-if ! kill -0 "$PGSQLITE_PID" 2>/dev/null; then
+# Wait until the server accepts connections; the cleanup trap stops it on failure
+if ! wait_for_pgsqlite "$PGSQLITE_PID" "$PORT"; then
     echo "❌ pgsqlite failed to start"
     cat "$SCRIPT_DIR/minimal.log"
     exit 1
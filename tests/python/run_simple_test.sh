@@ -8,6 +8,7 @@ set -euo pipefail
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"
+source "$SCRIPT_DIR/pgsqlite_server.sh"
 TEST_DB="$SCRIPT_DIR/test_sqlalchemy_simple.db"
 PORT=15501
 PGSQLITE_PID=""
@@ -66,7 +67,7 @@ start_pgsqlite() {
     
     # Build pgsqlite first
     cd "$PROJECT_ROOT"
-    if ! cargo build --release; then
+    if ! build_pgsqlite_if_stale "$PROJECT_ROOT"; then
         log_error "Failed to build pgsqlite"
         exit 1
     fi
@@ -75,32 +76,15 @@ start_pgsqlite() {
     ./target/release/pgsqlite --database "$TEST_DB" --port $PORT > "$SCRIPT_DIR/simple_test.log" 2>&1 &
     PGSQLITE_PID=$!
     
-    # Wait for server to start
+    # Wait until the server accepts connections
     log_info "Waiting for pgsqlite to start (PID: $PGSQLITE_PID)..."
-    sleep 3
-    
-    # Check if process is still running
-    if ! kill -0 "$PGSQLITE_PID" 2>/dev/null; then
-        log_error "pgsqlite failed to start. Check log:"
-        cat "$SCRIPT_DIR/simple_test.log"
-        exit 1
+    if wait_for_pgsqlite "$PGSQLITE_PID" "$PORT"; then
+        log_success "pgsqlite is running and accepting connections"
+        return 0
     fi
     
-    # Test connection
-    max_attempts=5
-    attempt=1
-    while [[ $attempt -le $max_attempts ]]; do
-        if timeout 5 bash -c "echo > /dev/tcp/localhost/$PORT" 2>/dev/null; then
-            log_success "pgsqlite is running and accepting connections"
-            return 0
-        fi
-        
-        log_info "Connection attempt $attempt/$max_attempts failed, retrying..."
-        sleep 2
-        ((attempt++))
-    done
-    
-    log_error "Failed to connect to pgsqlite after $max_attempts attempts"
+    log_error "pgsqlite failed to start. Check log:"
+    cat "$SCRIPT_DIR/simple_test.log"
     exit 1
 }
 
@@ -9,6 +9,7 @@ set -euo pipefail
 # Configuration
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"
+source "$SCRIPT_DIR/pgsqlite_server.sh"
 TEST_DB="$SCRIPT_DIR/test_sqlalchemy_orm.db"
 PORT=15500
 PGSQLITE_PID=""
@@ -102,7 +103,7 @@ build_pgsqlite() {
     cd "$PROJECT_ROOT"
     
     # Build pgsqlite
-    if ! cargo build --release; then
+    if ! build_pgsqlite_if_stale "$PROJECT_ROOT"; then
         log_error "Failed to build pgsqlite"
         exit 1
     fi
@@ -139,33 +140,14 @@ start_pgsqlite() {
     fi
     PGSQLITE_PID=$!
     
-    # Wait for server to start
+    # Wait until the server accepts connections
     log_info "Waiting for pgsqlite to start (PID: $PGSQLITE_PID)..."
-    sleep 3
-    
-    # Check if process is still running
-    if ! kill -0 "$PGSQLITE_PID" 2>/dev/null; then
-        log_error "pgsqlite failed to start. Check log:"
-        cat "$SCRIPT_DIR/pgsqlite.log"
-        exit 1
+    if wait_for_pgsqlite "$PGSQLITE_PID" "$PORT"; then
+        log_success "pgsqlite is running and accepting connections"
+        return 0
     fi
     
-    # Test connection
-    max_attempts=10
-    attempt=1
-    while [[ $attempt -le $max_attempts ]]; do
-        if timeout 5 bash -c "echo > /dev/tcp/localhost/$PORT" 2>/dev/null; then
-            log_success "pgsqlite is running and accepting connections"
-            return 0
-        fi
-        
-        log_info "Connection attempt $attempt/$max_attempts failed, retrying..."
-        sleep 2
-        ((attempt++))
-    done
-    
-    log_error "Failed to connect to pgsqlite after $max_attempts attempts"
-    log_error "Server log:"
+    log_error "pgsqlite failed to start. Check log:"
     cat "$SCRIPT_DIR/pgsqlite.log"
     exit 1
 }
@@ -4,17 +4,17 @@
 import os
 import tempfile
 import subprocess
-import time
 from decimal import Decimal
 from datetime import date, time as dt_time
 import psycopg
+from pgsqlite_server import abort_startup, free_port, wait_for_pgsqlite
 
 # Start pgsqlite
 db_file = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
 db_file.close()
 db_path = db_file.name
 
-port = 15447
+port = free_port()
 print(f"Starting pgsqlite on port {port}")
 env = os.environ.copy()
 env['RUST_LOG'] = 'info'
@@ -24,7 +24,8 @@ pgsqlite_proc = subprocess.Popen([
     '--port', str(port)
 ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env)
 
-time.sleep(1)
+if not wait_for_pgsqlite(pgsqlite_proc, port):
+    abort_startup(pgsqlite_proc, db_path)
 
 try:
     # Connect
@@ -9,7 +9,6 @@ import argparse
 def test_comprehensive_fixes(port):
     """Test all the major fixes we implemented."""
     try:
-        import psycopg2
         from sqlalchemy import create_engine, Column, Integer, String, Numeric, Boolean, DateTime, text
         from sqlalchemy.ext.declarative import declarative_base
         from sqlalchemy.orm import sessionmaker
@@ -57,12 +57,9 @@ def test_debug_columns(port):
             print(f"\n🔍 {test_name}: {query}")
             try:
                 cursor.execute(query)
-                description = cursor.description
                 print(f"  Result columns:")
-                for i, desc in enumerate(description):
-                    col_name = desc[0] 
-                    type_oid = desc[1]
-                    print(f"    Column {i+1}: name='{col_name}', type_oid={type_oid}")
+                for i, (col_name, type_oid, *_) in enumerate(cursor.description, 1):
+                    print(f"    Column {i}: name='{col_name}', type_oid={type_oid}")
             except Exception as e:
                 print(f"  ❌ Failed: {e}")
         
@@ -11,8 +11,9 @@ conn1 = psycopg.connect(
 cur1 = conn1.cursor()
 
 # Create table and insert data in connection 1
-cur1.execute("DROP TABLE IF EXISTS users")
+# Without parameters psycopg sends this as one simple-query message
 cur1.execute("""
+    DROP TABLE IF EXISTS users;
     CREATE TABLE users (
         id SERIAL PRIMARY KEY,
         name VARCHAR(50) NOT NULL,
@@ -2,46 +2,42 @@
 """Debug the exact issue with empty result sets"""
 
 import os
-import tempfile
 import subprocess
-import time
 from datetime import date, time as dt_time
 from decimal import Decimal
 import psycopg
+from pgsqlite_server import abort_startup, free_port, wait_for_pgsqlite
 
-# Start pgsqlite
-db_file = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
-db_file.close()
-db_path = db_file.name
+# Names for the type OIDs the orders columns should report
+TYPE_NAMES = {23: 'INT4', 25: 'TEXT', 1043: 'VARCHAR', 1082: 'DATE', 1083: 'TIME', 1700: 'NUMERIC'}
 
-port = 15446
+# Start pgsqlite; nothing here needs to outlive the run, so keep the database in memory
+port = free_port()
 print(f"Starting pgsqlite on port {port}")
 env = os.environ.copy()
 env['RUST_LOG'] = 'pgsqlite::query::extended_fast_path=debug'
 pgsqlite_proc = subprocess.Popen([
     '../../target/release/pgsqlite',
-    '--database', db_path,
+    '--in-memory',
     '--port', str(port)
 ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
 
-time.sleep(1)
+if not wait_for_pgsqlite(pgsqlite_proc, port):
+    abort_startup(pgsqlite_proc)
 
 try:
     # Connect
     conn = psycopg.connect(f"postgresql://postgres@localhost:{port}/main")
     cur = conn.cursor()
     
-    # Create the exact schema
-    cur.execute("DROP TABLE IF EXISTS orders")
-    cur.execute("DROP TABLE IF EXISTS users")
+    # Create the exact schema; the in-memory database starts empty, so nothing to drop.
+    # Without parameters psycopg sends this as one simple-query message
     cur.execute("""
         CREATE TABLE users (
             id SERIAL PRIMARY KEY,
             username VARCHAR(50),
             full_name VARCHAR(100)
-        )
-    """)
-    cur.execute("""
+        );
         CREATE TABLE orders (
             id SERIAL PRIMARY KEY,
             customer_id INTEGER REFERENCES users(id),
@@ -76,8 +72,8 @@ try:
     """)
     
     print("Column descriptions:")
-    for desc in cur.description:
-        print(f"  {desc.name}: type_code={desc.type_code}")
+    for name, type_code, *_ in cur.description:
+        print(f"  {name}: type_code={type_code} ({TYPE_NAMES.get(type_code, '?')})")
     
     results = cur.fetchall()
     print(f"Results (should be empty): {results}")
@@ -102,9 +98,9 @@ try:
     cur.execute(query, (user_id,))
     
     print("Column descriptions after parameterized query:")
-    for desc in cur.description:
-        print(f"  {desc.name}: type_code={desc.type_code}")
-        if desc.name == 'orders_total_amount' and desc.type_code == 25:
+    for name, type_code, *_ in cur.description:
+        print(f"  {name}: type_code={type_code} ({TYPE_NAMES.get(type_code, '?')})")
+        if name == 'orders_total_amount' and type_code == 25:
             print("    ^^^ BUG! Should be 1700 (NUMERIC) not 25 (TEXT)")
     
     results = cur.fetchall()
@@ -122,13 +118,13 @@ try:
     cur.execute(query, (user_id,))
     
     print("Column descriptions with data present:")
-    for desc in cur.description:
-        print(f"  {desc.name}: type_code={desc.type_code}")
-        if desc.name == 'orders_total_amount':
-            if desc.type_code == 1700:
+    for name, type_code, *_ in cur.description:
+        print(f"  {name}: type_code={type_code} ({TYPE_NAMES.get(type_code, '?')})")
+        if name == 'orders_total_amount':
+            if type_code == 1700:
                 print("    ✓ Correct: NUMERIC (1700)")
             else:
-                print(f"    ✗ Wrong: Got {desc.type_code} instead of 1700")
+                print(f"    ✗ Wrong: Got {type_code} instead of 1700")
     
     results = cur.fetchall()
     print(f"Results: {results}")
@@ -143,7 +139,9 @@ except Exception as e:
     
 finally:
     # Capture some logs
-    pgsqlite_proc.terminate()
+    # The database is in memory, so there is nothing for a graceful shutdown to
+    # flush; everything logged so far is already waiting in the pipe
+    pgsqlite_proc.kill()
     output, _ = pgsqlite_proc.communicate(timeout=2)
     
     # Look for fast path related logs
@@ -155,6 +153,4 @@ finally:
             "RowDescription",
             "Fast path"
         ]):
-            print(line)
-    
-    os.unlink(db_path)
\ No newline at end of file
+            print(line)
\ No newline at end of file
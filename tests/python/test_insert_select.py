@@ -10,6 +10,7 @@ def test_insert_select(port):
     """Test INSERT...SELECT statements."""
     try:
         import psycopg2
+        from psycopg2.extras import execute_batch
         print("🧪 Testing INSERT...SELECT Functionality")
         print("========================================")
         print()
@@ -26,19 +27,14 @@ def test_insert_select(port):
         cursor = conn.cursor()
         
         try:
-            # Create source table
-            print("🔍 Creating source table...")
+            # Create source and destination tables in one simple-query round trip
+            print("🔍 Creating source and destination tables...")
             cursor.execute("""
                 CREATE TABLE source_table (
                     id INTEGER PRIMARY KEY,
                     name VARCHAR(50),
                     value NUMERIC(10,2)
-                )
-            """)
-            
-            # Create destination table
-            print("🔍 Creating destination table...")
-            cursor.execute("""
+                );
                 CREATE TABLE dest_table (
                     id INTEGER PRIMARY KEY,
                     name VARCHAR(50),
@@ -48,8 +44,12 @@ def test_insert_select(port):
             
             # Insert test data into source table
             print("🔍 Inserting test data...")
-            cursor.execute("INSERT INTO source_table (id, name, value) VALUES (1, 'test1', 100.50)")
-            cursor.execute("INSERT INTO source_table (id, name, value) VALUES (2, 'test2', 200.75)")
+            execute_batch(
+                cursor,
+                "INSERT INTO source_table (id, name, value) VALUES (%s, %s, %s)",
+                [(1, 'test1', 100.50), (2, 'test2', 200.75)],
+                page_size=100
+            )
             
             # Test basic INSERT...SELECT
             print("🔍 Testing basic INSERT...SELECT...")
@@ -4,44 +4,28 @@
 import psycopg
 import os
 import subprocess
-import time
-import tempfile
 import sys
+from pgsqlite_server import abort_startup, free_port, wait_for_pgsqlite
 
 def main():
-    # Create test database
-    db_path = tempfile.mktemp(suffix='.db')
-    
     # Start pgsqlite with debug logging
     env = os.environ.copy()
     env['RUST_LOG'] = 'pgsqlite::catalog=debug,pgsqlite::query::executor=debug'
     
+    port = free_port()
     pgsqlite_proc = subprocess.Popen([
         '/home/eran/work/pgsqlite/target/release/pgsqlite',
-        '--database', db_path,
-        '--port', '15507',
+        '--port', str(port),
         '--in-memory'
     ], env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
     
-    time.sleep(1)
-    
-    logs = []
-    
-    def read_logs():
-        while True:
-            line = pgsqlite_proc.stdout.readline()
-            if not line:
-                break
-            logs.append(line.rstrip())
-    
-    import threading
-    log_thread = threading.Thread(target=read_logs, daemon=True)
-    log_thread.start()
+    if not wait_for_pgsqlite(pgsqlite_proc, port):
+        abort_startup(pgsqlite_proc)
     
     try:
         # Connect
         with psycopg.connect(
-            "postgresql://postgres@localhost:15507/main",
+            f"postgresql://postgres@localhost:{port}/main",
             autocommit=True,
             cursor_factory=psycopg.cursor.Cursor  # Force text mode
         ) as conn:
@@ -60,17 +44,16 @@ def main():
         print(f"❌ Connection error: {e}")
         return 1
     finally:
-        pgsqlite_proc.terminate()
-        time.sleep(0.5)
+        # The database is in memory, so there is nothing for a graceful shutdown to
+        # flush. A single query's worth of logs fits in the pipe buffer, so the
+        # output can be collected once at shutdown, as the other debug scripts do
+        pgsqlite_proc.kill()
+        output, _ = pgsqlite_proc.communicate(timeout=5)
         
         print("\nRelevant log lines:")
-        for line in logs:
+        for line in output.splitlines():
             if any(x in line for x in ['version', 'intercept', 'process', 'system', 'ERROR', 'Query']):
                 print(line)
-        
-        pgsqlite_proc.wait()
-        if os.path.exists(db_path):
-            os.unlink(db_path)
     
     return 0
 
@@ -10,13 +10,14 @@ def send_startup(sock):
     msg = struct.pack('>II', msg_len, 196608) + params
     sock.send(msg)
     
-def read_message(sock):
-    """Read a backend message"""
-    msg_type = sock.recv(1)
-    if not msg_type:
+def read_message(reader):
+    """Read a backend message from a buffered socket reader"""
+    header = reader.read(5)
+    if len(header) < 5:
         return None, None
-    msg_len = struct.unpack('>I', sock.recv(4))[0]
-    msg_data = sock.recv(msg_len - 4) if msg_len > 4 else b''
+    msg_type = header[:1]
+    msg_len = struct.unpack('>I', header[1:])[0]
+    msg_data = reader.read(msg_len - 4) if msg_len > 4 else b''
     return msg_type, msg_data
 
 def send_query(sock, query):
@@ -27,13 +28,16 @@ def send_query(sock, query):
 # Connect
 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 sock.connect(('localhost', 15432))
+# Buffered reads pull whole messages out of one recv instead of three per
+# message, and never return a short read for a split message
+reader = sock.makefile('rb')
 
 # Startup
 send_startup(sock)
 
 # Read auth response
 while True:
-    msg_type, data = read_message(sock)
+    msg_type, data = read_message(reader)
     if msg_type == b'Z':  # ReadyForQuery
         print("Ready for query")
         break
@@ -45,11 +49,12 @@ send_query(sock, query)
 
 # Read response
 while True:
-    msg_type, data = read_message(sock)
+    msg_type, data = read_message(reader)
     if not msg_type:
         break
     print(f"Got message type: {msg_type}")
     if msg_type == b'Z':
         break
         
+reader.close()
 sock.close()
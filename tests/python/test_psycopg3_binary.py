@@ -30,9 +30,8 @@ def test_psycopg3_binary():
                     data BYTEA
                 )
             """)
-            conn.commit()
             
-            # Insert data using binary format
+            # Insert data using binary format; the CREATE above commits with it
             test_uuid = uuid.uuid4()
             test_data = {
                 "id": 1,
@@ -176,23 +176,20 @@ def test_comprehensive_binary():
                 }
             ]
             
-            # Insert all test cases using binary format
+            # Every case sets the same columns, so one INSERT covers them all and the
+            # rows go out in a single executemany with one commit
+            columns = list(test_cases[0]['data']) + ['id']
+            placeholders = ', '.join(['%s'] * len(columns))
+            column_names = ', '.join(columns)
+            rows = [[case['data'][c] for c in columns[:-1]] + [case['id']] for case in test_cases]
+            
+            cur.executemany(
+                f"INSERT INTO comprehensive_test ({column_names}) VALUES ({placeholders})",
+                rows
+            )
+            conn.commit()
             for case in test_cases:
                 print(f"\n📝 Testing: {case['name']}")
-                
-                # Build dynamic INSERT query
-                columns = list(case['data'].keys()) + ['id']
-                values = list(case['data'].values()) + [case['id']]
-                
-                placeholders = ', '.join(['%s'] * len(columns))
-                column_names = ', '.join(columns)
-                
-                cur.execute(
-                    f"INSERT INTO comprehensive_test ({column_names}) VALUES ({placeholders})",
-                    values,
-                    binary=True  # Use binary format
-                )
-                conn.commit()
                 print(f"  ✅ Inserted {len(case['data'])} fields using binary protocol")
             
             # Query all data back using binary format
@@ -4,31 +4,28 @@
 import psycopg
 import os
 import subprocess
-import time
-import tempfile
 import sys
+from pgsqlite_server import abort_startup, free_port, wait_for_pgsqlite
 
 def main():
-    # Create test database
-    db_path = tempfile.mktemp(suffix='.db')
-    
     # Start pgsqlite with debug logging
     env = os.environ.copy()
     env['RUST_LOG'] = 'pgsqlite::query::extended=debug,pgsqlite::catalog=debug'
     
+    port = free_port()
     pgsqlite_proc = subprocess.Popen([
         '/home/eran/work/pgsqlite/target/release/pgsqlite',
-        '--database', db_path,
-        '--port', '15502',
+        '--port', str(port),
         '--in-memory'
     ], env=env)
     
-    time.sleep(1)
+    if not wait_for_pgsqlite(pgsqlite_proc, port):
+        abort_startup(pgsqlite_proc)
     
     try:
         # Connect with text mode
         with psycopg.connect(
-            "postgresql://postgres@localhost:15502/main",
+            f"postgresql://postgres@localhost:{port}/main",
             autocommit=True,
             options="-c default_int_size=4",
             cursor_factory=psycopg.cursor.Cursor  # Force text mode
@@ -67,8 +64,6 @@ def main():
     finally:
         pgsqlite_proc.terminate()
         pgsqlite_proc.wait()
-        if os.path.exists(db_path):
-            os.unlink(db_path)
     
     return 0
 
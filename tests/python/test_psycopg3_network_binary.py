@@ -22,7 +22,6 @@ def test_network_binary():
                     mac8_val MACADDR8
                 )
             """)
-            conn.commit()
             
             # Test data
             test_data = [
@@ -33,17 +32,15 @@ def test_network_binary():
                 (5, "fe80::/10", "::1", "12:34:56:78:9a:bc", "12:34:56:78:9a:bc:de:f0"),
             ]
             
-            # Insert with binary format
-            for test_id, cidr, inet, mac, mac8 in test_data:
-                cur.execute(
-                    """
-                    INSERT INTO network_test (id, cidr_val, inet_val, mac_val, mac8_val)
-                    VALUES (%s, %s, %s, %s, %s)
-                    """,
-                    (test_id, cidr, inet, mac, mac8),
-                    binary=True  # Use binary format
-                )
-            conn.commit()
+            # Insert all rows in one batched call; binary=True only selects the result
+            # format, which an INSERT without RETURNING doesn't have
+            cur.executemany(
+                """
+                INSERT INTO network_test (id, cidr_val, inet_val, mac_val, mac8_val)
+                VALUES (%s, %s, %s, %s, %s)
+                """,
+                test_data
+            )
             
             # Query with binary results
             cur.execute("SELECT * FROM network_test ORDER BY id", binary=True)
@@ -76,6 +73,7 @@ def test_network_binary():
                 (6, None),
                 binary=True
             )
+            # One commit covers the table, the fixture rows and the NULL row
             conn.commit()
             
             cur.execute("SELECT cidr_val FROM network_test WHERE id = %s", [6], binary=True)
@@ -33,16 +33,15 @@ def test_range_binary():
                 (5, "(,100]", "[0,)", "(,)")  # Infinite bounds
             ]
             
-            # Insert with binary format
-            for test_id, int4_val, int8_val, num_val in test_ranges:
-                cur.execute(
-                    """
-                    INSERT INTO range_test (id, int4_range, int8_range, num_range)
-                    VALUES (%s, %s, %s, %s)
-                    """,
-                    (test_id, int4_val, int8_val, num_val),
-                    binary=True  # Use binary format
-                )
+            # Insert all rows in one batched call; binary=True only selects the result
+            # format, which an INSERT without RETURNING doesn't have
+            cur.executemany(
+                """
+                INSERT INTO range_test (id, int4_range, int8_range, num_range)
+                VALUES (%s, %s, %s, %s)
+                """,
+                test_ranges
+            )
             conn.commit()
             
             # Query with binary results
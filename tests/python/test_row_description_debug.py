@@ -4,9 +4,9 @@
 import os
 import tempfile
 import subprocess
-import time
 import socket
 import struct
+from pgsqlite_server import abort_startup, free_port, wait_for_pgsqlite
 
 def read_message(sock):
     """Read a PostgreSQL wire protocol message"""
@@ -43,7 +43,7 @@ def main():
     db_file.close()
     db_path = db_file.name
     
-    port = 15445
+    port = free_port()
     print(f"Starting pgsqlite on port {port}")
     env = os.environ.copy()
     env['RUST_LOG'] = 'info'
@@ -53,7 +53,8 @@ def main():
         '--port', str(port)
     ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
     
-    time.sleep(1)
+    if not wait_for_pgsqlite(pgsqlite_proc, port):
+        abort_startup(pgsqlite_proc, db_path)
     
     try:
         # Connect using raw socket
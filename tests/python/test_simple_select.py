@@ -4,13 +4,14 @@ import sqlite3
 conn = sqlite3.connect('test_debug.db')
 cursor = conn.cursor()
 
-# Check if data exists
+# Check if data exists, streaming rows instead of materializing the table
 cursor.execute("SELECT * FROM users")
-rows = cursor.fetchall()
-
-print(f"Total rows in users table: {len(rows)}")
-for row in rows:
+row_count = 0
+for row in cursor:
     print(f"Row: {row}")
+    row_count += 1
+
+print(f"Total rows in users table: {row_count}")
 
 # Now test the exact query the ultra-fast path should execute
 cursor.execute("SELECT id, name, created_at FROM users WHERE id = ?", (1,))
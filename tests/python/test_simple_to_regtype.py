@@ -2,34 +2,31 @@
 import subprocess
 import os
 import sys
-import time
-import tempfile
+from pgsqlite_server import abort_startup, free_port, wait_for_pgsqlite
 
 def test_to_regtype():
     """Test direct to_regtype() function"""
     
-    # Create a temporary database
-    db_path = tempfile.mktemp(suffix='.db')
-    
     # Start pgsqlite with debug logging
+    port = free_port()
     pgsqlite_proc = subprocess.Popen([
         '/home/eran/work/pgsqlite/target/release/pgsqlite',
-        '--database', db_path,
-        '--port', '15501',
+        '--port', str(port),
         '--in-memory'
     ], env={
         **os.environ,
         'RUST_LOG': 'pgsqlite::catalog=debug'
     })
     
-    time.sleep(1)  # Give server time to start
+    if not wait_for_pgsqlite(pgsqlite_proc, port):
+        abort_startup(pgsqlite_proc)
     
     try:
         # Test direct simple query
         result = subprocess.run([
             'psql',
             '-h', 'localhost',
-            '-p', '15501',
+            '-p', str(port),
             '-U', 'postgres',
             '-d', 'main',
             '-t',
@@ -53,8 +50,6 @@ def test_to_regtype():
     finally:
         pgsqlite_proc.terminate()
         pgsqlite_proc.wait()
-        if os.path.exists(db_path):
-            os.unlink(db_path)
 
 if __name__ == '__main__':
     test_to_regtype()
\ No newline at end of file
@@ -3,12 +3,12 @@
 
 import psycopg
 import subprocess
-import time
 import tempfile
 import os
 from sqlalchemy import create_engine, Column, Integer, String, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from pgsqlite_server import abort_startup, free_port, remove_database, wait_for_pgsqlite
 
 Base = declarative_base()
 
@@ -26,19 +26,21 @@ def main():
     env = os.environ.copy()
     env['RUST_LOG'] = 'pgsqlite=info'
     
+    port = free_port()
     pgsqlite_proc = subprocess.Popen([
         '/home/eran/work/pgsqlite/target/release/pgsqlite',
         '--database', db_path,
-        '--port', '15512',
+        '--port', str(port),
     ], env=env)
     
-    time.sleep(2)
+    if not wait_for_pgsqlite(pgsqlite_proc, port):
+        abort_startup(pgsqlite_proc, db_path)
     
     try:
         # Test direct psycopg3 connection first
         print("🔗 Testing direct psycopg3 connection...")
         with psycopg.connect(
-            "postgresql://postgres@localhost:15512/main",
+            f"postgresql://postgres@localhost:{port}/main",
             autocommit=True
         ) as conn:
             with conn.cursor() as cur:
@@ -68,7 +70,7 @@ def main():
         # Test SQLAlchemy engine creation
         print("\n🏗️ Testing SQLAlchemy operations...")
         engine = create_engine(
-            'postgresql+psycopg://postgres@localhost:15512/main',
+            f'postgresql+psycopg://postgres@localhost:{port}/main',
             echo=False
         )
         
@@ -124,8 +126,7 @@ def main():
     finally:
         pgsqlite_proc.terminate()
         pgsqlite_proc.wait()
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        remove_database(db_path)
 
 if __name__ == "__main__":
     exit(main())
\ No newline at end of file
@@ -4,9 +4,9 @@
 from sqlalchemy import create_engine, Column, Integer, String, text
 from sqlalchemy.orm import declarative_base, sessionmaker
 import subprocess
-import time
 import tempfile
 import os
+from pgsqlite_server import abort_startup, free_port, remove_database, wait_for_pgsqlite
 
 Base = declarative_base()
 
@@ -25,19 +25,21 @@ def main():
     env = os.environ.copy()
     env['RUST_LOG'] = 'pgsqlite=debug'
     
+    port = free_port()
     pgsqlite_proc = subprocess.Popen([
         '/home/eran/work/pgsqlite/target/release/pgsqlite',
         '--database', db_path,
-        '--port', '15513',
+        '--port', str(port),
     ], env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
     
-    time.sleep(2)
+    if not wait_for_pgsqlite(pgsqlite_proc, port):
+        abort_startup(pgsqlite_proc, db_path)
     
     try:
         # Create SQLAlchemy engine
         engine = create_engine(
-            'postgresql+psycopg://postgres@localhost:15513/main',
-            echo=True  # Show SQL queries
+            f'postgresql+psycopg://postgres@localhost:{port}/main',
+            echo=bool(os.getenv("SQL_ECHO"))  # Set SQL_ECHO=1 to show SQL queries
         )
         
         print("🔧 Step 1: Testing basic connection...")
@@ -113,8 +115,7 @@ def main():
             pass
             
         pgsqlite_proc.wait()
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        remove_database(db_path)
 
 if __name__ == "__main__":
     exit(main())
\ No newline at end of file
@@ -12,6 +12,7 @@ Tests cover:
 """
 
 import argparse
+import os
 import sys
 import time
 import traceback
@@ -42,7 +43,6 @@ from sqlalchemy import (
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.pool import StaticPool
 
 # Base class for ORM models
 Base = declarative_base()
@@ -171,7 +171,8 @@ class SQLAlchemyTestSuite:
             
             # Configure engine options based on driver
             engine_kwargs = {
-                "echo": True,  # Set to True for SQL debugging
+                # SQL logging formats every statement and its parameters; opt in with SQL_ECHO=1
+                "echo": bool(os.getenv("SQL_ECHO")),
                 # Use proper connection pooling to test connection-per-session isolation
                 "pool_size": 5,  # Allow multiple connections
                 "max_overflow": 10,  # Allow connection overflow
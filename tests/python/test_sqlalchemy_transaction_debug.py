@@ -4,16 +4,16 @@
 import os
 import tempfile
 import subprocess
-import time
 from decimal import Decimal
 from datetime import date, time as dt_time
+from pgsqlite_server import abort_startup, free_port, wait_for_pgsqlite
 
 # Start pgsqlite
 db_file = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
 db_file.close()
 db_path = db_file.name
 
-port = 15448
+port = free_port()
 print(f"Starting pgsqlite on port {port}")
 env = os.environ.copy()
 env['RUST_LOG'] = 'pgsqlite::query::extended=info'
@@ -23,7 +23,8 @@ pgsqlite_proc = subprocess.Popen([
     '--port', str(port)
 ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
 
-time.sleep(1)
+if not wait_for_pgsqlite(pgsqlite_proc, port):
+    abort_startup(pgsqlite_proc, db_path)
 
 try:
     from sqlalchemy import create_engine, Column, Integer, String, DateTime, DECIMAL, Date, Time, Text, ForeignKey
@@ -54,7 +55,7 @@ try:
         customer = relationship('User', back_populates='orders')
     
     print("Creating tables...")
-    Base.metadata.drop_all(engine)
+    # The server was started on a fresh temp file, so there is nothing to drop
     Base.metadata.create_all(engine)
     
     Session = sessionmaker(bind=engine)
@@ -4,31 +4,28 @@
 import psycopg
 import os
 import subprocess
-import time
-import tempfile
 import sys
+from pgsqlite_server import abort_startup, free_port, wait_for_pgsqlite
 
 def main():
-    # Create test database
-    db_path = tempfile.mktemp(suffix='.db')
-    
     # Start pgsqlite with debug logging
     env = os.environ.copy()
     env['RUST_LOG'] = 'pgsqlite::catalog=debug'
     
+    port = free_port()
     pgsqlite_proc = subprocess.Popen([
         '/home/eran/work/pgsqlite/target/release/pgsqlite',
-        '--database', db_path,
-        '--port', '15505',
+        '--port', str(port),
         '--in-memory'
     ], env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
     
-    time.sleep(1)
+    if not wait_for_pgsqlite(pgsqlite_proc, port):
+        abort_startup(pgsqlite_proc)
     
     try:
         # Connect
         with psycopg.connect(
-            "postgresql://postgres@localhost:15505/main",
+            f"postgresql://postgres@localhost:{port}/main",
             autocommit=True,
             cursor_factory=psycopg.cursor.Cursor  # Force text mode
         ) as conn:
@@ -65,8 +62,6 @@ def main():
             for line in lines[-50:]:
                 print(line)
         pgsqlite_proc.wait()
-        if os.path.exists(db_path):
-            os.unlink(db_path)
     
     return 0
 
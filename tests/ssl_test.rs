@@ -29,6 +29,7 @@ mod tests {
             row_desc_cache_ttl: 10,
             param_cache_size: 500,
             param_cache_ttl: 30,
+            parse_cache_size: 256,
             query_cache_size: 1000,
             query_cache_ttl: 600,
             execution_cache_ttl: 300,
@@ -103,6 +104,7 @@ mod tests {
             row_desc_cache_ttl: 10,
             param_cache_size: 500,
             param_cache_ttl: 30,
+            parse_cache_size: 256,
             query_cache_size: 1000,
             query_cache_ttl: 600,
             execution_cache_ttl: 300,
@@ -184,6 +186,7 @@ mod tests {
             row_desc_cache_ttl: 10,
             param_cache_size: 500,
             param_cache_ttl: 30,
+            parse_cache_size: 256,
             query_cache_size: 1000,
             query_cache_ttl: 600,
             execution_cache_ttl: 300,